@@ -12,6 +12,7 @@ BACKEND_DIR = os.path.dirname(CURRENT_DIR)
 LOCAL_STORAGE_DIR = os.path.join(
     BACKEND_DIR, os.getenv("LOCAL_STORAGE_FOLDER_NAME", "local_storage")
 )
+CACHE_DIR = os.path.join(BACKEND_DIR, "cache")
 
 
 def get_static_folder() -> str:
@@ -44,6 +45,11 @@ def get_local_storage_folder_path() -> str:
     return LOCAL_STORAGE_DIR
 
 
+def get_cache_folder_path() -> str:
+    """Folder of the on-disk caches. Unlike the local storage, it is not served."""
+    return os.getenv("CACHE_FOLDER_PATH", CACHE_DIR)
+
+
 def get_flask_secret_key() -> Optional[str]:
     return os.getenv("FLASK_SECRET_KEY")
 
@@ -68,9 +74,152 @@ def get_browser_tab_pool_size() -> int:
     return int(os.getenv("BROWSER_TAB_POOL_SIZE", "3"))
 
 
+def get_browser_tab_pool_min_size() -> int:
+    """Tabs the async browser keeps open when idle, it grows up to the pool size."""
+    return int(os.getenv("BROWSER_TAB_POOL_MIN_SIZE", "1"))
+
+
+def get_browser_tab_idle_timeout() -> float:
+    """Seconds after which an idle tab above the min size is closed."""
+    return float(os.getenv("BROWSER_TAB_IDLE_TIMEOUT", "60"))
+
+
+def is_browser_fast_scrape_mode_enabled() -> bool:
+    """Default of the browser tasks without a fast_mode: block images, media and fonts."""
+    return os.getenv("BROWSER_FAST_SCRAPE_MODE", "false") == "true"
+
+
 def is_set_app_config_on_ui_enabled() -> bool:
     return os.getenv("ENABLE_SET_APP_CONFIG_ON_UI", "true") == "true"
 
 
+def get_node_output_cache_backend() -> Optional[str]:
+    """Backend of the node output cache, 'memory' or 'disk'. The cache is disabled if not set."""
+    return os.getenv("NODE_OUTPUT_CACHE")
+
+
+def get_node_output_cache_max_size() -> int:
+    return int(os.getenv("NODE_OUTPUT_CACHE_MAX_SIZE", "512"))
+
+
+def get_node_output_cache_ttl() -> int:
+    return int(os.getenv("NODE_OUTPUT_CACHE_TTL", "3600"))
+
+
+def get_flow_run_store_max_sessions() -> int:
+    return int(os.getenv("FLOW_RUN_STORE_MAX_SESSIONS", "1000"))
+
+
+def get_flow_run_store_ttl() -> int:
+    return int(os.getenv("FLOW_RUN_STORE_TTL", "3600"))
+
+
+def get_flow_run_store_max_session_size() -> int:
+    """Max size of the outputs recorded for the incremental runs of a session, in bytes."""
+    return int(os.getenv("FLOW_RUN_STORE_MAX_SESSION_SIZE_MB", "16")) * 1024 * 1024
+
+
+def get_processor_manifest_path() -> Optional[str]:
+    """Manifest of the processor classes, the one of the factory package if not set."""
+    return os.getenv("PROCESSOR_MANIFEST_PATH")
+
+
+def is_lazy_processor_loading_enabled() -> bool:
+    """Import the processor modules on their first use instead of at registration."""
+    return os.getenv("LAZY_PROCESSOR_LOADING", "true") == "true"
+
+
+def get_provider_client_max_idle_time() -> float:
+    """Seconds after which an unused provider client is dropped."""
+    return float(os.getenv("PROVIDER_CLIENT_MAX_IDLE_TIME", "300"))
+
+
+def get_provider_client_max_clients() -> int:
+    return int(os.getenv("PROVIDER_CLIENT_MAX_CLIENTS", "256"))
+
+
+def get_provider_client_max_connections() -> int:
+    """Size of the connection pool of each provider client."""
+    return int(os.getenv("PROVIDER_CLIENT_MAX_CONNECTIONS", "20"))
+
+
+def get_http_connect_timeout() -> float:
+    """Default connect timeout of the shared HTTP session, in seconds."""
+    return float(os.getenv("HTTP_CONNECT_TIMEOUT", "10"))
+
+
+def get_http_read_timeout() -> float:
+    """Default read timeout of the shared HTTP session, in seconds."""
+    return float(os.getenv("HTTP_READ_TIMEOUT", "120"))
+
+
+def get_http_max_retries() -> int:
+    return int(os.getenv("HTTP_MAX_RETRIES", "2"))
+
+
+def get_http_pool_connections() -> int:
+    """Number of hosts the shared HTTP session keeps a connection pool for."""
+    return int(os.getenv("HTTP_POOL_CONNECTIONS", "32"))
+
+
+def get_http_pool_maxsize() -> int:
+    """Connections kept alive per host by the shared HTTP session."""
+    return int(os.getenv("HTTP_POOL_MAXSIZE", "16"))
+
+
+def get_extensions_whitelist() -> List[str]:
+    raw_whitelist = os.getenv("EXTENSIONS_WHITELIST", "").strip()
+    return raw_whitelist.split(",") if raw_whitelist else []
+
+
+def get_extensions_blacklist() -> List[str]:
+    raw_blacklist = os.getenv("EXTENSIONS_BLACKLIST", "").strip()
+    return raw_blacklist.split(",") if raw_blacklist else []
+
+
 def is_s3_enabled() -> bool:
     return os.getenv("S3_AWS_ACCESS_KEY_ID") is not None
+
+
+def get_s3_upload_part_size() -> int:
+    """Size of the parts of the S3 multipart uploads, in bytes. S3 requires 5 MB at least."""
+    part_size_mb = int(os.getenv("S3_UPLOAD_PART_SIZE_MB", "8"))
+    return max(part_size_mb, 5) * 1024 * 1024
+
+
+def get_storage_upload_concurrency() -> int:
+    """Number of outputs of a node uploaded to the storage at the same time."""
+    return int(os.getenv("STORAGE_UPLOAD_CONCURRENCY", "4"))
+
+
+def get_fetch_max_concurrency_per_host() -> int:
+    """URL fetches of the processors running at the same time against a host."""
+    return int(os.getenv("FETCH_MAX_CONCURRENCY_PER_HOST", "4"))
+
+
+def get_fetch_cache_ttl() -> float:
+    """Seconds during which a fetched URL is served again for the same options."""
+    return float(os.getenv("FETCH_CACHE_TTL", "30"))
+
+
+def get_fetch_cache_max_entries() -> int:
+    return int(os.getenv("FETCH_CACHE_MAX_ENTRIES", "256"))
+
+
+def get_fetch_coalesce_timeout() -> float:
+    """Seconds a fetch waits for the identical one in flight before running its own."""
+    return float(os.getenv("FETCH_COALESCE_TIMEOUT", "30"))
+
+
+def is_http_cache_enabled() -> bool:
+    return os.getenv("HTTP_CACHE_ENABLED", "true") == "true"
+
+
+def get_http_cache_max_size() -> int:
+    """Size of the on-disk HTTP cache of the URL fetches, in bytes."""
+    return int(os.getenv("HTTP_CACHE_MAX_SIZE_MB", "256")) * 1024 * 1024
+
+
+def get_http_cache_max_entry_size() -> int:
+    """Largest response body kept by the HTTP cache, in bytes."""
+    return int(os.getenv("HTTP_CACHE_MAX_ENTRY_SIZE_MB", "8")) * 1024 * 1024
@@ -1,8 +1,10 @@
 import json
 
-from flask import Blueprint, request
+from flask import Blueprint, Response, request
 
-from ...utils.node_extension_utils import get_dynamic_extension_config, get_extensions
+from ...root_injector import get_root_injector
+from ...utils.extension_catalogue import ExtensionCatalogueStore
+from ...utils.node_extension_utils import get_dynamic_extension_config
 
 # from ...utils.openapi_reader import OpenAPIReader
 from ...utils.replicate_utils import (
@@ -18,8 +20,20 @@ node_blueprint = Blueprint("node_blueprint", __name__)
 
 @node_blueprint.route("/node/extensions")
 def get_node_extensions():
-    extensions = get_extensions()
-    return {"extensions": extensions}
+    catalogue = get_root_injector().get(ExtensionCatalogueStore).get_catalogue()
+
+    if request.if_none_match.contains_weak(catalogue.etag):
+        response = Response(status=304)
+    else:
+        encoding = catalogue.select_encoding(request.accept_encodings)
+        response = Response(catalogue.get_body(encoding), mimetype="application/json")
+        if encoding is not None:
+            response.headers["Content-Encoding"] = encoding
+
+    response.set_etag(catalogue.etag, weak=True)
+    response.headers["Vary"] = "Accept-Encoding"
+    response.headers["Cache-Control"] = "no-cache"
+    return response
 
 
 @node_blueprint.route("/node/extensions/dynamic", methods=["POST"])
@@ -16,11 +16,14 @@ from ..root_injector import (
 )
 from .utils.constants import PARAMETERS_FIELD_NAME, ENV_API_KEYS
 
+from ..processors.cache.flow_run_store import FlowRunStore
 from ..processors.launcher.processor_launcher import ProcessorLauncher
+from ..processors.launcher.run_registry import RunRegistry
 from ..processors.context.processor_context_flask_request import (
     ProcessorContextFlaskRequest,
 )
 import traceback
+import time
 import os
 
 
@@ -54,6 +57,17 @@ def populate_request_global_object(data):
                 raise Exception(f"No {key} provided in data.")
 
 
+def get_flow_deadline(data):
+    """
+    Converts the optional "deadline" of the payload, the number of seconds the whole flow may take,
+    to a timestamp.
+    """
+    deadline = data.get("deadline")
+    if not deadline:
+        return None
+    return time.time() + float(deadline)
+
+
 @socketio.on("connect")
 def handle_connect():
     logging.info("Client connected")
@@ -65,9 +79,13 @@ def handle_process_file(data):
     This event handler is activated when a "process_file" event is received via Socket.IO. It allows to run every node in
     the file, even if they have been executed before.
 
+    When "incremental" is set in the payload, the nodes whose config and inputs are unchanged since the
+    previous run of the session reuse their previous output, so only the edited nodes and the nodes
+    downstream are executed again.
+
     Parameters:
         data (dict): A dictionary encompassing the event's payload, which comprises the JSON configuration file
-                    ("jsonFile").
+                    ("jsonFile"), the optional "incremental" flag and the optional "deadline" in seconds.
 
     """
     try:
@@ -75,10 +93,13 @@ def handle_process_file(data):
         flow_data = json.loads(data.get("jsonFile"))
         launcher = get_root_injector().get(ProcessorLauncher)
         launcher.set_context(ProcessorContextFlaskRequest(g, session, request.sid))
+        launcher.set_deadline(get_flow_deadline(data))
 
         if flow_data:
             processors = launcher.load_processors(flow_data)
-            output = launcher.launch_processors(processors)
+            output = launcher.launch_processors(
+                processors, incremental=bool(data.get("incremental", False))
+            )
 
             logging.debug("Emitting processing_result event with output: %s", output)
             emit("run_end", {"output": output})
@@ -100,7 +121,7 @@ def handle_run_node(data):
 
     Parameters:
         data (dict): A dictionary encompassing the event's payload, which comprises the JSON configuration file
-                    ("jsonFile") and the name of the node to run ("nodeName").
+                    ("jsonFile"), the name of the node to run ("nodeName") and the optional "deadline" in seconds.
 
     """
     try:
@@ -110,6 +131,7 @@ def handle_run_node(data):
 
         launcher = get_root_injector().get(ProcessorLauncher)
         launcher.set_context(ProcessorContextFlaskRequest(g, session, request.sid))
+        launcher.set_deadline(get_flow_deadline(data))
 
         if flow_data and node_name:
             processors = launcher.load_processors_for_node(flow_data, node_name)
@@ -131,6 +153,18 @@ def handle_run_node(data):
 @socketio.on("disconnect")
 def handle_disconnect():
     logging.info("Client disconnected")
+    get_root_injector().get(RunRegistry).cancel_session(request.sid)
+    get_root_injector().get(FlowRunStore).clear_session(request.sid)
+
+
+@socketio.on("cancel_run")
+def handle_cancel_run(data=None):
+    """
+    This event handler is activated when a "cancel_run" event is received via Socket.IO. It cancels every flow
+    currently running for the session, the same way a node error does.
+    """
+    cancelled_count = get_root_injector().get(RunRegistry).cancel_session(request.sid)
+    logging.info(f"Cancel run requested, {cancelled_count} run(s) cancelled")
 
 
 @socketio.on("update_app_config")
@@ -0,0 +1,84 @@
+import json
+import logging
+import os
+import tempfile
+import time
+from typing import Any, Optional
+
+from injector import singleton
+
+from ...env_config import get_cache_folder_path, get_node_output_cache_ttl
+from .node_output_cache import NodeOutputCache
+
+
+@singleton
+class DiskNodeOutputCache(NodeOutputCache):
+    """On-disk node output cache, stored under the cache folder. Entries expire
+    after NODE_OUTPUT_CACHE_TTL seconds, and expired entries are swept periodically."""
+
+    CACHE_FOLDER_NAME = "node_output_cache"
+    SWEEP_INTERVAL = 600
+
+    def __init__(self, cache_dir: str = None, ttl: int = None):
+        if cache_dir is None:
+            cache_dir = os.path.join(get_cache_folder_path(), self.CACHE_FOLDER_NAME)
+        self.cache_dir = cache_dir
+        self.ttl = get_node_output_cache_ttl() if ttl is None else ttl
+        self._last_sweep = 0
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    def _get_entry_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def get(self, key: str) -> Optional[Any]:
+        path = self._get_entry_path(key)
+        try:
+            with open(path, "r") as file:
+                entry = json.load(file)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logging.warning(f"Unreadable node output cache entry {key}: {e}")
+            self._remove(path)
+            return None
+
+        if entry.get("expires_at", 0) < time.time():
+            self._remove(path)
+            return None
+        return entry.get("output")
+
+    def set(self, key: str, output: Any) -> None:
+        entry = {"expires_at": time.time() + self.ttl, "output": output}
+
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as file:
+                json.dump(entry, file)
+            os.replace(tmp_path, self._get_entry_path(key))
+        except Exception:
+            self._remove(tmp_path)
+            raise
+
+        if time.time() - self._last_sweep > self.SWEEP_INTERVAL:
+            self.evict_expired()
+
+    def evict_expired(self) -> None:
+        self._last_sweep = time.time()
+        for filename in os.listdir(self.cache_dir):
+            if not filename.endswith(".json"):
+                continue
+            path = os.path.join(self.cache_dir, filename)
+            try:
+                with open(path, "r") as file:
+                    expires_at = json.load(file).get("expires_at", 0)
+            except (OSError, ValueError):
+                expires_at = 0
+            if expires_at < self._last_sweep:
+                self._remove(path)
+
+    @staticmethod
+    def _remove(path: str) -> None:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
@@ -0,0 +1,104 @@
+import json
+import logging
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional, Tuple
+
+from cachetools import TTLCache
+from injector import singleton
+
+from ...env_config import (
+    get_flow_run_store_max_session_size,
+    get_flow_run_store_max_sessions,
+    get_flow_run_store_ttl,
+)
+
+
+def get_output_size(output: Any) -> int:
+    """Approximate size of an output, the one of its JSON form."""
+    return len(json.dumps(output, default=str))
+
+
+@dataclass
+class SessionOutputs:
+    outputs: Dict[str, Tuple[str, Any, int]] = field(default_factory=dict)
+    size: int = 0
+
+
+@singleton
+class FlowRunStore:
+    """
+    Outputs of the last run of every node, per session.
+
+    Each output is stored with the fingerprint of the node when it ran (its config and
+    its resolved inputs). An incremental run reuses the output of a node whose fingerprint
+    did not change, so only the edited nodes and the nodes downstream are executed again.
+
+    Only the sessions which requested an incremental run are recorded, up to
+    FLOW_RUN_STORE_MAX_SESSION_SIZE_MB of outputs each.
+    """
+
+    def __init__(
+        self, max_sessions: int = None, ttl: int = None, max_session_size: int = None
+    ):
+        if max_sessions is None:
+            max_sessions = get_flow_run_store_max_sessions()
+        if ttl is None:
+            ttl = get_flow_run_store_ttl()
+        self.max_session_size = (
+            get_flow_run_store_max_session_size()
+            if max_session_size is None
+            else max_session_size
+        )
+        self._sessions: Dict[str, SessionOutputs] = TTLCache(
+            maxsize=max_sessions, ttl=ttl
+        )
+        self._lock = threading.Lock()
+
+    def enable_session(self, session_id) -> None:
+        """Starts recording the outputs of the session, for its incremental runs."""
+        with self._lock:
+            if session_id not in self._sessions:
+                self._sessions[session_id] = SessionOutputs()
+
+    def is_session_enabled(self, session_id) -> bool:
+        with self._lock:
+            return session_id in self._sessions
+
+    def get_output(self, session_id, node_name: str, fingerprint: str) -> Optional[Any]:
+        with self._lock:
+            session_outputs = self._sessions.get(session_id)
+        if session_outputs is None:
+            return None
+
+        stored_fingerprint, output, _ = session_outputs.outputs.get(
+            node_name, (None, None, 0)
+        )
+        if stored_fingerprint != fingerprint:
+            return None
+        return output
+
+    def set_output(self, session_id, node_name: str, fingerprint: str, output: Any):
+        """Records the output of a node, if the session is enabled and has room for it."""
+        size = get_output_size(output)
+        with self._lock:
+            session_outputs = self._sessions.get(session_id)
+            if session_outputs is None:
+                return
+            _, _, previous_size = session_outputs.outputs.pop(
+                node_name, (None, None, 0)
+            )
+            session_outputs.size -= previous_size
+            if session_outputs.size + size <= self.max_session_size:
+                session_outputs.outputs[node_name] = (fingerprint, output, size)
+                session_outputs.size += size
+            else:
+                logging.debug(
+                    f"Output of {node_name} not recorded, the session outputs are full"
+                )
+            # Re-assign to refresh the session expiration
+            self._sessions[session_id] = session_outputs
+
+    def clear_session(self, session_id) -> None:
+        with self._lock:
+            self._sessions.pop(session_id, None)
@@ -0,0 +1,31 @@
+import threading
+from typing import Any, Optional
+
+from cachetools import TTLCache
+from injector import singleton
+
+from ...env_config import get_node_output_cache_max_size, get_node_output_cache_ttl
+from .node_output_cache import NodeOutputCache
+
+
+@singleton
+class InMemoryNodeOutputCache(NodeOutputCache):
+    """In-memory node output cache. Keeps the most recently used outputs, up to
+    NODE_OUTPUT_CACHE_MAX_SIZE entries, for NODE_OUTPUT_CACHE_TTL seconds like the disk
+    cache."""
+
+    def __init__(self, max_size: int = None, ttl: int = None):
+        if max_size is None:
+            max_size = get_node_output_cache_max_size()
+        if ttl is None:
+            ttl = get_node_output_cache_ttl()
+        self._cache = TTLCache(maxsize=max_size, ttl=ttl)
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            return self._cache.get(key)
+
+    def set(self, key: str, output: Any) -> None:
+        with self._lock:
+            self._cache[key] = output
@@ -0,0 +1,38 @@
+from abc import ABC, abstractmethod
+from enum import Enum
+import hashlib
+import json
+from typing import Any, Optional
+
+from ..components.processor import Processor
+
+
+class CacheStatus(Enum):
+    HIT = "hit"
+    MISS = "miss"
+
+
+class NodeOutputCache(ABC):
+    """Node output cache interface. Outputs of cacheable processors are stored under a key
+    computed from the processor type, its configuration and its resolved inputs, so they
+    can be reused by any later run of an identical node by the same user."""
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[Any]:
+        pass
+
+    @abstractmethod
+    def set(self, key: str, output: Any) -> None:
+        pass
+
+
+def compute_cache_key(processor: Processor) -> str:
+    cache_key_data = processor.get_cache_key_data()
+    serialized_data = json.dumps(cache_key_data, sort_keys=True, default=str)
+    return hashlib.sha256(serialized_data.encode("utf-8")).hexdigest()
+
+
+def scope_cache_key(key: str, user_id: Any) -> str:
+    """The key of an output for a user, so that outputs are never shared between users."""
+    serialized_data = json.dumps([str(user_id), key])
+    return hashlib.sha256(serialized_data.encode("utf-8")).hexdigest()
@@ -4,7 +4,7 @@ from ..processor import ContextAwareProcessor
 
 
 from .processor_type_name_utils import ProcessorType
-from openai import OpenAI
+from ....utils.provider_client_registry import get_openai_client
 
 
 def interpret_escape_sequences(separator):
@@ -30,7 +30,7 @@ class AIDataSplitterProcessor(ContextAwareProcessor):
         self.api_key = context.get_value("openai_api_key")
 
     def get_llm_response(self, messages):
-        client = OpenAI(api_key=self.api_key)
+        client = get_openai_client(self.api_key, **self.get_timeout_options())
 
         kwargs = {"model": self.model, "input": messages}
         response = client.responses.create(**kwargs)
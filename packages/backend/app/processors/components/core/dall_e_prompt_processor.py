@@ -1,7 +1,7 @@
 from ...context.processor_context import ProcessorContext
 from ..processor import ContextAwareProcessor
 
-from openai import OpenAI
+from ....utils.provider_client_registry import get_openai_client
 
 from .processor_type_name_utils import ProcessorType
 
@@ -28,9 +28,7 @@ class DallEPromptProcessor(ContextAwareProcessor):
             )
 
         api_key = self._processor_context.get_value("openai_api_key")
-        client = OpenAI(
-            api_key=api_key,
-        )
+        client = get_openai_client(api_key, **self.get_timeout_options())
 
         response = client.images.generate(
             model=DallEPromptProcessor.DEFAULT_MODEL,
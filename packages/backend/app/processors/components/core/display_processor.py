@@ -1,14 +1,25 @@
 from .processor_type_name_utils import ProcessorType
 from ..processor import BasicProcessor
+from ...launcher.event_type import EventType
+from ...launcher.processor_event import ProcessorEvent
 
 
 class DisplayProcessor(BasicProcessor):
     processor_type = "display"
+    accepts_input_stream = True
 
     def __init__(self, config):
         super().__init__(config)
 
     def process(self):
+        input_stream = self.get_input_stream()
+        if input_stream is not None:
+            text = ""
+            for delta in input_stream:
+                text += delta
+                self.notify(EventType.STREAMING, ProcessorEvent(self, text))
+            return text
+
         input_data = None
         if self.get_input_processor() is None:
             return ""
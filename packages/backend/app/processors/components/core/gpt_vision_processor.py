@@ -6,7 +6,7 @@ from ...launcher.processor_event import ProcessorEvent
 from ...context.processor_context import ProcessorContext
 from ..processor import ContextAwareProcessor
 from .processor_type_name_utils import ProcessorType
-from openai import OpenAI
+from ....utils.provider_client_registry import get_openai_client
 from urllib.parse import urlparse
 
 
@@ -56,9 +56,7 @@ class GPTVisionProcessor(ContextAwareProcessor):
                 raise ValueError(f"Invalid URL provided. \n {url}")
 
         api_key = self._processor_context.get_value("openai_api_key")
-        client = OpenAI(
-            api_key=api_key,
-        )
+        client = get_openai_client(api_key, **self.get_timeout_options())
         content = []
 
         for image in images_urls:
@@ -87,6 +85,7 @@ class GPTVisionProcessor(ContextAwareProcessor):
             max_tokens=4096,
             stream=True,
         )
+        self.set_cancellable_response(response)
 
         final_response = ""
         for chunk in response:
@@ -106,4 +105,4 @@ class GPTVisionProcessor(ContextAwareProcessor):
             return False
 
     def cancel(self):
-        pass
+        self.cancel_response()
@@ -7,7 +7,7 @@ from ...launcher.event_type import EventType
 from ....llms.utils.max_token_for_model import max_token_for_model, nb_token_for_input
 from ...context.processor_context import ProcessorContext
 from ..processor import ContextAwareProcessor
-from openai import OpenAI
+from ....utils.provider_client_registry import get_openai_client
 
 from .processor_type_name_utils import ProcessorType
 
@@ -99,7 +99,7 @@ class LLMPromptProcessor(ContextAwareProcessor):
                 )
             raise Exception(message)
 
-        client = OpenAI(api_key=api_key)
+        client = get_openai_client(api_key, **self.get_timeout_options())
 
         kwargs = {"model": self.model, "input": self.messages, "stream": self.streaming}
 
@@ -112,6 +112,7 @@ class LLMPromptProcessor(ContextAwareProcessor):
             ]
 
         stream = client.responses.create(**kwargs)
+        self.set_cancellable_response(stream)
 
         final_response = ""
 
@@ -163,4 +164,4 @@ class LLMPromptProcessor(ContextAwareProcessor):
         ]
 
     def cancel(self):
-        pass
+        self.cancel_response()
@@ -4,13 +4,19 @@ from queue import Queue
 import time
 from urllib.parse import urlparse
 
-from app.env_config import is_s3_enabled
+import eventlet
+
+from app.env_config import get_storage_upload_concurrency, is_s3_enabled
 
 
 from ...launcher.event_type import EventType
 from ...launcher.processor_event import ProcessorEvent
 
-from ....utils.processor_utils import stream_download_file_as_binary
+from ....utils.processor_utils import (
+    get_max_download_size,
+    iter_response_chunks,
+    open_download,
+)
 
 from ...exceptions import LightException
 from ....utils.replicate_utils import (
@@ -21,7 +27,7 @@ from ....utils.replicate_utils import (
 
 from ...context.processor_context import ProcessorContext
 from ..processor import ContextAwareProcessor
-import replicate
+from ....utils.provider_client_registry import get_replicate_client
 from .processor_type_name_utils import ProcessorType
 from ....tasks.task_exception import TaskAlreadyRegisteredError
 from ....tasks.thread_pool_task_manager import add_task, register_task_processor
@@ -30,6 +36,8 @@ from ....tasks.task_utils import wait_for_result
 
 class ReplicateProcessor(ContextAwareProcessor):
     processor_type = ProcessorType.REPLICATE
+    # Even with a fixed seed, the outputs are URLs which expire
+    cacheable = False
 
     def __init__(self, config, context: ProcessorContext):
         super().__init__(config, context)
@@ -65,6 +73,8 @@ class ReplicateProcessor(ContextAwareProcessor):
     def wait_for_prediction_task(task_data):
         prediction, processor = task_data
         while prediction.status not in ["succeeded", "failed", "canceled"]:
+            if processor.is_cancelled:
+                break
             time.sleep(prediction._client.poll_interval)
             if prediction.status == "processing":
                 processor.is_processing = True
@@ -107,7 +117,7 @@ class ReplicateProcessor(ContextAwareProcessor):
 
                 self.config[name] = output
 
-        api = replicate.Client(api_token=api_key)
+        api = get_replicate_client(api_key)
 
         output_schema = get_output_schema_from_open_API_schema(self.schema["schema"])
         logging.debug(f"Output schema : {output_schema}")
@@ -138,7 +148,9 @@ class ReplicateProcessor(ContextAwareProcessor):
 
         self.register_background_task()
 
-        self.prediction = self.get_prediction_result(self.prediction, self)
+        self.prediction = self.get_prediction_result(
+            self.prediction, self, timeout=self.get_remaining_time(3600.0)
+        )
 
         if self.prediction.status != "succeeded":
             replicate_error_message = self.prediction.error
@@ -178,11 +190,7 @@ class ReplicateProcessor(ContextAwareProcessor):
 
         if isUriOutput:
             if isinstance(output, list):
-                new_output = []
-                for uri in output:
-                    new_uri = self.upload_replicate_uri_to_storage(uri)
-                    new_output.append(new_uri)
-                output = new_output
+                output = self.upload_replicate_uris_to_storage(output)
             else:
                 output = self.upload_replicate_uri_to_storage(output)
 
@@ -211,12 +219,21 @@ class ReplicateProcessor(ContextAwareProcessor):
             return uri
 
         filename = f"{self.name}-{timestamp_str}.{extension}"
-        file = stream_download_file_as_binary(uri)
-
-        url = storage.save(filename, file)
+        with open_download(uri) as response:
+            url = storage.save_stream(
+                filename, iter_response_chunks(response, get_max_download_size(uri))
+            )
 
         return url
 
+    def upload_replicate_uris_to_storage(self, uris):
+        """Uploads the outputs of a prediction concurrently, keeping their order."""
+        if len(uris) <= 1:
+            return [self.upload_replicate_uri_to_storage(uri) for uri in uris]
+
+        pool = eventlet.GreenPool(min(get_storage_upload_concurrency(), len(uris)))
+        return list(pool.imap(self.upload_replicate_uri_to_storage, uris))
+
     def _get_nested_input_schema_property(self, property_name, nested_key):
         return (
             get_input_schema_from_open_API_schema(self.schema.get("schema", {}))
@@ -226,6 +243,10 @@ class ReplicateProcessor(ContextAwareProcessor):
         )
 
     def cancel(self):
+        self.is_cancelled = True
+        prediction = getattr(self, "prediction", None)
+        if prediction is None:
+            return
         api_key = self._processor_context.get_value("replicate_api_key")
-        api = replicate.Client(api_token=api_key)
-        api.predictions.cancel(id=self.prediction.id)
+        api = get_replicate_client(api_key)
+        api.predictions.cancel(id=prediction.id)
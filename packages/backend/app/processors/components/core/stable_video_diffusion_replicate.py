@@ -2,7 +2,7 @@ import os
 from urllib.parse import urlparse
 from ...context.processor_context import ProcessorContext
 from ..processor import ContextAwareProcessor
-import replicate
+from ....utils.provider_client_registry import get_replicate_client
 
 from .processor_type_name_utils import ProcessorType
 
@@ -32,7 +32,7 @@ class StableVideoDiffusionReplicaterocessor(ContextAwareProcessor):
             return "Invalid URL provided."
 
         api_key = self._processor_context.get_value("replicate_api_key")
-        api = replicate.Client(api_token=api_key)
+        api = get_replicate_client(api_key)
 
         output = api.run(
             StableVideoDiffusionReplicaterocessor.stable_video_diffusion_model,
@@ -1,8 +1,17 @@
-import random
+from urllib.parse import urlparse
+import zlib
 from bs4 import BeautifulSoup
 
 import requests
 
+from ....env_config import use_async_browser
+from ....utils.fetch_coordinator import get_fetch_coordinator
+from ....utils.http_cache import (
+    get_cache_control_headers,
+    get_cached_session,
+    is_reusable_when_stale,
+    parse_seconds,
+)
 from ....utils.processor_utils import is_valid_url
 from ..processor import BasicProcessor
 
@@ -15,6 +24,7 @@ class URLInputProcessor(BasicProcessor):
     WAIT_TIMEOUT = 60
     GET_TIMEOUT = 20
     processor_type = ProcessorType.URL_INPUT
+    cacheable = True
 
     USER_AGENTS = [
         "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/98.0.4758.102 Safari/537.36",
@@ -24,19 +34,34 @@ class URLInputProcessor(BasicProcessor):
 
     def __init__(self, config):
         super().__init__(config)
+        self.is_response_reusable = False
 
-    def get_random_user_agent():
-        return random.choice(URLInputProcessor.USER_AGENTS)
+    def get_user_agent(url):
+        """
+        User agent of a host, always the same one, so that the caches on the way (CDN,
+        HTTP cache) can match the requests.
+        """
+        host = (urlparse(url).hostname or "").encode("utf-8")
+        user_agents = URLInputProcessor.USER_AGENTS
+        return user_agents[zlib.crc32(host) % len(user_agents)]
 
     def fetch_content_simple(self):
         """
-        Fetches the website content using a simple GET request.
+        Fetches the website content using a simple GET request, through the HTTP cache.
         """
         try:
-            headers = {"User-Agent": URLInputProcessor.get_random_user_agent()}
-            response = requests.get(self.url, headers=headers, timeout=self.GET_TIMEOUT)
+            headers = {
+                "User-Agent": URLInputProcessor.get_user_agent(self.url),
+                **get_cache_control_headers(self.max_staleness),
+            }
+            response = get_cached_session().get(
+                self.url,
+                headers=headers,
+                timeout=self.get_remaining_time(self.GET_TIMEOUT),
+            )
 
             response.raise_for_status()
+            self.is_response_reusable = is_reusable_when_stale(response.headers)
             return response.text
         except requests.RequestException as e:
             logging.warning(f"Failed to fetch content using simple GET: {e}")
@@ -74,8 +99,7 @@ class URLInputProcessor(BasicProcessor):
         self.with_html_attributes = self.get_input_by_name(
             "with_html_attributes", False
         )
-
-        response = None
+        self.max_staleness = self.get_input_by_name("max_staleness", 0)
 
         task_data = {
             "url": self.url,
@@ -85,11 +109,49 @@ class URLInputProcessor(BasicProcessor):
             "with_html_attributes": self.with_html_attributes,
         }
 
-        content = self.fetch_content_simple()
-        response = self.process_content_with_beautiful_soup(content, task_data)
+        if self.loading_mode == "browser" and use_async_browser():
+            response = self.fetch_with_browser(task_data)
+            if response:
+                return response
+            self.effective_load_mode = "simple"
+
+        response = get_fetch_coordinator().fetch(
+            self.url,
+            lambda: self.fetch_and_extract_content(task_data),
+            options=task_data,
+            should_cache=lambda result: bool(result) and self.is_response_reusable,
+            is_cancelled=lambda: self.is_cancelled,
+            max_age=parse_seconds(self.max_staleness),
+        )
 
         return response
 
+    def fetch_with_browser(self, task_data):
+        """
+        Scraps the page in a tab of the shared browser, enabled with USE_ASYNC_BROWSER.
+        Returns None if the browser failed, for the page to be fetched with a GET.
+        """
+        from ....tasks.single_thread_tasks.browser.async_browser_task import (
+            run_browser_task,
+        )
+
+        try:
+            return run_browser_task(
+                task_data,
+                timeout=self.get_remaining_time(self.WAIT_TIMEOUT),
+                is_cancelled=lambda: self.is_cancelled,
+                max_age=parse_seconds(self.max_staleness),
+            )
+        except TimeoutError:
+            raise
+        except Exception as e:
+            logging.warning(f"Failed to fetch content using the browser: {e}")
+            return None
+
+    def fetch_and_extract_content(self, task_data):
+        content = self.fetch_content_simple()
+        return self.process_content_with_beautiful_soup(content, task_data)
+
     def process_content_with_beautiful_soup(self, content, task_data):
         """
         Process the HTML content using BeautifulSoup while considering the following parameters:
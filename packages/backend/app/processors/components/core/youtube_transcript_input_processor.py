@@ -17,6 +17,7 @@ from .processor_type_name_utils import ProcessorType
 
 class YoutubeTranscriptInputProcessor(BasicProcessor, RetryMixin):
     processor_type = ProcessorType.YOUTUBE_TRANSCRIPT_INPUT
+    cacheable = True
 
     def __init__(self, config):
         super().__init__(config)
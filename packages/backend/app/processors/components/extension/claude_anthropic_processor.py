@@ -1,10 +1,10 @@
 import logging
 from datetime import datetime
 
-import anthropic
 
 from ...context.processor_context import ProcessorContext
 from ..model import Field, NodeConfig, Option, Condition, ConditionGroup
+from ....utils.provider_client_registry import get_anthropic_client
 from .extension_processor import ContextAwareExtensionProcessor
 from ...launcher.processor_event import ProcessorEvent
 from ...launcher.event_type import EventType
@@ -228,7 +228,7 @@ class ClaudeAnthropicProcessor(ContextAwareExtensionProcessor):
         if api_key is None:
             raise Exception("No Anthropic API key found")
 
-        client = anthropic.Anthropic(api_key=api_key)
+        client = get_anthropic_client(api_key, **self.get_timeout_options())
 
         awnser = ""
 
@@ -256,6 +256,7 @@ class ClaudeAnthropicProcessor(ContextAwareExtensionProcessor):
             }
 
         with client.messages.stream(**stream_kwargs) as stream:
+            self.set_cancellable_response(stream)
             try:
                 current_block_type = None
                 for event in stream:
@@ -278,4 +279,4 @@ class ClaudeAnthropicProcessor(ContextAwareExtensionProcessor):
         return awnser
 
     def cancel(self):
-        pass
+        self.cancel_response()
@@ -3,7 +3,7 @@ from ...launcher.processor_event import ProcessorEvent
 from ...context.processor_context import ProcessorContext
 from ..model import Field, NodeConfig, Option
 from .extension_processor import ContextAwareExtensionProcessor
-from openai import OpenAI
+from ....utils.provider_client_registry import get_openai_client
 
 
 class DeepSeekProcessor(ContextAwareExtensionProcessor):
@@ -81,7 +81,11 @@ class DeepSeekProcessor(ContextAwareExtensionProcessor):
         if api_key is None:
             raise Exception("No DeepSeek API key found")
 
-        client = OpenAI(api_key=api_key, base_url="https://api.deepseek.com")
+        client = get_openai_client(
+            api_key,
+            base_url="https://api.deepseek.com",
+            **self.get_timeout_options(),
+        )
 
         response = client.chat.completions.create(
             model=model,
@@ -95,6 +99,7 @@ class DeepSeekProcessor(ContextAwareExtensionProcessor):
         )
 
         if self.streaming:
+            self.set_cancellable_response(response)
             final_response = ""
             for chunk in response:
                 r_content = getattr(chunk.choices[0].delta, "reasoning_content", None)
@@ -112,4 +117,4 @@ class DeepSeekProcessor(ContextAwareExtensionProcessor):
         return response.choices[0].message.content
 
     def cancel(self):
-        pass
+        self.cancel_response()
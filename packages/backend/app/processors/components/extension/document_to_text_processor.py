@@ -1,17 +1,17 @@
 import logging
 from queue import Queue
-import requests
 from ....tasks.task_exception import TaskAlreadyRegisteredError
 
 from ..node_config_builder import FieldBuilder, NodeConfigBuilder
 
 from ....tasks.thread_pool_task_manager import add_task, register_task_processor
 from ....utils.processor_utils import (
-    create_temp_file_with_bytes_content,
-    get_max_file_size_in_mb,
-    is_accepted_url_file_size,
+    copy_response_to_sink,
+    create_empty_tmp_file,
+    get_max_download_size,
     is_s3_file,
     is_valid_url,
+    open_download,
 )
 from ....tasks.task_utils import wait_for_result
 from ..model import NodeConfig
@@ -28,6 +28,7 @@ from langchain.document_loaders import (
 
 class DocumentToText(BasicExtensionProcessor):
     processor_type = "document-to-text-processor"
+    cacheable = True
     WAIT_TIMEOUT = 60
 
     def __init__(self, config):
@@ -82,7 +83,9 @@ class DocumentToText(BasicExtensionProcessor):
         document = None
 
         try:
-            document = wait_for_result(results_queue)
+            document = wait_for_result(
+                results_queue, timeout=self.get_remaining_time(120)
+            )
         except TimeoutError as e:
             raise TimeoutError("Timeout - The document took too long to load")
 
@@ -104,22 +107,19 @@ class DocumentToText(BasicExtensionProcessor):
         if not is_valid_url(url):
             raise ValueError("Invalid URL")
 
-        if not is_s3_file(url) and not is_accepted_url_file_size(url):
-            raise ValueError(
-                f"File size is too large (Max : {get_max_file_size_in_mb()})"
-            )
-
-        r = requests.get(url)
-        if r.status_code != 200:
-            raise ValueError(
-                "Check the url of your file; returned status code %s" % r.status_code
-            )
-
-        mime_type = r.headers.get("Content-Type")
-        if not is_s3_file(url) and mime_type not in self.accepted_mime_types:
-            raise ValueError("The file type is not supported.")
+        temp_file, temp_dir = create_empty_tmp_file()
+        try:
+            with open_download(url) as r:
+                mime_type = r.headers.get("Content-Type")
+                if not is_s3_file(url) and mime_type not in self.accepted_mime_types:
+                    raise ValueError("The file type is not supported.")
+
+                with open(temp_file, "wb") as f:
+                    copy_response_to_sink(r, f, get_max_download_size(url))
+        except Exception:
+            temp_dir.cleanup()
+            raise
 
-        temp_file, temp_dir = create_temp_file_with_bytes_content(r.content)
         file_path = str(temp_file)
 
         loader = self.get_loader_for_mime_type(mime_type, file_path)
@@ -6,8 +6,8 @@ from datetime import datetime
 from io import BytesIO
 from urllib.parse import unquote, urlparse
 
-import requests
-from openai import OpenAI
+from ....utils.http_session import get_session
+from ....utils.provider_client_registry import get_openai_client
 
 from ...context.processor_context import ProcessorContext
 from ..model import Field, NodeConfig, Option
@@ -202,7 +202,7 @@ class GPTImageProcessor(ContextAwareExtensionProcessor, DynamicExtensionProcesso
 
     @staticmethod
     def get_image_file_from_url(url):
-        response = requests.get(url)
+        response = get_session().get(url)
         response.raise_for_status()
         parsed = urlparse(url)
         filename = os.path.basename(parsed.path) or "image.png"
@@ -221,7 +221,7 @@ class GPTImageProcessor(ContextAwareExtensionProcessor, DynamicExtensionProcesso
         api_key = self._processor_context.get_value("openai_api_key")
         if api_key is None:
             raise Exception("No OpenAI API key found")
-        client = OpenAI(api_key=api_key)
+        client = get_openai_client(api_key, **self.get_timeout_options())
 
         if self.method == "edit":
             # gather all image_* fields just like before
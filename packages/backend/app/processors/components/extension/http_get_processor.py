@@ -3,6 +3,13 @@ import requests
 import json
 from urllib.parse import urlparse
 
+from ....utils.fetch_coordinator import get_fetch_coordinator
+from ....utils.http_cache import (
+    get_cache_control_headers,
+    get_cached_session,
+    is_reusable_when_stale,
+    parse_seconds,
+)
 from ..node_config_builder import FieldBuilder, NodeConfigBuilder
 from ...context.processor_context import ProcessorContext
 from .extension_processor import ContextAwareExtensionProcessor
@@ -18,6 +25,7 @@ class HttpGetProcessor(ContextAwareExtensionProcessor):
 
     def __init__(self, config, context: ProcessorContext):
         super().__init__(config, context)
+        self.is_response_reusable = False
 
     def get_node_config(self):
         url_field = (
@@ -41,6 +49,16 @@ class HttpGetProcessor(ContextAwareExtensionProcessor):
             .build()
         )
 
+        max_staleness_field = (
+            FieldBuilder()
+            .set_name("max_staleness")
+            .set_label("Max staleness (s)")
+            .set_type("numericfield")
+            .set_description("httpGetProcessorMaxStalenessDescription")
+            .set_default_value(0)
+            .build()
+        )
+
         return (
             NodeConfigBuilder()
             .set_node_name("HTTP Get")
@@ -52,6 +70,7 @@ class HttpGetProcessor(ContextAwareExtensionProcessor):
             .set_show_handles(True)
             .add_field(url_field)
             .add_field(headers_field)
+            .add_field(max_staleness_field)
             .build()
         )
 
@@ -74,7 +93,7 @@ class HttpGetProcessor(ContextAwareExtensionProcessor):
         if not parsed_url.scheme.startswith("http"):
             raise ValueError("Invalid URL scheme. Only HTTP and HTTPS are allowed.")
 
-        timeout = HttpGetProcessor.max_timeout
+        timeout = self.get_remaining_time(HttpGetProcessor.max_timeout)
 
         if headers:
             headers = self.convert_headers_array_to_json(headers)
@@ -86,15 +105,32 @@ class HttpGetProcessor(ContextAwareExtensionProcessor):
         else:
             headers = {}
 
+        max_staleness = self.get_input_by_name("max_staleness", 0)
+        if not any(name.lower() == "cache-control" for name in headers):
+            headers.update(get_cache_control_headers(max_staleness))
+
+        # The result is shared for as long as the node accepts a stale response
+        return get_fetch_coordinator().fetch(
+            url,
+            lambda: self.fetch_content(url, headers, timeout),
+            options={"headers": headers},
+            should_cache=lambda result: self.is_response_reusable,
+            is_cancelled=lambda: self.is_cancelled,
+            max_age=parse_seconds(max_staleness),
+        )
+
+    def fetch_content(self, url, headers, timeout):
         try:
-            response = requests.get(
+            response = get_cached_session().get(
                 url=url,
                 headers=headers,
                 timeout=timeout,
                 allow_redirects=False,
                 stream=True,
             )
+            self.set_cancellable_response(response)
             response.raise_for_status()
+            self.is_response_reusable = is_reusable_when_stale(response.headers)
         except requests.exceptions.RequestException as e:
             logging.warning(f"HTTP GET request failed: {str(e)}")
             raise Exception(f"HTTP GET request failed: {str(e)}")
@@ -126,4 +162,4 @@ class HttpGetProcessor(ContextAwareExtensionProcessor):
             return content.decode(response.encoding or "utf-8", errors="replace")
 
     def cancel(self):
-        pass
+        self.cancel_response()
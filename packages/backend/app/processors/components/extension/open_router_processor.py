@@ -7,7 +7,7 @@ from ...launcher.processor_event import ProcessorEvent
 from ...context.processor_context import ProcessorContext
 from ..model import Field, NodeConfig, Option, Condition
 from .extension_processor import ContextAwareExtensionProcessor
-from openai import OpenAI
+from ....utils.provider_client_registry import get_openai_client
 import requests
 from cachetools import TTLCache, cached
 
@@ -157,7 +157,11 @@ class OpenRouterProcessor(ContextAwareExtensionProcessor):
         if api_key is None:
             raise Exception("No OpenRouter API key found")
 
-        client = OpenAI(base_url="https://openrouter.ai/api/v1", api_key=api_key)
+        client = get_openai_client(
+            api_key,
+            base_url="https://openrouter.ai/api/v1",
+            **self.get_timeout_options(),
+        )
 
         text_image_model_ids = get_text_to_image_model_ids()
 
@@ -179,6 +183,7 @@ class OpenRouterProcessor(ContextAwareExtensionProcessor):
         )
 
         if self.streaming:
+            self.set_cancellable_response(response)
             final_response = ""
             for chunk in response:
                 if not chunk.choices[0].delta.content:
@@ -192,4 +197,4 @@ class OpenRouterProcessor(ContextAwareExtensionProcessor):
         return response.choices[0].message.content
 
     def cancel(self):
-        pass
+        self.cancel_response()
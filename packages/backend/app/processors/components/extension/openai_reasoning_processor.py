@@ -6,7 +6,7 @@ from ...launcher.processor_event import ProcessorEvent
 from ...context.processor_context import ProcessorContext
 from ..model import Field, FieldCondition, NodeConfig, Option
 from .extension_processor import ContextAwareExtensionProcessor
-from openai import OpenAI
+from ....utils.provider_client_registry import get_openai_client
 
 
 class OpenAIReasoningProcessor(ContextAwareExtensionProcessor):
@@ -134,7 +134,7 @@ class OpenAIReasoningProcessor(ContextAwareExtensionProcessor):
         if api_key is None:
             raise Exception("No OpenAI API key found")
 
-        client = OpenAI(api_key=api_key)
+        client = get_openai_client(api_key, **self.get_timeout_options())
 
         kwargs = {
             "model": model,
@@ -146,6 +146,7 @@ class OpenAIReasoningProcessor(ContextAwareExtensionProcessor):
             kwargs["reasoning"] = {"effort": reasoning_effort}
 
         stream = client.responses.create(**kwargs)
+        self.set_cancellable_response(stream)
         final_response = ""
         for event in stream:
             type = event.type
@@ -170,4 +171,4 @@ class OpenAIReasoningProcessor(ContextAwareExtensionProcessor):
         return final_response
 
     def cancel(self):
-        pass
+        self.cancel_response()
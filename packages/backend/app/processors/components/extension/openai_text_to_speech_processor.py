@@ -3,7 +3,7 @@ import re
 from ...context.processor_context import ProcessorContext
 from ..model import Field, NodeConfig, Option, Condition
 from .extension_processor import ContextAwareExtensionProcessor
-from openai import OpenAI
+from ....utils.provider_client_registry import get_openai_client
 from datetime import datetime
 import io
 from pydub import AudioSegment
@@ -12,6 +12,10 @@ import eventlet
 
 class OpenAITextToSpeechProcessor(ContextAwareExtensionProcessor):
     processor_type = "openai-text-to-speech-processor"
+    accepts_input_stream = True
+
+    STREAM_CHUNK_MIN_LENGTH = 400
+    """Length from which a streamed text is sent to synthesis, once a sentence ends"""
 
     def __init__(self, config, context: ProcessorContext):
         super().__init__(config, context)
@@ -193,13 +197,57 @@ class OpenAITextToSpeechProcessor(ContextAwareExtensionProcessor):
             chunks.append(" ".join(current_sentences))
         return chunks
 
+    def pop_stream_chunk(text, min_length, max_length=4096):
+        """
+        Splits a streamed text into a chunk ready for synthesis and the rest, still pending.
+        A chunk ends with a sentence and is at least min_length long, unless the text
+        exceeds max_length without ending a sentence.
+        """
+        sentence_ends = [
+            match.end() for match in re.finditer(r"[.!?]\s+", text[:max_length])
+        ]
+        if sentence_ends and sentence_ends[-1] >= min_length:
+            return text[: sentence_ends[-1]].strip(), text[sentence_ends[-1] :]
+        if len(text) > max_length:
+            return text[:max_length], text[max_length:]
+        return None, text
+
+    def create_audio_segments_from_stream(
+        self, input_stream, pool, create_audio_segment
+    ):
+        """
+        Synthesizes a streamed text chunk by chunk while it is produced, instead of
+        waiting for the whole text.
+        """
+        greenthreads = []
+        pending_text = ""
+        for delta in input_stream:
+            pending_text += delta
+            chunk, pending_text = OpenAITextToSpeechProcessor.pop_stream_chunk(
+                pending_text, OpenAITextToSpeechProcessor.STREAM_CHUNK_MIN_LENGTH
+            )
+            while chunk:
+                greenthreads.append(pool.spawn(create_audio_segment, chunk))
+                chunk, pending_text = OpenAITextToSpeechProcessor.pop_stream_chunk(
+                    pending_text, OpenAITextToSpeechProcessor.STREAM_CHUNK_MIN_LENGTH
+                )
+
+        for chunk in OpenAITextToSpeechProcessor.split_text_into_chunks(
+            pending_text.strip(), 4096
+        ):
+            if chunk:
+                greenthreads.append(pool.spawn(create_audio_segment, chunk))
+
+        return [greenthread.wait() for greenthread in greenthreads]
+
     def process(self):
         text = self.get_input_by_name("text")
         voice = self.get_input_by_name("voice")
         model = self.get_input_by_name("model")
         instruction = self.get_input_by_name("instruction", None)
+        input_stream = self.get_input_stream("text")
 
-        if text is None:
+        if text is None and input_stream is None:
             return None
 
         api_key = self._processor_context.get_value("openai_api_key")
@@ -207,10 +255,8 @@ class OpenAITextToSpeechProcessor(ContextAwareExtensionProcessor):
         if api_key is None:
             raise Exception("No OpenAI API key found")
 
-        client = OpenAI(api_key=api_key)
+        client = get_openai_client(api_key, **self.get_timeout_options())
 
-        # Split text into chunks that are each less than or equal to 4096 characters.
-        chunks = OpenAITextToSpeechProcessor.split_text_into_chunks(text, 4096)
         pool = eventlet.GreenPool(2)
 
         def create_audio_segment(chunk):
@@ -229,8 +275,15 @@ class OpenAITextToSpeechProcessor(ContextAwareExtensionProcessor):
             # Convert the response content (mp3 bytes) into an AudioSegment.
             return AudioSegment.from_file(io.BytesIO(response.content), format="mp3")
 
-        # Process chunks concurrently; imap preserves the order of chunks.
-        audio_segments = list(pool.imap(create_audio_segment, chunks))
+        if input_stream is not None:
+            audio_segments = self.create_audio_segments_from_stream(
+                input_stream, pool, create_audio_segment
+            )
+        else:
+            # Split text into chunks that are each less than or equal to 4096 characters.
+            chunks = OpenAITextToSpeechProcessor.split_text_into_chunks(text, 4096)
+            # Process chunks concurrently; imap preserves the order of chunks.
+            audio_segments = list(pool.imap(create_audio_segment, chunks))
         # Filter out any None segments.
         audio_segments = [segment for segment in audio_segments if segment is not None]
 
@@ -4,10 +4,24 @@ import re
 from ..node_config_builder import FieldBuilder, NodeConfigBuilder
 from .extension_processor import BasicExtensionProcessor
 from ..core.processor_type_name_utils import ProcessorType
+from ...launcher.event_type import EventType
+from ...launcher.processor_event import ProcessorEvent
+
+
+def get_replacement(replacement_text, case_sensitivity):
+    """
+    Replacement of a match of a plain search in a streamed text, the same as for the
+    whole text: a case sensitive search inserts the replacement text as is, like
+    str.replace, a case insensitive one expands its backslash escapes, like re.sub.
+    """
+    if case_sensitivity:
+        return lambda match: replacement_text
+    return lambda match: match.expand(replacement_text)
 
 
 class ReplaceTextProcessor(BasicExtensionProcessor):
     processor_type = ProcessorType.REPLACE_TEXT
+    accepts_input_stream = True
 
     def __init__(self, config):
         super().__init__(config)
@@ -93,13 +107,29 @@ class ReplaceTextProcessor(BasicExtensionProcessor):
         )
 
     def process(self):
-        input_text = self.get_input_by_name("input_text")
         search_text = self.get_input_by_name("search_text")
         replacement_text = self.get_input_by_name("replacement_text")
         replace_all = self.get_input_by_name("replace_all")
         use_regex = self.get_input_by_name("use_regex")
         case_sensitivity = self.get_input_by_name("case_sensitivity")
 
+        input_stream = self.get_input_stream("input_text")
+        if input_stream is not None:
+            if not use_regex and search_text:
+                return [
+                    self.replace_in_stream(
+                        input_stream,
+                        search_text,
+                        replacement_text,
+                        replace_all,
+                        case_sensitivity,
+                    )
+                ]
+            # A regular expression may match across any number of chunks
+            input_text = input_stream.read_all()
+        else:
+            input_text = self.get_input_by_name("input_text")
+
         flags = 0
         if not case_sensitivity:
             flags |= re.IGNORECASE
@@ -125,3 +155,48 @@ class ReplaceTextProcessor(BasicExtensionProcessor):
                     result_text = input_text.replace(search_text, replacement_text, 1)
 
         return [result_text]
+
+    def replace_in_stream(
+        self, input_stream, search_text, replacement_text, replace_all, case_sensitivity
+    ):
+        """
+        Replaces the search text in a streamed input, streaming the result as it goes.
+
+        The end of the pending text is held back while it could be the start of a match
+        split across two chunks, everything before it is final.
+        """
+        flags = 0 if case_sensitivity else re.IGNORECASE
+        pattern = re.compile(re.escape(search_text), flags)
+        replacement = get_replacement(replacement_text, case_sensitivity)
+        hold_back_length = len(search_text) - 1
+        remaining_count = None if replace_all else 1
+
+        result_text = ""
+        pending_text = ""
+
+        def flush(is_end):
+            nonlocal result_text, pending_text, remaining_count
+            position = 0
+            for match in pattern.finditer(pending_text):
+                if remaining_count == 0:
+                    break
+                result_text += pending_text[position : match.start()]
+                result_text += replacement(match)
+                position = match.end()
+                if remaining_count is not None:
+                    remaining_count -= 1
+
+            if is_end or remaining_count == 0:
+                final_position = len(pending_text)
+            else:
+                final_position = max(position, len(pending_text) - hold_back_length)
+            result_text += pending_text[position:final_position]
+            pending_text = pending_text[final_position:]
+
+        for delta in input_stream:
+            pending_text += delta
+            flush(is_end=False)
+            self.notify(EventType.STREAMING, ProcessorEvent(self, result_text))
+
+        flush(is_end=True)
+        return result_text
@@ -6,7 +6,7 @@ from ..node_config_utils import get_sub_configuration
 from ....utils.openapi_client import Client
 
 from ....utils.processor_utils import (
-    stream_download_file_as_binary,
+    stream_download_file,
 )
 
 from ....utils.openapi_converter import OpenAPIConverter
@@ -40,10 +40,11 @@ class StabilityAIGenericProcessor(
         re.compile(r"/chat"),  # api returns 404 for now
     ]
 
-    api_reader = None
+    operation_index = None
     all_paths_cache = None
     pooling_paths_cache = None
     allowed_paths_cache = None
+    node_configs_cache = {}
 
     def __init__(self, config, context: ProcessorContext):
         super().__init__(config, context)
@@ -56,12 +57,15 @@ class StabilityAIGenericProcessor(
         )
         self.path = self.get_input_by_name("path")
         self.initialize_api_config()
-        self.final_node_config = self.get_dynamic_node_config(dict(path=self.path))
+        self.final_node_config = self.get_node_config_for_path(self.path)
 
     @classmethod
     def initialize_allowed_paths_cache(cls):
-        cls.api_reader = OpenAPIReader(StabilityAIGenericProcessor.openapi_file_path)
-        paths_names = cls.api_reader.get_all_paths_names()
+        cls.operation_index = OpenAPIReader.load_operation_index(
+            StabilityAIGenericProcessor.openapi_file_path,
+            polling_path_marker="/result/",
+        )
+        paths_names = cls.operation_index.get_all_paths_names()
         cls.all_paths_cache = paths_names
         cls.pooling_paths_cache = [path for path in paths_names if "/result/" in path]
         cls.allowed_paths_cache = [
@@ -74,12 +78,29 @@ class StabilityAIGenericProcessor(
     def is_path_banned(path, denied_patterns):
         return any(pattern.search(path) for pattern in denied_patterns)
 
+    @staticmethod
+    def get_operation(path, method):
+        operation = StabilityAIGenericProcessor.operation_index.get_operation(
+            path, method
+        )
+        if operation is None:
+            raise ValueError(f"Unknown StabilityAI API path: {method.upper()} {path}")
+        return operation
+
     @staticmethod
     def get_pooling_path(path_selected):
-        for path in StabilityAIGenericProcessor.pooling_paths_cache:
-            if path.startswith(path_selected):
-                return path
-        return None
+        return StabilityAIGenericProcessor.get_operation(
+            path_selected, "post"
+        ).polling_path
+
+    @classmethod
+    def get_node_config_for_path(cls, path):
+        """The node config of the path, built once and shared by the nodes using it."""
+        node_config = cls.node_configs_cache.get(path)
+        if node_config is None:
+            node_config = cls.get_dynamic_node_config(cls, dict(path=path))
+            cls.node_configs_cache[path] = node_config
+        return node_config
 
     def transform_path_options_labels(options):
         transformed_options = []
@@ -136,28 +157,17 @@ class StabilityAIGenericProcessor(
         )
 
     def initialize_api_config(self):
-        response_content_path = self.path
-        response_method = "post"
+        operation = self.get_operation(self.path, "post")
+        response_operation = operation
 
-        self.path_accept = StabilityAIGenericProcessor.api_reader.get_path_accept(
-            self.path, "post"
-        )
-        self.pooling_path = self.get_pooling_path(self.path)
+        self.path_accept = operation.accept
+        self.pooling_path = operation.polling_path
 
         if self.pooling_path is not None:
-            response_content_path = self.pooling_path
-            response_method = "get"
-            self.pooling_path_accept = (
-                StabilityAIGenericProcessor.api_reader.get_path_accept(
-                    self.pooling_path, "get"
-                )
-            )
+            response_operation = self.get_operation(self.pooling_path, "get")
+            self.pooling_path_accept = response_operation.accept
 
-        self.response_content_type = (
-            StabilityAIGenericProcessor.api_reader.get_response_content_type(
-                response_content_path, response_method
-            )[0]
-        )
+        self.response_content_type = response_operation.response_content_types[0]
 
         print(f"Response content type {self.response_content_type}")
 
@@ -178,27 +188,22 @@ class StabilityAIGenericProcessor(
 
         selected_api_path = data["path"]
 
-        schema = StabilityAIGenericProcessor.api_reader.get_request_schema_for_path(
-            selected_api_path, "post"
+        operation = StabilityAIGenericProcessor.get_operation(selected_api_path, "post")
+        output_type = StabilityAIGenericProcessor.determine_output_type(
+            operation.accept
         )
-        path_accept = StabilityAIGenericProcessor.api_reader.get_path_accept(
-            selected_api_path, "post"
-        )
-
-        output_type = StabilityAIGenericProcessor.determine_output_type(path_accept)
-        pooling_path = self.get_pooling_path(selected_api_path)
 
-        if pooling_path is not None:
-            pooling_path_accept = (
-                StabilityAIGenericProcessor.api_reader.get_path_accept(
-                    pooling_path, "get"
-                )
+        if operation.polling_path is not None:
+            pooling_operation = StabilityAIGenericProcessor.get_operation(
+                operation.polling_path, "get"
             )
             output_type = StabilityAIGenericProcessor.determine_output_type(
-                pooling_path_accept
+                pooling_operation.accept
             )
 
-        builder = OpenAPIConverter().convert_schema_to_node_config(schema)
+        builder = OpenAPIConverter().convert_schema_to_node_config(
+            operation.request_schema
+        )
 
         path_components = selected_api_path.split("/")
         last_component = (
@@ -279,29 +284,34 @@ class StabilityAIGenericProcessor(
         binaryFieldNames = [field.name for field in fields if field.isBinary]
         files = {} if len(binaryFieldNames) > 0 else {"none": (None, "")}
 
-        for field_name in binaryFieldNames:
+        try:
+            for field_name in binaryFieldNames:
 
-            if field_name not in data:
-                files[field_name] = None
-                continue
+                if field_name not in data:
+                    files[field_name] = None
+                    continue
 
-            url = data[field_name]
-            data[field_name] = None
-            del data[field_name]
+                url = data[field_name]
+                data[field_name] = None
+                del data[field_name]
 
-            if url:
-                files[field_name] = stream_download_file_as_binary(url)
-            else:
-                files[field_name] = None
+                if url:
+                    files[field_name] = stream_download_file(url)
+                else:
+                    files[field_name] = None
 
-        client = Client(
-            api_token=api_key,
-            base_url=self.api_host,
-        )
+            client = Client(
+                api_token=api_key,
+                base_url=self.api_host,
+            )
 
-        response = client.post(
-            path=self.path, data=data, files=files, accept=self.path_accept
-        )
+            response = client.post(
+                path=self.path, data=data, files=files, accept=self.path_accept
+            )
+        finally:
+            for file in files.values():
+                if hasattr(file, "close"):
+                    file.close()
 
         if self.pooling_path:
             response_str = response.decode("utf-8")
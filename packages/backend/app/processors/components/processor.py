@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
 import json
 import logging
+import time
 from typing import Any, List, Optional, TypedDict, Union, Dict
 
 from ..launcher.processor_event import ProcessorEvent
@@ -63,6 +64,30 @@ class Processor(ABC):
     _has_dynamic_behavior: bool
     """Flag indicating if the processor's behavior and execution time are unpredictable and subject to change at runtime."""
 
+    is_cancelled: bool
+    """Flag indicating if the processor has been cancelled while running"""
+
+    deadline: Optional[float]
+    """Timestamp at which the processor must be done, set by the launcher from the node and flow timeouts"""
+
+    _cancellable_response: Optional[Any]
+    """The ongoing response of the processor, closed when the processor is cancelled"""
+
+    accepts_input_stream: bool = False
+    """Flag indicating if the processor can read a text input while its source node is still producing it"""
+
+    _input_streams: Dict[Optional[str], Any]
+    """The channels of the streaming inputs, by input name"""
+
+    cacheable: bool = False
+    """Flag indicating if the processor's output only depends on its config and inputs, and can be reused across runs"""
+
+    is_map_output: bool = False
+    """Flag set by the launcher on the nodes run in map mode, whose empty list output (a map over no items) is a result"""
+
+    NON_CACHE_KEY_CONFIG_FIELDS = ["name", "x", "y", "inputs", "outputData", "timeout"]
+    """Config fields that do not affect the output of the processor"""
+
     def __init__(self, config: Dict[str, Any]) -> None:
         self.name = config["name"]
         self.processor_type = config["processorType"]
@@ -74,6 +99,10 @@ class Processor(ABC):
         self.storage_strategy = None
         self.is_finished = False
         self._has_dynamic_behavior = False
+        self.is_cancelled = False
+        self.deadline = None
+        self._input_streams = {}
+        self._cancellable_response = None
         self._config = config
         if (
             config.get("config") is not None
@@ -105,6 +134,67 @@ class Processor(ABC):
     def cancel(self) -> None:
         pass
 
+    def get_timeout(self) -> Optional[float]:
+        """The wall-clock limit of the node in seconds, from the "timeout" field of its config."""
+        timeout = self._config.get("timeout")
+        if timeout is None or timeout == "":
+            return None
+        try:
+            timeout = float(timeout)
+        except (TypeError, ValueError):
+            logging.warning(f"Ignoring invalid timeout for {self.name}: {timeout}")
+            return None
+        return timeout if timeout > 0 else None
+
+    def get_remaining_time(self, max_time: Optional[float] = None) -> Optional[float]:
+        """
+        Seconds left before the deadline of the processor, capped by max_time.
+        Returns max_time when the processor has no deadline.
+        """
+        if self.deadline is None:
+            return max_time
+        remaining_time = max(self.deadline - time.time(), 0)
+        return remaining_time if max_time is None else min(remaining_time, max_time)
+
+    def get_timeout_options(self) -> Dict[str, float]:
+        """Keyword arguments bounding an API client to the remaining time, empty without deadline."""
+        remaining_time = self.get_remaining_time()
+        return {} if remaining_time is None else {"timeout": remaining_time}
+
+    def set_cancellable_response(self, response) -> None:
+        """
+        Registers the ongoing response of the processor (an API stream, an HTTP response...),
+        so that cancel_response can close it. Closed right away if the processor is already cancelled.
+        """
+        self._cancellable_response = response
+        if self.is_cancelled:
+            self.cancel_response()
+
+    def cancel_response(self) -> None:
+        """Marks the processor as cancelled and closes its ongoing response, if any."""
+        self.is_cancelled = True
+        response = self._cancellable_response
+        self._cancellable_response = None
+        if response is None:
+            return
+        try:
+            response.close()
+        except Exception as e:
+            logging.warning(f"Failed to close the response of {self.name}: {e}")
+
+    def set_input_stream(self, input_name: Optional[str], stream) -> None:
+        self._input_streams[input_name] = stream
+
+    def get_input_stream(self, input_name: Optional[str] = None):
+        """
+        Returns the channel of a streaming input, an iterable over the text deltas of the
+        input node, or None if the input is not streamed.
+        Without input name, returns the first streaming input.
+        """
+        if input_name is None and None not in self._input_streams:
+            return next(iter(self._input_streams.values()), None)
+        return self._input_streams.get(input_name)
+
     def add_observer(self, observer):
         self.observers.append(observer)
 
@@ -130,6 +220,8 @@ class Processor(ABC):
                 return output[input_key]
             else:
                 return output
+        if output == [] and input_key is None and self.is_map_output:
+            return output
         return None
 
     def set_output(self, value: Union[List, str]) -> None:
@@ -224,13 +316,44 @@ class Processor(ABC):
     def has_dynamic_behavior(self) -> bool:
         return self._has_dynamic_behavior
 
+    def is_cacheable(self) -> bool:
+        return self.cacheable
+
+    def get_cache_key_data(self) -> Dict[str, Any]:
+        """
+        Returns the data the output of the processor depends on: its type, its config
+        and its inputs, resolved from the input processors outputs.
+        """
+        config = {
+            key: value
+            for key, value in self._config.items()
+            if key not in Processor.NON_CACHE_KEY_CONFIG_FIELDS
+        }
+
+        resolved_inputs = []
+        for input, input_processor in zip(
+            self.inputs or [], self.get_input_processors() or []
+        ):
+            input_name = input.get("inputName")
+            if input_name is not None:
+                value = self.get_input_by_name(input_name, accept_object=True)
+            else:
+                value = input_processor.get_output(input.get("inputNodeOutputKey"))
+            resolved_inputs.append([input_name, value])
+
+        return {
+            "processorType": self.processor_type,
+            "config": config,
+            "inputs": resolved_inputs,
+        }
+
 
 class BasicProcessor(Processor):
     def __init__(self, config):
         super().__init__(config)
 
     def cancel(self):
-        pass
+        self.is_cancelled = True
 
 
 class ContextAwareProcessor(Processor):
@@ -1,59 +1,97 @@
-from enum import Enum
-import importlib
-import logging
-import pkgutil
 import inspect
-from ..components.processor import Processor
+from dataclasses import dataclass
 from .processor_factory import ProcessorFactory
+from .processor_registry import (
+    DEFAULT_MANIFEST_PATH,
+    LazyProcessorClass,
+    load_processor_classes,
+    resolve_processor_class,
+)
+from ...env_config import (
+    get_processor_manifest_path,
+    is_lazy_processor_loading_enabled,
+)
 from injector import singleton
 
 
+@dataclass(frozen=True)
+class ProcessorConstructionPlan:
+    """
+    How to build the processors of a class, so that the constructor signature is
+    inspected once per class instead of once per node.
+    """
+
+    processor_class: type
+    accepts_context: bool
+
+    @classmethod
+    def from_class(cls, processor_class) -> "ProcessorConstructionPlan":
+        params = inspect.signature(processor_class.__init__).parameters
+        return cls(processor_class, accepts_context="context" in params)
+
+    def create(self, config, context_data=None, storage_strategy=None):
+        if self.accepts_context:
+            processor = self.processor_class(config=config, context=context_data)
+        else:
+            processor = self.processor_class(config=config)
+        processor.set_storage_strategy(storage_strategy)
+        return processor
+
+
 @singleton
 class ProcessorFactoryIterModules(ProcessorFactory):
     def __init__(self):
         self._processors = {}
+        self._construction_plans = {}
+        self._processors_loaded = False
 
     def register_processor(self, processor_type, processor_class):
+        """
+        Registers the class of a processor type. Its construction plan is computed
+        now, or on the first creation if the class is still lazy.
+        """
         self._processors[processor_type] = processor_class
+        self._construction_plans.pop(processor_type, None)
+        if not isinstance(processor_class, LazyProcessorClass):
+            self._construction_plans[processor_type] = (
+                ProcessorConstructionPlan.from_class(processor_class)
+            )
 
-    def create_processor(self, config, context_data=None, storage_strategy=None):
-        processor_type = config["processorType"]
+    def get_processor_class(self, processor_type):
+        """Returns the class of the processor type, importing its module if still lazy."""
         processor_class = self._processors.get(processor_type)
         if not processor_class:
             raise ValueError(f"Processor type '{processor_type}' not supported")
+        return resolve_processor_class(processor_class)
 
-        params = inspect.signature(processor_class.__init__).parameters
-        context_param = params.get("context")
-
-        processor = None
-        if context_param is not None:
-            processor = processor_class(config=config, context=context_data)
-        else:
-            processor = processor_class(config=config)
-        processor.set_storage_strategy(storage_strategy)
+    def get_construction_plan(self, processor_type) -> "ProcessorConstructionPlan":
+        """Returns the plan of the processor type, computed once per registered class."""
+        plan = self._construction_plans.get(processor_type)
+        if plan is None:
+            plan = ProcessorConstructionPlan.from_class(
+                self.get_processor_class(processor_type)
+            )
+            self._construction_plans[processor_type] = plan
+        return plan
 
-        return processor
+    def create_processor(self, config, context_data=None, storage_strategy=None):
+        plan = self.get_construction_plan(config["processorType"])
+        return plan.create(config, context_data, storage_strategy)
 
     def load_processors(self):
-        self._load_recursive("app.processors.components")
-
-    def _load_recursive(self, package_name):
-        package = importlib.import_module(package_name)
-        prefix = package.__name__ + "."
-        for importer, module_name, is_pkg in pkgutil.iter_modules(
-            package.__path__, prefix
-        ):
-            if is_pkg:
-                self._load_recursive(module_name)
-            else:
-                module = __import__(module_name, fromlist="dummy")
-                for attribute_name in dir(module):
-                    attribute = getattr(module, attribute_name)
-                    if isinstance(attribute, type) and issubclass(attribute, Processor):
-                        if attribute.processor_type is not None:
-                            processor_type_key = (
-                                attribute.processor_type.value
-                                if isinstance(attribute.processor_type, Enum)
-                                else attribute.processor_type
-                            )
-                            self.register_processor(processor_type_key, attribute)
+        """
+        Registers the processor classes. They are discovered once per process, and
+        registered once per factory, so this is cheap to call for every launcher.
+
+        With lazy loading, the types of the manifest are registered without importing
+        their modules, which is done by the first create_processor of each type.
+        """
+        if self._processors_loaded:
+            return
+        processor_classes = load_processor_classes(
+            get_processor_manifest_path() or DEFAULT_MANIFEST_PATH,
+            lazy=is_lazy_processor_loading_enabled(),
+        )
+        for processor_type, processor_class in processor_classes.items():
+            self.register_processor(processor_type, processor_class)
+        self._processors_loaded = True
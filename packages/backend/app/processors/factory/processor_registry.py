@@ -0,0 +1,211 @@
+"""
+Discovery of the processor classes, done once per process.
+
+The classes are found by walking the components package, or read from a manifest
+mapping each processor type to its "module:Class" path. The manifest lets a process
+register the processor types without walking and scanning every module, and, with
+lazy loading, without importing them: each type is registered as a
+LazyProcessorClass whose module is imported when the first processor is created.
+
+Generate the manifest with (from packages/backend):
+    python -m app.processors.factory.processor_registry [output_path]
+"""
+
+import importlib
+import json
+import logging
+import os
+import pkgutil
+import sys
+import threading
+from enum import Enum
+from typing import Dict, Optional, Union
+
+from ..components.processor import Processor
+
+COMPONENTS_PACKAGE = "app.processors.components"
+
+DEFAULT_MANIFEST_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "processor_manifest.json"
+)
+
+_registry_cache: Dict[str, Dict[str, type]] = {}
+_registry_lock = threading.Lock()
+
+
+def get_processor_type_key(processor_class) -> str:
+    processor_type = processor_class.processor_type
+    return processor_type.value if isinstance(processor_type, Enum) else processor_type
+
+
+def get_class_path(processor_class) -> str:
+    return f"{processor_class.__module__}:{processor_class.__qualname__}"
+
+
+def import_class(class_path: str) -> type:
+    module_name, class_name = class_path.split(":", 1)
+    attribute = importlib.import_module(module_name)
+    for name in class_name.split("."):
+        attribute = getattr(attribute, name)
+    return attribute
+
+
+class LazyProcessorClass:
+    """
+    Stands for a processor class until it is needed. The module of the class, and its
+    heavy dependencies, are imported on the first call to resolve.
+    """
+
+    def __init__(self, processor_type: str, class_path: str):
+        self.processor_type = processor_type
+        self.class_path = class_path
+        self._processor_class = None
+        self._lock = threading.Lock()
+
+    def is_resolved(self) -> bool:
+        return self._processor_class is not None
+
+    def resolve(self) -> type:
+        if self._processor_class is None:
+            with self._lock:
+                if self._processor_class is None:
+                    self._processor_class = import_class(self.class_path)
+        return self._processor_class
+
+    def __repr__(self) -> str:
+        return f"LazyProcessorClass({self.processor_type!r}, {self.class_path!r})"
+
+
+def resolve_processor_class(processor_class) -> type:
+    if isinstance(processor_class, LazyProcessorClass):
+        return processor_class.resolve()
+    return processor_class
+
+
+def discover_processor_classes(package_name=COMPONENTS_PACKAGE) -> Dict[str, type]:
+    """Walks the package and returns the processor classes found, by processor type."""
+    processor_classes = {}
+    package = importlib.import_module(package_name)
+    prefix = package.__name__ + "."
+    for importer, module_name, is_pkg in pkgutil.iter_modules(package.__path__, prefix):
+        if is_pkg:
+            processor_classes.update(discover_processor_classes(module_name))
+            continue
+
+        module = __import__(module_name, fromlist="dummy")
+        for attribute_name in dir(module):
+            attribute = getattr(module, attribute_name)
+            if (
+                isinstance(attribute, type)
+                and issubclass(attribute, Processor)
+                and attribute.processor_type is not None
+            ):
+                processor_classes[get_processor_type_key(attribute)] = attribute
+    return processor_classes
+
+
+def get_processor_classes(package_name=COMPONENTS_PACKAGE) -> Dict[str, type]:
+    """
+    Returns the processor classes by processor type, discovered on the first call
+    only. The result is shared, callers must not modify it.
+    """
+    processor_classes = _registry_cache.get(package_name)
+    if processor_classes is not None:
+        return processor_classes
+
+    with _registry_lock:
+        if package_name not in _registry_cache:
+            _registry_cache[package_name] = discover_processor_classes(package_name)
+        return _registry_cache[package_name]
+
+
+def import_manifest_classes(manifest: Dict[str, str]) -> Dict[str, type]:
+    processor_classes = {}
+    for processor_type, class_path in manifest.items():
+        try:
+            processor_classes[processor_type] = import_class(class_path)
+        except (ImportError, AttributeError, ValueError) as e:
+            logging.warning(
+                f"Cannot import processor '{processor_type}' from {class_path}: {e}"
+            )
+    return processor_classes
+
+
+def create_lazy_classes(manifest: Dict[str, str]) -> Dict[str, LazyProcessorClass]:
+    return {
+        processor_type: LazyProcessorClass(processor_type, class_path)
+        for processor_type, class_path in manifest.items()
+    }
+
+
+def load_processor_classes(
+    manifest_path: Optional[str] = None, lazy: bool = False
+) -> Dict[str, Union[type, LazyProcessorClass]]:
+    """
+    Returns the processor classes by processor type, from the manifest if one is given
+    and readable, by walking the components package otherwise. Loaded once per process.
+
+    With lazy, the classes of the manifest are returned as LazyProcessorClass, and
+    nothing is imported until they are resolved.
+    """
+    if not manifest_path:
+        return get_processor_classes()
+
+    cache_key = f"{'lazy' if lazy else 'manifest'}:{manifest_path}"
+    processor_classes = _registry_cache.get(cache_key)
+    if processor_classes is not None:
+        return processor_classes
+
+    manifest = load_manifest(manifest_path)
+    if manifest is None:
+        return get_processor_classes()
+
+    with _registry_lock:
+        if cache_key not in _registry_cache:
+            _registry_cache[cache_key] = (
+                create_lazy_classes(manifest)
+                if lazy
+                else import_manifest_classes(manifest)
+            )
+        return _registry_cache[cache_key]
+
+
+def clear_registry_cache() -> None:
+    with _registry_lock:
+        _registry_cache.clear()
+
+
+def generate_manifest(package_name=COMPONENTS_PACKAGE) -> Dict[str, str]:
+    """Returns the "module:Class" path of every processor class, by processor type."""
+    return {
+        processor_type: get_class_path(processor_class)
+        for processor_type, processor_class in sorted(
+            discover_processor_classes(package_name).items()
+        )
+    }
+
+
+def write_manifest(path=DEFAULT_MANIFEST_PATH, package_name=COMPONENTS_PACKAGE):
+    manifest = generate_manifest(package_name)
+    with open(path, "w") as file:
+        json.dump(manifest, file, indent=2)
+        file.write("\n")
+    return manifest
+
+
+def load_manifest(path=DEFAULT_MANIFEST_PATH) -> Optional[Dict[str, str]]:
+    """Reads a manifest, None if there is none or it cannot be read."""
+    if not path or not os.path.isfile(path):
+        return None
+    try:
+        with open(path, "r") as file:
+            return json.load(file)
+    except (OSError, ValueError) as e:
+        logging.warning(f"Ignoring invalid processor manifest {path}: {e}")
+        return None
+
+
+if __name__ == "__main__":
+    output_path = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_MANIFEST_PATH
+    manifest = write_manifest(output_path)
+    print(f"Wrote {len(manifest)} processor types to {output_path}")
@@ -1,16 +1,27 @@
 from abc import abstractmethod
 import json
 import logging
-from typing import List
+import time
+from typing import List, Optional
 from injector import inject
 from .processor_launcher import ProcessorLauncher
 from .event_type import EventType
 from .processor_launcher_event import ProcessorLauncherEvent
+from .flow_graph import FlowGraph
 
 from ..context.processor_context import ProcessorContext
 
 from ..observer.observer import Observer
 
+from .run_registry import RunRegistry
+from ..cache.flow_run_store import FlowRunStore
+from ..cache.node_output_cache import (
+    CacheStatus,
+    NodeOutputCache,
+    compute_cache_key,
+    scope_cache_key,
+)
+
 from ...storage.storage_strategy import StorageStrategy
 from ..factory.processor_factory import ProcessorFactory
 
@@ -26,6 +37,12 @@ class AbstractTopologicalProcessorLauncher(ProcessorLauncher):
     storage_strategy: StorageStrategy
     observers: List[Observer]
     context: ProcessorContext
+    flow_graph: Optional[FlowGraph]
+    output_cache: Optional[NodeOutputCache]
+    flow_run_store: Optional[FlowRunStore]
+    run_registry: Optional[RunRegistry]
+    deadline: Optional[float]
+    incremental: bool
 
     @inject
     def __init__(
@@ -33,12 +50,21 @@ class AbstractTopologicalProcessorLauncher(ProcessorLauncher):
         processor_factory: ProcessorFactory,
         storage_strategy: StorageStrategy,
         observers: List[Observer] = None,
+        output_cache: NodeOutputCache = None,
+        flow_run_store: FlowRunStore = None,
+        run_registry: RunRegistry = None,
     ) -> None:
         self.processor_factory = processor_factory
         self.storage_strategy = storage_strategy
         self.processor_factory.load_processors()
         self.observers = observers or []
         self.context = None
+        self.flow_graph = None
+        self.output_cache = output_cache
+        self.flow_run_store = flow_run_store
+        self.run_registry = run_registry
+        self.deadline = None
+        self.incremental = False
 
     def set_context(self, context: ProcessorContext):
         self.context = context
@@ -46,6 +72,47 @@ class AbstractTopologicalProcessorLauncher(ProcessorLauncher):
     def add_observer(self, observer):
         self.observers.append(observer)
 
+    def set_deadline(self, deadline: Optional[float]) -> None:
+        """Sets the timestamp at which the whole flow must be done, None for no limit."""
+        self.deadline = deadline
+
+    def get_node_deadline(self, processor) -> Optional[float]:
+        """The earliest of the flow deadline and the node timeout, counted from now."""
+        deadline = self.deadline
+        timeout = processor.get_timeout()
+        if timeout is not None:
+            node_deadline = time.time() + timeout
+            deadline = (
+                node_deadline if deadline is None else min(deadline, node_deadline)
+            )
+        return deadline
+
+    def cancel(self) -> bool:
+        return False
+
+    def register_run(self) -> None:
+        if self.run_registry is not None and self.context is not None:
+            self.run_registry.register(self.context.get_session_id(), self)
+
+    def unregister_run(self) -> None:
+        if self.run_registry is not None and self.context is not None:
+            self.run_registry.unregister(self.context.get_session_id(), self)
+
+    def record_reclaimed_work(self, running_nodes_count, pending_nodes_count) -> None:
+        if self.run_registry is not None:
+            self.run_registry.record_reclaimed_work(
+                running_nodes_count, pending_nodes_count
+            )
+
+    def get_flow_graph(self, config_data) -> FlowGraph:
+        """
+        Returns the FlowGraph of the given configuration data, built only once
+        for the configuration of the current request.
+        """
+        if self.flow_graph is None or self.flow_graph.config_data is not config_data:
+            self.flow_graph = FlowGraph(config_data)
+        return self.flow_graph
+
     def _load_config_data(self, fileName):
         with open(fileName, "r") as file:
             config_data = json.load(file)
@@ -66,11 +133,12 @@ class AbstractTopologicalProcessorLauncher(ProcessorLauncher):
                     processor.add_input_processor(input_processor)
 
     def load_processors(self, config_data):
+        flow_graph = self.get_flow_graph(config_data)
         processors = {
-            config["name"]: self.processor_factory.create_processor(
-                config, self.context, self.storage_strategy
+            name: self.processor_factory.create_processor(
+                flow_graph.get_config(name), self.context, self.storage_strategy
             )
-            for config in config_data
+            for name in flow_graph.topological_order
         }
 
         self._link_processors(processors)
@@ -87,10 +155,7 @@ class AbstractTopologicalProcessorLauncher(ProcessorLauncher):
         Returns:
             The node with the given name if found, otherwise None.
         """
-        for node in config_data:
-            if node.get("name") == node_name:
-                return node
-        return None
+        return self.get_flow_graph(config_data).get_config(node_name)
 
     def notify_error(self, processor, e):
         error_event_data = ProcessorLauncherEvent(
@@ -116,7 +181,9 @@ class AbstractTopologicalProcessorLauncher(ProcessorLauncher):
         )
         self.notify_observers(EventType.STREAMING.value, streaming_event_data)
 
-    def notify_progress(self, processor, output, isDone=False, duration=0):
+    def notify_progress(
+        self, processor, output, isDone=False, duration=0, cache_status=None
+    ):
         progress_event_data = ProcessorLauncherEvent(
             instance_name=processor.name,
             user_id=self.context.get_current_user_id(),
@@ -126,9 +193,28 @@ class AbstractTopologicalProcessorLauncher(ProcessorLauncher):
             processor_type=processor.processor_type,
             session_id=self.context.get_session_id(),
             duration=duration,
+            cache_status=cache_status.value if cache_status is not None else None,
         )
         self.notify_observers(EventType.PROGRESS.value, progress_event_data)
 
+    def notify_map_item_progress(
+        self, processor, item_index, item_count, output=None, error=None
+    ):
+        map_item_progress_event_data = ProcessorLauncherEvent(
+            instance_name=processor.name,
+            user_id=self.context.get_current_user_id(),
+            output=output,
+            processor=processor,
+            error=error,
+            processor_type=processor.processor_type,
+            session_id=self.context.get_session_id(),
+            item_index=item_index,
+            item_count=item_count,
+        )
+        self.notify_observers(
+            EventType.MAP_ITEM_PROGRESS.value, map_item_progress_event_data
+        )
+
     def notify_current_node_running(self, processor):
         current_node_running_event_data = ProcessorLauncherEvent(
             instance_name=processor.name,
@@ -142,6 +228,77 @@ class AbstractTopologicalProcessorLauncher(ProcessorLauncher):
             EventType.CURRENT_NODE_RUNNING.value, current_node_running_event_data
         )
 
+    def set_incremental(self, incremental: bool) -> None:
+        """
+        Sets the run mode. An incremental run enables the recording of the outputs of
+        the session, so that its next runs can reuse them.
+        """
+        self.incremental = incremental
+        if incremental and self.flow_run_store is not None:
+            self.flow_run_store.enable_session(self.context.get_session_id())
+
+    def is_recording_run(self) -> bool:
+        return self.flow_run_store is not None and (
+            self.flow_run_store.is_session_enabled(self.context.get_session_id())
+        )
+
+    def get_output_fingerprint(self, processor) -> Optional[str]:
+        """
+        Returns the fingerprint of the processor config and resolved inputs, or None
+        if neither the node output cache nor the flow run store needs it.
+        """
+        uses_output_cache = self.output_cache is not None and processor.is_cacheable()
+        if not uses_output_cache and not self.is_recording_run():
+            return None
+        return compute_cache_key(processor)
+
+    def get_output_cache_key(self, fingerprint: str) -> str:
+        return scope_cache_key(fingerprint, self.context.get_current_user_id())
+
+    def get_reusable_output(self, processor, fingerprint):
+        """
+        Looks for an output of an identical node, first in the outputs of the previous
+        run of the session (incremental runs only), then in the node output cache.
+
+        Returns:
+            tuple: The output found or None, and the CacheStatus of the lookup or None
+            if no lookup was made.
+        """
+        if fingerprint is None:
+            return None, None
+
+        if self.incremental and self.flow_run_store is not None:
+            output = self.flow_run_store.get_output(
+                self.context.get_session_id(), processor.name, fingerprint
+            )
+            if output is not None:
+                return output, CacheStatus.HIT
+
+        if self.output_cache is None or not processor.is_cacheable():
+            return None, None
+
+        try:
+            output = self.output_cache.get(self.get_output_cache_key(fingerprint))
+        except Exception as e:
+            logging.warning(f"Failed to read the node output cache: {e}")
+            output = None
+        return output, CacheStatus.HIT if output is not None else CacheStatus.MISS
+
+    def store_output(self, processor, fingerprint, output, cache_status=None):
+        if fingerprint is None or output is None:
+            return
+
+        if self.is_recording_run():
+            self.flow_run_store.set_output(
+                self.context.get_session_id(), processor.name, fingerprint, output
+            )
+
+        if cache_status == CacheStatus.MISS:
+            try:
+                self.output_cache.set(self.get_output_cache_key(fingerprint), output)
+            except Exception as e:
+                logging.warning(f"Failed to write the node output cache: {e}")
+
     def load_required_processors(self, config_data, node_name):
         """
         Loads the necessary processors based on the given configuration data and node name.
@@ -151,66 +308,37 @@ class AbstractTopologicalProcessorLauncher(ProcessorLauncher):
             node_name (str): The name of the node being processed.
 
         Returns:
-            dict: A dictionary mapping processor names to their respective instances.
+            dict: A dictionary mapping processor names to their respective instances, in topological order.
 
         The function operates as follows:
-            - Iterates over each configuration in config_data.
-            - Creates a new processor instance based on the configuration.
+            - Collects the configuration of the node and of its ancestors.
+            - Creates a new processor instance for each of them.
             - If outputData is not None and differs from node_name, the processor's output is set accordingly.
             - Stores each processor instance in a dictionary with its name as the key.
         """
         processors = {}
-        node = self.get_node_by_name(config_data, node_name)
-        if node and not node.get("inputs"):
+        for config in self.get_related_config_data(config_data, node_name):
             processor = self.processor_factory.create_processor(
-                node, self.context, self.storage_strategy
-            )
-            processors[node["name"]] = processor
-            logging.debug(f"Created single processor for node - {node_name}")
-        else:
-            related_config_data = self.get_related_config_data(
-                config_data, node_name, []
+                config, self.context, self.storage_strategy
             )
-            related_config_data.reverse()
-            for config in related_config_data:
-                config_output = config.get("outputData", None)
-                if config_output is None or config["name"] == node_name:
-                    logging.debug(f"Empty or current node - {config['name']}")
-                    processor = self.processor_factory.create_processor(
-                        config, self.context, self.storage_strategy
-                    )
-                    processors[config["name"]] = processor
-                else:
-                    logging.debug(f"Non empty node -  {config['name']}")
-                    processor = self.processor_factory.create_processor(
-                        config, self.context, self.storage_strategy
-                    )
-                    processor.set_output(config_output)
-                    processors[config["name"]] = processor
+            config_output = config.get("outputData", None)
+            if config_output is None or config["name"] == node_name:
+                logging.debug(f"Empty or current node - {config['name']}")
+            else:
+                logging.debug(f"Non empty node -  {config['name']}")
+                processor.set_output(config_output)
+            processors[config["name"]] = processor
         return processors
 
-    def get_related_config_data(self, config_data, node_name, visited):
-        if node_name in visited:
-            return []
-        visited.append(node_name)
-
-        current_config = next(
-            (config for config in config_data if config["name"] == node_name), None
-        )
-
-        if not current_config:
-            return []
-
-        related_configs = [current_config]
-
-        for input in current_config.get("inputs", []):
-            related_configs.extend(
-                self.get_related_config_data(
-                    config_data, input.get("inputNode"), visited
-                )
-            )
-
-        return related_configs
+    def get_related_config_data(self, config_data, node_name):
+        """
+        Returns the configuration of the node and of every node it depends on, parents first.
+        """
+        flow_graph = self.get_flow_graph(config_data)
+        return [
+            flow_graph.get_config(name)
+            for name in flow_graph.get_related_node_names(node_name)
+        ]
 
     def load_processors_for_node(self, config_data, node_name):
         processors = self.load_required_processors(config_data, node_name)
@@ -219,7 +347,7 @@ class AbstractTopologicalProcessorLauncher(ProcessorLauncher):
         return processors
 
     @abstractmethod
-    def launch_processors(self, processors):
+    def launch_processors(self, processors, incremental=False):
         pass
 
     @abstractmethod
@@ -2,11 +2,12 @@ import gc
 import threading
 import time
 import eventlet
+from eventlet.queue import LightQueue
 from eventlet.semaphore import Semaphore
 import logging
 import traceback
 
-from typing import Dict, List
+from typing import Dict, List, Optional
 from enum import Enum
 
 from .processor_event import ProcessorEvent
@@ -15,12 +16,27 @@ from .event_type import EventType
 
 from ..observer.observer import Observer
 
+from ..cache.node_output_cache import CacheStatus
+from .run_registry import RunCancelledError
+from .map_execution import MapConfig, MapErrorPolicy, MapItemError
+from .stream_channel import StreamChannel, StreamForwarder
+
 from ..components.processor import Processor
 from .abstract_topological_processor_launcher import (
     AbstractTopologicalProcessorLauncher,
 )
 
 
+class NodeTimeoutError(TimeoutError):
+    """Exception raised when a node exceeds its timeout or the deadline of the flow."""
+
+    def __init__(self, node_name: str):
+        self.node_name = node_name
+        super().__init__(
+            f"Node {node_name} did not complete before its timeout or the flow deadline."
+        )
+
+
 class AsyncProcessorLauncher(AbstractTopologicalProcessorLauncher, Observer):
     """
     AsyncProcessorLauncher extends the functionality of the Basic Processor Launcher.
@@ -32,22 +48,36 @@ class AsyncProcessorLauncher(AbstractTopologicalProcessorLauncher, Observer):
 
     GREENTHREAD_POOL_SIZE = 7
 
+    _completions = None
+    """The completion queue of the ongoing dispatch, used to cancel it"""
+
+    stream_forwarders: Dict[str, StreamForwarder] = None
+    """The forwarders of the nodes with streaming children, by node name"""
+
     class NodeState(Enum):
         PENDING = 1
         RUNNING = 2
         COMPLETED = 3
         ERROR = 4
+        CANCELLED = 5
 
     class Node:
         def __init__(self, id: str, parent_ids: List[str], processor: Processor):
             self.id = id
             self.parent_ids = parent_ids
+            self.children: List["AsyncProcessorLauncher.Node"] = []
+            self.stream_children: List["AsyncProcessorLauncher.Node"] = []
+            self.stream_forwarder: StreamForwarder = None
+            self.input_channels: List[StreamChannel] = []
+            self.has_input_stream = False
+            self.is_scheduled = False
+            self.pending_parents_count = 0
             self.state = AsyncProcessorLauncher.NodeState.PENDING
             self.output = None
             self.processor = processor
             self.lock = Semaphore(1)
 
-        def run(self):
+        def run(self, process=None):
             with self.lock:
                 if self.state != AsyncProcessorLauncher.NodeState.PENDING:
                     logging.warning(
@@ -58,7 +88,9 @@ class AsyncProcessorLauncher(AbstractTopologicalProcessorLauncher, Observer):
                 self.state = AsyncProcessorLauncher.NodeState.RUNNING
 
                 try:
-                    self.output = self.processor.process_and_update()
+                    if process is None:
+                        process = self.processor.process_and_update
+                    self.output = process()
                 except Exception as e:
                     self.state = AsyncProcessorLauncher.NodeState.ERROR
                     raise e
@@ -66,111 +98,465 @@ class AsyncProcessorLauncher(AbstractTopologicalProcessorLauncher, Observer):
                 self.state = AsyncProcessorLauncher.NodeState.COMPLETED
                 return self.output
 
+        def complete_with_output(self, output):
+            with self.lock:
+                if self.state != AsyncProcessorLauncher.NodeState.PENDING:
+                    return self.output
+
+                self.processor.set_output(output)
+                self.output = output
+                self.state = AsyncProcessorLauncher.NodeState.COMPLETED
+                return self.output
+
+        def is_ready(self):
+            return (
+                self.state == AsyncProcessorLauncher.NodeState.PENDING
+                and self.pending_parents_count == 0
+                and not self.is_scheduled
+            )
+
         def get_processor(self):
             return self.processor
 
     def get_input_processor_names(self, processor: Processor):
+        if self.flow_graph is not None and self.flow_graph.has_node(processor.name):
+            return self.flow_graph.get_parents(processor.name)
         return [
             input_processor.name for input_processor in processor.get_input_processors()
         ]
 
-    def convert_processors_to_node_dict(self, processors: List[Processor]):
+    def convert_processors_to_node_dict(self, processors: Dict[str, Processor]):
         nodes = {}
         for processor in processors.values():
             nodes[processor.name] = self.Node(
                 processor.name, self.get_input_processor_names(processor), processor
             )
+
+        self.stream_forwarders = {}
+        ancestors_by_node = {}
+        for node in nodes.values():
+            streaming_inputs = self.get_streaming_inputs(node.get_processor())
+            # A node may consume several outputs of the same parent, count it once
+            parent_ids = set(node.parent_ids)
+            for parent_id in parent_ids:
+                parent = nodes.get(parent_id)
+                if parent is None:
+                    continue
+                if parent_id in streaming_inputs and not any(
+                    parent_id
+                    in self.get_node_ancestors(nodes, other_id, ancestors_by_node)
+                    for other_id in parent_ids
+                    if other_id != parent_id
+                ):
+                    self.link_stream(parent, node, streaming_inputs[parent_id])
+                else:
+                    parent.children.append(node)
+                node.pending_parents_count += 1
         return nodes
 
-    def launch_processors(self, processors: List[Processor]):
+    def get_node_ancestors(self, nodes: Dict[str, Node], node_id, ancestors_by_node):
+        """Ids of the nodes the given node waits for, directly or not, memoized."""
+        if node_id in ancestors_by_node:
+            return ancestors_by_node[node_id]
+
+        ancestors = set()
+        to_visit = [node_id]
+        while to_visit:
+            node = nodes.get(to_visit.pop())
+            if node is None:
+                continue
+            for parent_id in node.parent_ids:
+                if parent_id in nodes and parent_id not in ancestors:
+                    ancestors.add(parent_id)
+                    to_visit.append(parent_id)
+        ancestors_by_node[node_id] = ancestors
+        return ancestors
+
+    def get_streaming_inputs(self, processor: Processor):
+        """
+        Returns the inputs of the processor to stream, by input node name.
+
+        An input is streamed when it is flagged with "streaming", reads the main output
+        of its node, and the processor accepts input streams. A node also linked to the
+        processor through a regular input is not streamed, since its full output is needed.
+        """
+        if not processor.accepts_input_stream or not processor.inputs:
+            return {}
+
+        streaming_inputs = {}
+        regular_input_nodes = set()
+        for input in processor.inputs:
+            input_node = input.get("inputNode")
+            if input.get("streaming") and input.get("inputNodeOutputKey") in (None, 0):
+                streaming_inputs.setdefault(input_node, []).append(input)
+            else:
+                regular_input_nodes.add(input_node)
+
+        return {
+            input_node: inputs
+            for input_node, inputs in streaming_inputs.items()
+            if input_node not in regular_input_nodes
+        }
+
+    def link_stream(self, parent: Node, child: Node, inputs):
+        """
+        Link the parent to a child reading its text while it is produced. The child is
+        spawned as soon as the parent is, instead of waiting for its completion.
+
+        Only called when the other parents of the child do not depend on the parent:
+        otherwise the child could not start reading before the parent completes, and
+        the parent would wait for it once the channel is full.
+        """
+        if parent.stream_forwarder is None:
+            parent.stream_forwarder = StreamForwarder()
+            self.stream_forwarders[parent.id] = parent.stream_forwarder
+
+        for input in inputs:
+            channel = StreamChannel()
+            parent.stream_forwarder.add_channel(channel)
+            child.input_channels.append(channel)
+            child.get_processor().set_input_stream(input.get("inputName"), channel)
+
+        parent.stream_children.append(child)
+        child.has_input_stream = True
+
+    def launch_processors(self, processors: Dict[str, Processor], incremental=False):
+        self.set_incremental(incremental)
         for processor in processors.values():
             processor.add_observer(self)
 
         nodes = self.convert_processors_to_node_dict(processors)
 
+        error = self.dispatch_nodes(nodes)
+        if isinstance(error, RunCancelledError):
+            raise error
+
+    def cancel(self) -> bool:
+        """
+        Cancels the ongoing dispatch, through the same path as a node error.
+        Safe to call from another greenthread, such as a disconnect handler.
+        """
+        completions = self._completions
+        if completions is None:
+            return False
+        completions.put((None, RunCancelledError()))
+        return True
+
+    def dispatch_nodes(self, nodes: Dict[str, Node], is_done=False):
+        """
+        Run the nodes as a DAG, driven by completion events instead of polling.
+
+        Every greenthread reports its outcome in a queue. The scheduler blocks on
+        this queue, and as soon as a node completes, the children whose parents
+        are all completed are spawned. An error wakes the scheduler up the same way:
+        the dispatch stops, and the nodes still running are cancelled right away so
+        that their pool slots and provider quota are released. A call to cancel
+        stops the dispatch the same way.
+
+        Returns the error raised by the failing node, or a RunCancelledError if the
+        run was cancelled.
+        """
         pool = eventlet.GreenPool(AsyncProcessorLauncher.GREENTHREAD_POOL_SIZE)
+        completions = LightQueue()
+        self._completions = completions
+        self.register_run()
+        try:
+            return self._dispatch_nodes(pool, completions, nodes, is_done)
+        finally:
+            self._completions = None
+            self.unregister_run()
 
+    def _dispatch_nodes(self, pool, completions, nodes: Dict[str, Node], is_done):
         logging.debug(nodes)
 
-        initialized_nodes = set()
+        remaining_count = len(nodes)
+        running_greenthreads = {}
+        error = None
 
-        while nodes:
-            error_detected = any(
-                node.state == AsyncProcessorLauncher.NodeState.ERROR
-                for node in nodes.values()
+        def spawn(node):
+            logging.debug(f"Spawning green thread for node {node.id}.")
+            node.is_scheduled = True
+            running_greenthreads[node.id] = pool.spawn(
+                self.run_node, node, completions, is_done
             )
-
-            if error_detected:
-                logging.debug("A node is in ERROR state. Halting processing.")
+            # Streaming children can start as soon as their parent is running
+            for child in node.stream_children:
+                child.pending_parents_count -= 1
+                if child.is_ready():
+                    spawn(child)
+
+        for node in nodes.values():
+            if node.is_ready():
+                spawn(node)
+
+        while remaining_count > 0 and running_greenthreads:
+            node, error = completions.get()
+            if node is not None:
+                running_greenthreads.pop(node.id, None)
+
+            if isinstance(error, RunCancelledError):
+                logging.debug("Run cancelled. Halting processing.")
+                running_count = len(running_greenthreads)
+                self.cancel_running_nodes(nodes, running_greenthreads)
+                self.record_reclaimed_work(
+                    running_count, remaining_count - running_count
+                )
                 break
 
-            for id, node in nodes.items():
-                if (
-                    node.state == AsyncProcessorLauncher.NodeState.PENDING
-                    and self.can_run(node, nodes)
-                    and id not in initialized_nodes
-                ):
-                    logging.debug(f"Spawning green thread for node {id}.")
-                    initialized_nodes.add(id)
-                    pool.spawn(self.run_node, node)
-
-            eventlet.sleep(0.5)
+            if error is not None:
+                logging.debug(f"Node {node.id} is in ERROR state. Halting processing.")
+                self.cancel_running_nodes(nodes, running_greenthreads)
+                break
 
-            nodes = self.remove_completed_nodes(nodes)
-            logging.debug(f"Remaining nodes: {[node.id for node in nodes.values()]}")
+            remaining_count -= 1
 
-        pool.waitall()
+            for child in node.children:
+                child.pending_parents_count -= 1
+                if child.is_ready():
+                    spawn(child)
 
-    def remove_completed_nodes(self, nodes: List[Node]):
-        return {
-            id: n
-            for id, n in nodes.items()
-            if n.state not in [AsyncProcessorLauncher.NodeState.COMPLETED]
-        }
-
-    def can_run(self, node: Node, nodes: List[Node]):
-        # If parents aren't in the list, then the node can run
-        return all(parent_id not in nodes for parent_id in node.parent_ids)
+            logging.debug(f"Remaining nodes: {remaining_count}")
 
-    def launch_processors_for_node(self, processors: List[Processor], node_name=None):
-        for processor in processors.values():
-            if processor.get_output() is None or processor.name == node_name:
-                processor.add_observer(self)
-                self.run_processor(processor)
+        if remaining_count > 0 and error is None:
+            logging.warning(
+                f"{remaining_count} node(s) could not be reached, the flow may contain a cycle."
+            )
 
-            if processor.name == node_name:
-                break
+        pool.waitall()
 
-    def run_processor(self, processor: "Processor"):
+        return error
+
+    def cancel_running_nodes(self, nodes: Dict[str, Node], running_greenthreads):
+        """
+        Kill the greenthreads of the running nodes, which frees their pool slots at once,
+        then cancel their processors in the background (closing streams, cancelling
+        remote predictions...), since a cancellation may itself need an API call.
+        """
+        for node_id, greenthread in running_greenthreads.items():
+            node = nodes[node_id]
+            node.state = AsyncProcessorLauncher.NodeState.CANCELLED
+            node.get_processor().is_cancelled = True
+            greenthread.kill()
+            eventlet.spawn_n(self.cancel_processor, node.get_processor())
+            logging.debug(f"Node {node_id} cancelled.")
+        running_greenthreads.clear()
+
+    def cancel_processor(self, processor: Processor):
         try:
-            self.notify_current_node_running(processor)
+            processor.cancel()
+        except Exception as e:
+            logging.warning(f"Failed to cancel processor {processor.name}: {e}")
 
-            start_time = time.time()
-            output = processor.process_and_update()
+    def launch_processors_for_node(
+        self, processors: Dict[str, Processor], node_name=None
+    ):
+        processors_to_run = self.get_processors_to_run(processors, node_name)
 
-            end_time = time.time()
-            duration = end_time - start_time
-            self.notify_progress(processor, output, duration=duration, isDone=True)
-        except Exception as e:
-            self.notify_error(processor, e)
-            raise e
+        for processor in processors_to_run.values():
+            processor.add_observer(self)
+
+        nodes = self.convert_processors_to_node_dict(processors_to_run)
+
+        self.incremental = False
+        error = self.dispatch_nodes(nodes, is_done=True)
+        if error is not None:
+            raise error
+
+    def get_processors_to_run(self, processors: Dict[str, Processor], node_name=None):
+        """
+        Select the processors that need to run for node_name to be processed.
+
+        The node itself always runs. Its ancestors run only if they have no output yet,
+        and the ancestors of a node whose output was supplied are not needed at all.
+        """
+        target = processors.get(node_name)
+        if target is None:
+            return {
+                name: processor
+                for name, processor in processors.items()
+                if processor.get_output() is None
+            }
+
+        processors_to_run = {target.name: target}
+        to_visit = [target]
+        while to_visit:
+            processor = to_visit.pop()
+            for input_processor in processor.get_input_processors():
+                if (
+                    input_processor.name not in processors_to_run
+                    and input_processor.get_output() is None
+                ):
+                    processors_to_run[input_processor.name] = input_processor
+                    to_visit.append(input_processor)
+        return processors_to_run
 
-    def run_node(self, node: Node):
+    def run_node(self, node: Node, completions=None, is_done=False):
+        error = None
         try:
             processor = node.get_processor()
+            processor.is_map_output = self.get_map_config(processor) is not None
             self.notify_current_node_running(processor)
 
             start_time = time.time()
-            output = node.run()
+            # The inputs of a node reading a stream are not complete yet
+            fingerprint = (
+                None
+                if node.has_input_stream
+                else self.get_output_fingerprint(processor)
+            )
+            output, cache_status = self.get_reusable_output(processor, fingerprint)
+            if cache_status == CacheStatus.HIT:
+                output = node.complete_with_output(output)
+            else:
+                output = self.run_node_with_deadline(node)
+                self.store_output(processor, fingerprint, output, cache_status)
+            if node.stream_forwarder is not None:
+                node.stream_forwarder.finish(output)
             end_time = time.time()
             duration = end_time - start_time
-            self.notify_progress(node.get_processor(), output, duration=duration)
+            self.notify_progress(
+                node.get_processor(),
+                output,
+                duration=duration,
+                isDone=is_done,
+                cache_status=cache_status,
+            )
         except Exception as e:
+            error = e
+            if node.stream_forwarder is not None:
+                node.stream_forwarder.fail(e)
             node.state = AsyncProcessorLauncher.NodeState.ERROR
             self.notify_error(node.get_processor(), e)
             traceback.print_exc()
-            raise e
+            if completions is None:
+                raise e
+        finally:
+            for channel in node.input_channels:
+                channel.abandon()
+            if completions is not None:
+                completions.put((node, error))
+
+    def run_node_with_deadline(self, node: Node):
+        """
+        Run the node within the earliest of its timeout and the flow deadline.
+        The processor gets the deadline to bound its own API calls, and is cancelled
+        if it is exceeded anyway.
+        """
+        processor = node.get_processor()
+        process = self.get_node_process(processor)
+        deadline = self.get_node_deadline(processor)
+        if deadline is None:
+            return node.run(process)
+
+        processor.deadline = deadline
+        remaining_time = deadline - time.time()
+        if remaining_time <= 0:
+            raise NodeTimeoutError(processor.name)
+
+        timeout_error = NodeTimeoutError(processor.name)
+        try:
+            with eventlet.Timeout(remaining_time, timeout_error):
+                return node.run(process)
+        except NodeTimeoutError as e:
+            if e is timeout_error:
+                processor.is_cancelled = True
+                eventlet.spawn_n(self.cancel_processor, processor)
+            raise
+
+    def get_map_config(self, processor: Processor) -> Optional[MapConfig]:
+        if self.flow_graph is None:
+            return None
+        return MapConfig.from_node_config(self.flow_graph.get_config(processor.name))
+
+    def get_node_process(self, processor: Processor):
+        """The function running the node: the processor itself, or a map over its inputs."""
+        map_config = self.get_map_config(processor)
+        if map_config is None:
+            return None
+        config = self.flow_graph.get_config(processor.name)
+        return lambda: self.run_map(processor, config, map_config)
+
+    def run_map(self, processor: Processor, config, map_config: MapConfig):
+        """
+        Run one processor instance per element of the mapped inputs, at most
+        map_config.concurrency at a time, and collect their outputs in a list.
+
+        A progress event is sent for every item. Failed items are handled according
+        to the error policy; with the "fail" policy, the first failure cancels the
+        other items and fails the node.
+        """
+        input_processors = processor.get_input_processors()
+        item_count = min(
+            len(input_processors[index].get_output() or [])
+            for index in map_config.mapped_input_indexes
+        )
+
+        pool = eventlet.GreenPool(map_config.concurrency)
+        outputs = [None] * item_count
+        failed_indexes = set()
+        running_items = {}
+        errors = []
+
+        def run_item(index):
+            try:
+                item_processor = self.processor_factory.create_processor(
+                    map_config.create_item_config(config, index),
+                    self.context,
+                    self.storage_strategy,
+                )
+                for input_processor in input_processors:
+                    item_processor.add_input_processor(input_processor)
+                item_processor.deadline = processor.deadline
+                running_items[index] = (eventlet.getcurrent(), item_processor)
+
+                outputs[index] = item_processor.process_and_update()
+                self.notify_map_item_progress(
+                    processor, index, item_count, output=outputs[index]
+                )
+            except Exception as e:
+                failed_indexes.add(index)
+                self.notify_map_item_progress(processor, index, item_count, error=e)
+                if map_config.error_policy == MapErrorPolicy.FAIL and not errors:
+                    errors.append(MapItemError(processor.name, index, e))
+                    running_items.pop(index, None)
+                    self.cancel_map_items(running_items)
+            finally:
+                running_items.pop(index, None)
+
+        try:
+            for index in range(item_count):
+                if errors:
+                    break
+                pool.spawn(run_item, index)
+            pool.waitall()
+        finally:
+            self.cancel_map_items(running_items)
+
+        if errors:
+            raise errors[0]
+
+        if map_config.error_policy == MapErrorPolicy.SKIP:
+            outputs = [
+                output
+                for index, output in enumerate(outputs)
+                if index not in failed_indexes
+            ]
+        processor.set_output(outputs)
+        return outputs
+
+    def cancel_map_items(self, running_items):
+        current = eventlet.getcurrent()
+        for greenthread, item_processor in list(running_items.values()):
+            item_processor.is_cancelled = True
+            if greenthread is not current:
+                greenthread.kill()
+            eventlet.spawn_n(self.cancel_processor, item_processor)
+        running_items.clear()
 
     def notify(self, event: EventType, data: ProcessorEvent):
         if event == EventType.STREAMING:
             self.notify_streaming(data.source, data.output)
+            if self.stream_forwarders:
+                forwarder = self.stream_forwarders.get(data.source.name)
+                if forwarder is not None:
+                    forwarder.forward(data.output)
@@ -1,3 +1,4 @@
+from ..cache.node_output_cache import CacheStatus
 from .abstract_topological_processor_launcher import AbstractTopologicalProcessorLauncher
 
 
@@ -8,12 +9,19 @@ class BasicProcessorLauncher(AbstractTopologicalProcessorLauncher):
     A class that launches processors based on configuration data.
     """
 
-    def launch_processors(self, processors):
+    def launch_processors(self, processors, incremental=False):
+        self.set_incremental(incremental)
         for processor in processors.values():
             self.notify_current_node_running(processor)
             try :
-                    output = processor.process()
-                    self.notify_progress(processor, output)
+                    fingerprint = self.get_output_fingerprint(processor)
+                    output, cache_status = self.get_reusable_output(processor, fingerprint)
+                    if cache_status == CacheStatus.HIT:
+                        processor.set_output(output)
+                    else:
+                        output = processor.process()
+                        self.store_output(processor, fingerprint, output, cache_status)
+                    self.notify_progress(processor, output, cache_status=cache_status)
                     
             except Exception as e:
                 self.notify_error(processor, e)
@@ -6,3 +6,4 @@ class EventType(Enum):
     STREAMING = "streaming"
     CURRENT_NODE_RUNNING = "current_node_running"
     ERROR = "error"
+    MAP_ITEM_PROGRESS = "map_item_progress"
@@ -0,0 +1,133 @@
+from collections import deque
+from typing import Any, Dict, List, Optional, Set
+
+
+class FlowCycleError(ValueError):
+    """Exception raised when the nodes of a flow are linked in a cycle."""
+
+    def __init__(self, node_names: List[str]):
+        self.node_names = node_names
+        super().__init__(
+            "The flow contains a cycle, so it cannot be run. "
+            f"Please remove one of the links between these nodes : {', '.join(node_names)}"
+        )
+
+
+class FlowGraph:
+    """
+    Indexed view of a flow configuration, built once per request.
+
+    Holds the node configs by name, the parents and children of every node, and a
+    topological order of the nodes (parents first). Inputs pointing to unknown nodes
+    are kept in the parents list but are not part of the graph edges.
+
+    Raises:
+        FlowCycleError: If the nodes are linked in a cycle.
+    """
+
+    config_data: List[Dict[str, Any]]
+    configs_by_name: Dict[str, Dict[str, Any]]
+    parents: Dict[str, List[str]]
+    children: Dict[str, List[str]]
+    topological_order: List[str]
+
+    def __init__(self, config_data: List[Dict[str, Any]]) -> None:
+        self.config_data = config_data
+        self.configs_by_name = {config["name"]: config for config in config_data}
+        self.parents = {}
+        self.children = {name: [] for name in self.configs_by_name}
+
+        for name, config in self.configs_by_name.items():
+            parents = []
+            for input in config.get("inputs") or []:
+                parent_name = input.get("inputNode")
+                if parent_name in parents:
+                    continue
+                parents.append(parent_name)
+                if parent_name in self.children:
+                    self.children[parent_name].append(name)
+            self.parents[name] = parents
+
+        self.topological_order = self._sort_topologically()
+        self._topological_index = {
+            name: index for index, name in enumerate(self.topological_order)
+        }
+
+    def _sort_topologically(self) -> List[str]:
+        pending_parents_count = {
+            name: len([parent for parent in parents if parent in self.configs_by_name])
+            for name, parents in self.parents.items()
+        }
+        ready = deque(
+            name for name, count in pending_parents_count.items() if not count
+        )
+
+        order = []
+        while ready:
+            name = ready.popleft()
+            order.append(name)
+            for child in self.children[name]:
+                pending_parents_count[child] -= 1
+                if pending_parents_count[child] == 0:
+                    ready.append(child)
+
+        if len(order) != len(self.configs_by_name):
+            sorted_names = set(order)
+            raise FlowCycleError(
+                self._get_names_in_cycles(
+                    {name for name in self.configs_by_name if name not in sorted_names}
+                )
+            )
+        return order
+
+    def _get_names_in_cycles(self, unsorted_names: Set[str]) -> List[str]:
+        """
+        The nodes left unsorted that are part of a cycle, that is the nodes which can
+        reach themselves. The other ones are only downstream of a cycle.
+        """
+        names_in_cycles = []
+        for name in self.configs_by_name:
+            if name not in unsorted_names:
+                continue
+            visited = set()
+            to_visit = list(self.children[name])
+            while to_visit:
+                child = to_visit.pop()
+                if child == name:
+                    names_in_cycles.append(name)
+                    break
+                if child in unsorted_names and child not in visited:
+                    visited.add(child)
+                    to_visit.extend(self.children[child])
+        return names_in_cycles
+
+    def has_node(self, node_name: str) -> bool:
+        return node_name in self.configs_by_name
+
+    def get_config(self, node_name: str) -> Optional[Dict[str, Any]]:
+        return self.configs_by_name.get(node_name)
+
+    def get_parents(self, node_name: str) -> List[str]:
+        return self.parents.get(node_name, [])
+
+    def get_children(self, node_name: str) -> List[str]:
+        return self.children.get(node_name, [])
+
+    def get_ancestors(self, node_name: str) -> Set[str]:
+        """Names of the nodes the given node depends on, directly or not."""
+        ancestors = set()
+        to_visit = [node_name]
+        while to_visit:
+            for parent_name in self.get_parents(to_visit.pop()):
+                if parent_name in self.configs_by_name and parent_name not in ancestors:
+                    ancestors.add(parent_name)
+                    to_visit.append(parent_name)
+        return ancestors
+
+    def get_related_node_names(self, node_name: str) -> List[str]:
+        """The node and its ancestors, in topological order."""
+        if node_name not in self.configs_by_name:
+            return []
+        related = self.get_ancestors(node_name)
+        related.add(node_name)
+        return sorted(related, key=self._topological_index.__getitem__)
@@ -0,0 +1,98 @@
+import logging
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Dict, List, Optional
+
+
+class MapErrorPolicy(Enum):
+    FAIL = "fail"
+    """The node fails as soon as one item fails, and the other items are cancelled"""
+
+    SKIP = "skip"
+    """Failed items are left out of the output"""
+
+    NULL = "null"
+    """Failed items are kept in the output as None, so indexes still match the input"""
+
+
+@dataclass
+class MapConfig:
+    """
+    Settings of a node run in "map" execution mode: one processor instance per
+    element of the mapped inputs, run in parallel, the outputs collected in a list.
+    """
+
+    mapped_input_indexes: List[int]
+    concurrency: int
+    error_policy: MapErrorPolicy
+
+    EXECUTION_MODE = "map"
+    DEFAULT_CONCURRENCY = 4
+    MAX_CONCURRENCY = 16
+
+    @staticmethod
+    def from_node_config(config: Dict[str, Any]) -> Optional["MapConfig"]:
+        """
+        Reads the map settings of a node config, None if the node is not in map mode.
+
+        The mapped inputs are the ones flagged with "mapOver", or the first input if none is.
+        """
+        if config is None or config.get("executionMode") != MapConfig.EXECUTION_MODE:
+            return None
+
+        inputs = config.get("inputs") or []
+        if not inputs:
+            return None
+
+        mapped_input_indexes = [
+            index for index, input in enumerate(inputs) if input.get("mapOver")
+        ]
+        if not mapped_input_indexes:
+            mapped_input_indexes = [0]
+
+        try:
+            concurrency = int(
+                config.get("mapConcurrency") or MapConfig.DEFAULT_CONCURRENCY
+            )
+        except (TypeError, ValueError):
+            logging.warning(
+                f"Invalid mapConcurrency for {config.get('name')}, using the default"
+            )
+            concurrency = MapConfig.DEFAULT_CONCURRENCY
+        concurrency = max(1, min(concurrency, MapConfig.MAX_CONCURRENCY))
+
+        try:
+            error_policy = MapErrorPolicy(
+                config.get("mapErrorPolicy") or MapErrorPolicy.FAIL.value
+            )
+        except ValueError:
+            raise ValueError(
+                f"Unknown mapErrorPolicy '{config.get('mapErrorPolicy')}', expected one of "
+                f"{', '.join(policy.value for policy in MapErrorPolicy)}"
+            )
+
+        return MapConfig(mapped_input_indexes, concurrency, error_policy)
+
+    def create_item_config(self, config: Dict[str, Any], index: int) -> Dict[str, Any]:
+        """The config of the processor instance running the item at the given index."""
+        item_config = dict(config)
+        item_config["inputs"] = [
+            (
+                dict(input, inputNodeOutputKey=index)
+                if input_index in self.mapped_input_indexes
+                else dict(input)
+            )
+            for input_index, input in enumerate(config.get("inputs") or [])
+        ]
+        item_config.pop("executionMode", None)
+        return item_config
+
+
+class MapItemError(Exception):
+    """Exception raised when an item of a node run in map mode fails."""
+
+    def __init__(self, node_name: str, index: int, error: Exception):
+        self.node_name = node_name
+        self.index = index
+        self.error = error
+        super().__init__(f"Item {index} of node {node_name} failed: {error}")
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import Optional
 
 from ..context.processor_context import ProcessorContext
 
@@ -13,7 +14,7 @@ class ProcessorLauncher(ABC):
         pass
 
     @abstractmethod
-    def launch_processors(self, processor):
+    def launch_processors(self, processor, incremental=False):
         pass
 
     @abstractmethod
@@ -23,3 +24,12 @@ class ProcessorLauncher(ABC):
     @abstractmethod
     def set_context(self, context: ProcessorContext):
         pass
+
+    @abstractmethod
+    def set_deadline(self, deadline: Optional[float]):
+        pass
+
+    @abstractmethod
+    def cancel(self) -> bool:
+        """Cancels the ongoing run, returns False if there is nothing to cancel."""
+        pass
@@ -15,3 +15,6 @@ class ProcessorLauncherEvent:
     error: str = field(default=None)
     session_id: str = field(default=None)
     duration: float = field(default=0)
+    cache_status: str = field(default=None)
+    item_index: int = field(default=None)
+    item_count: int = field(default=None)
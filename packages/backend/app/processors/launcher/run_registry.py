@@ -0,0 +1,87 @@
+import logging
+import threading
+from typing import Dict, Set
+
+from injector import singleton
+
+
+class RunCancelledError(Exception):
+    """Exception raised when a run is cancelled before all its nodes are processed."""
+
+    def __init__(self, message="The run has been cancelled."):
+        self.message = message
+        super().__init__(self.message)
+
+
+@singleton
+class RunRegistry:
+    """
+    Registry of the launchers currently running a flow, per session.
+
+    Lets a session cancel its running flows, when the client disconnects or
+    asks for it, and counts the work reclaimed by these cancellations.
+    """
+
+    def __init__(self):
+        self._runs: Dict[str, Set] = {}
+        self._lock = threading.Lock()
+        self._metrics = {
+            "cancelled_runs": 0,
+            "cancelled_running_nodes": 0,
+            "skipped_pending_nodes": 0,
+        }
+
+    def register(self, session_id, launcher) -> None:
+        with self._lock:
+            self._runs.setdefault(session_id, set()).add(launcher)
+
+    def unregister(self, session_id, launcher) -> None:
+        with self._lock:
+            launchers = self._runs.get(session_id)
+            if launchers is None:
+                return
+            launchers.discard(launcher)
+            if not launchers:
+                del self._runs[session_id]
+
+    def get_running_count(self, session_id) -> int:
+        with self._lock:
+            return len(self._runs.get(session_id, ()))
+
+    def cancel_session(self, session_id) -> int:
+        """
+        Cancels every run of the session.
+
+        Returns:
+            int: The number of runs cancelled.
+        """
+        with self._lock:
+            launchers = list(self._runs.pop(session_id, ()))
+
+        cancelled_count = 0
+        for launcher in launchers:
+            try:
+                if launcher.cancel():
+                    cancelled_count += 1
+            except Exception as e:
+                logging.warning(f"Failed to cancel a run of session {session_id}: {e}")
+
+        if cancelled_count > 0:
+            logging.info(f"Cancelled {cancelled_count} run(s) of session {session_id}")
+        return cancelled_count
+
+    def record_reclaimed_work(self, running_nodes_count: int, pending_nodes_count: int):
+        """Called by a launcher once its run is cancelled."""
+        with self._lock:
+            self._metrics["cancelled_runs"] += 1
+            self._metrics["cancelled_running_nodes"] += running_nodes_count
+            self._metrics["skipped_pending_nodes"] += pending_nodes_count
+            metrics = dict(self._metrics)
+        logging.info(
+            f"Run cancelled: {running_nodes_count} running node(s) stopped, "
+            f"{pending_nodes_count} pending node(s) skipped. Total reclaimed: {metrics}"
+        )
+
+    def get_metrics(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._metrics)
@@ -0,0 +1,102 @@
+import logging
+from typing import Iterator, List, Optional
+
+from eventlet.queue import LightQueue
+
+
+class StreamChannel:
+    """
+    Bounded channel carrying the text of a node to a child reading it while it is produced.
+
+    The producer puts text deltas and closes the channel when its output is complete, or
+    with an error if it failed. The consumer iterates over the deltas, and the error, if
+    any, is raised at the end of the iteration.
+
+    Once the consumer reads, a full channel blocks the producer until it catches up.
+    Before that, the deltas are buffered, so that a producer never waits for a consumer
+    which is not running yet. After the consumer is done, the deltas are dropped.
+    """
+
+    DEFAULT_MAX_SIZE = 256
+
+    _END = object()
+
+    def __init__(self, max_size: int = DEFAULT_MAX_SIZE):
+        self._queue = LightQueue()
+        self._max_size = max_size
+        self._closed = False
+        self._abandoned = False
+        self._error = None
+
+    def put(self, delta: str) -> None:
+        if self._closed or self._abandoned or not delta:
+            return
+        self._queue.put(delta)
+
+    def abandon(self) -> None:
+        """Called once the consumer is done, to never block the producer again."""
+        self._abandoned = True
+        self._queue.resize(None)
+
+    def close(self, error: Optional[Exception] = None) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        self._error = error
+        self._queue.put(StreamChannel._END)
+
+    def __iter__(self) -> Iterator[str]:
+        if not self._abandoned:
+            self._queue.resize(self._max_size)
+        while True:
+            delta = self._queue.get()
+            if delta is StreamChannel._END:
+                break
+            yield delta
+        if self._error is not None:
+            raise self._error
+
+    def read_all(self) -> str:
+        return "".join(self)
+
+
+class StreamForwarder:
+    """
+    Turns the STREAMING events of a node, which carry the whole text received so far,
+    into deltas put in the channels of its streaming children.
+    """
+
+    def __init__(self):
+        self.channels: List[StreamChannel] = []
+        self._sent_text = ""
+
+    def add_channel(self, channel: StreamChannel) -> None:
+        self.channels.append(channel)
+
+    def forward(self, text) -> None:
+        if not isinstance(text, str) or len(text) <= len(self._sent_text):
+            return
+        if not text.startswith(self._sent_text):
+            logging.warning(
+                "Streamed text does not extend the text already forwarded, ignoring it"
+            )
+            return
+        delta = text[len(self._sent_text) :]
+        self._sent_text = text
+        for channel in self.channels:
+            channel.put(delta)
+
+    def finish(self, output) -> None:
+        """Forwards what is left of the final output and closes the channels."""
+        if isinstance(output, list):
+            output = output[0] if len(output) > 0 else None
+        if output is not None and not isinstance(output, str):
+            output = str(output)
+        if output is not None:
+            self.forward(output)
+        for channel in self.channels:
+            channel.close()
+
+    def fail(self, error: Exception) -> None:
+        for channel in self.channels:
+            channel.close(error)
@@ -41,6 +41,13 @@ class SocketIOEventEmitter(Observer):
         if data.error is not None:
             json_event["error"] = str(data.error)
 
+        if data.cache_status is not None:
+            json_event["cacheStatus"] = data.cache_status
+
+        if data.item_index is not None:
+            json_event["itemIndex"] = data.item_index
+            json_event["itemCount"] = data.item_count
+
         try:
             socketio.emit(event, json_event, to=data.session_id)
             logging.debug(
@@ -1,5 +1,5 @@
 from typing import List
-from injector import Injector, Binder, Module
+from injector import Injector, Binder, InstanceProvider, Module
 from tests.utils.processor_factory_mock import ProcessorFactoryMock
 from app.processors.launcher.async_processor_launcher import AsyncProcessorLauncher
 
@@ -8,7 +8,16 @@ from app.processors.observer.observer import Observer
 from app.storage.local_storage_strategy import LocalStorageStrategy
 from app.storage.s3_storage_strategy import S3StorageStrategy
 from app.storage.storage_strategy import StorageStrategy
-from app.env_config import is_mock_env, is_s3_enabled
+from app.processors.cache.node_output_cache import NodeOutputCache
+from app.processors.cache.memory_node_output_cache import InMemoryNodeOutputCache
+from app.processors.cache.disk_node_output_cache import DiskNodeOutputCache
+from app.processors.cache.flow_run_store import FlowRunStore
+from app.processors.launcher.run_registry import RunRegistry
+from app.env_config import (
+    get_node_output_cache_backend,
+    is_mock_env,
+    is_s3_enabled,
+)
 from app.processors.factory.processor_factory import ProcessorFactory
 from app.processors.factory.processor_factory_iter_modules import (
     ProcessorFactoryIterModules,
@@ -36,6 +45,34 @@ class StorageModule(Module):
             binder.bind(StorageStrategy, to=LocalStorageStrategy)
 
 
+class NodeOutputCacheModule(Module):
+    def configure(self, binder: Binder):
+        backend = get_node_output_cache_backend()
+        if backend == "memory":
+            logging.info("Using in-memory node output cache")
+            binder.bind(NodeOutputCache, to=InMemoryNodeOutputCache)
+        elif backend == "disk":
+            logging.info("Using on-disk node output cache")
+            binder.bind(NodeOutputCache, to=DiskNodeOutputCache)
+        else:
+            binder.bind(NodeOutputCache, to=InstanceProvider(None))
+
+
+_run_registry = RunRegistry()
+_flow_run_store = FlowRunStore()
+
+
+class RunStateModule(Module):
+    """
+    The running flows and the outputs of the last runs are kept when the injector
+    is refreshed, so that they can still be cancelled and reused.
+    """
+
+    def configure(self, binder: Binder):
+        binder.bind(RunRegistry, to=InstanceProvider(_run_registry))
+        binder.bind(FlowRunStore, to=InstanceProvider(_flow_run_store))
+
+
 class ProcessorLauncherModule(Module):
     def configure(self, binder: Binder):
         binder.bind(ProcessorLauncher, to=AsyncProcessorLauncher)
@@ -49,6 +86,8 @@ def create_application_injector() -> Injector:
         [
             ProcessorFactoryModule(),
             StorageModule(),
+            NodeOutputCacheModule(),
+            RunStateModule(),
             ProcessorLauncherModule(),
         ],
         auto_bind=True,
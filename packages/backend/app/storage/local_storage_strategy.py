@@ -1,5 +1,9 @@
 from typing import Any
-from ..storage.storage_strategy import StorageStrategy
+from ..storage.storage_strategy import (
+    StorageStrategy,
+    StreamSource,
+    iter_stream_chunks,
+)
 from werkzeug.utils import secure_filename
 import os
 from app.env_config import (
@@ -26,6 +30,18 @@ class LocalStorageStrategy(StorageStrategy):
 
         return self.get_url(secure_name)
 
+    def save_stream(self, filename: str, source: StreamSource) -> str:
+        if not os.path.exists(self.LOCAL_DIR):
+            os.makedirs(self.LOCAL_DIR)
+
+        secure_name = secure_filename(filename)
+        filepath = os.path.join(self.LOCAL_DIR, secure_name)
+        with open(filepath, "wb") as f:
+            for chunk in iter_stream_chunks(source):
+                f.write(chunk)
+
+        return self.get_url(secure_name)
+
     def get_url(self, filename: str) -> str:
         port = os.getenv("PORT")
         return f"http://localhost:{port}/image/{filename}"
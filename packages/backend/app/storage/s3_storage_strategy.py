@@ -1,9 +1,12 @@
 import logging
 from typing import Any
 import uuid
-from ..storage.storage_strategy import CloudStorageStrategy
-import boto3
-from botocore.config import Config
+from ..storage.storage_strategy import (
+    CloudStorageStrategy,
+    StreamSource,
+    iter_stream_chunks,
+)
+from ..env_config import get_s3_upload_part_size
 import os
 from datetime import timedelta
 from injector import singleton
@@ -21,6 +24,10 @@ class S3StorageStrategy(CloudStorageStrategy):
     MAX_POOL_CONNECTIONS = int(os.getenv("MAX_POOL_CONNECTIONS", "100"))
 
     def __init__(self):
+        # Imported here so that boto3 is only loaded when S3 is enabled
+        import boto3
+        from botocore.config import Config
+
         self.BUCKET_NAME = os.getenv("S3_BUCKET_NAME")
         endpoint_url = os.getenv("S3_ENDPOINT_URL")
 
@@ -56,6 +63,74 @@ class S3StorageStrategy(CloudStorageStrategy):
 
         return url
 
+    def save_stream(
+        self,
+        filename: str,
+        source: StreamSource,
+        bucket_name: str = None,
+        part_size: int = None,
+    ) -> str:
+        """
+        Uploads the source with a multipart upload, buffering a single part at a time.
+        A source smaller than one part is sent with a simple put_object.
+        """
+        if bucket_name is None:
+            bucket_name = self.BUCKET_NAME
+        if part_size is None:
+            part_size = get_s3_upload_part_size()
+
+        chunks = iter_stream_chunks(source)
+        buffer = bytearray()
+        for chunk in chunks:
+            buffer += chunk
+            if len(buffer) >= part_size:
+                break
+        else:
+            return self.save(filename, bytes(buffer), bucket_name)
+
+        upload_id = self.s3_client.create_multipart_upload(
+            Bucket=bucket_name, Key=filename
+        )["UploadId"]
+        parts = []
+
+        def upload_part(body):
+            part_number = len(parts) + 1
+            response = self.s3_client.upload_part(
+                Bucket=bucket_name,
+                Key=filename,
+                UploadId=upload_id,
+                PartNumber=part_number,
+                Body=body,
+            )
+            parts.append({"ETag": response["ETag"], "PartNumber": part_number})
+
+        try:
+            while len(buffer) >= part_size:
+                upload_part(bytes(buffer[:part_size]))
+                del buffer[:part_size]
+            for chunk in chunks:
+                buffer += chunk
+                while len(buffer) >= part_size:
+                    upload_part(bytes(buffer[:part_size]))
+                    del buffer[:part_size]
+            if buffer:
+                upload_part(bytes(buffer))
+
+            self.s3_client.complete_multipart_upload(
+                Bucket=bucket_name,
+                Key=filename,
+                UploadId=upload_id,
+                MultipartUpload={"Parts": parts},
+            )
+        except Exception:
+            logging.warning(f"Aborting the multipart upload of {filename}")
+            self.s3_client.abort_multipart_upload(
+                Bucket=bucket_name, Key=filename, UploadId=upload_id
+            )
+            raise
+
+        return self.get_url(filename, bucket_name)
+
     def get_upload_link(self, filename=None) -> str:
         file_key = f"uploads/{uuid.uuid4()}"
 
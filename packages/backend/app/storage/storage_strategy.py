@@ -1,5 +1,25 @@
 from abc import ABC, abstractmethod
-from typing import Any, Optional
+from typing import Any, BinaryIO, Iterable, Iterator, Optional, Union
+
+StreamSource = Union[BinaryIO, Iterable[bytes]]
+
+STREAM_CHUNK_SIZE = 64 * 1024
+
+
+def iter_stream_chunks(
+    source: StreamSource, chunk_size: int = STREAM_CHUNK_SIZE
+) -> Iterator[bytes]:
+    """Chunks of a streaming source, either a readable file object or an iterable of bytes."""
+    if hasattr(source, "read"):
+        while True:
+            chunk = source.read(chunk_size)
+            if not chunk:
+                return
+            yield chunk
+    else:
+        for chunk in source:
+            if chunk:
+                yield chunk
 
 
 class StorageStrategy(ABC):
@@ -10,6 +30,11 @@ class StorageStrategy(ABC):
     def save(self, filename: str, data: Any) -> Optional[str]:
         pass
 
+    def save_stream(self, filename: str, source: StreamSource) -> Optional[str]:
+        """Saves a streaming source. Strategies able to write it chunk by chunk override
+        this default, which reads the whole source in memory."""
+        return self.save(filename, b"".join(iter_stream_chunks(source)))
+
     @abstractmethod
     def get_url(self, filename: str) -> str:
         pass
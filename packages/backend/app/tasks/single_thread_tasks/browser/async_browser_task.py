@@ -1,13 +1,26 @@
 import logging
+import queue
 import re
 import asyncio
 import threading
 from ....utils.web_scrapping.async_browser_manager import (
     AsyncBrowserManager,
 )
+from ....env_config import is_browser_fast_scrape_mode_enabled
+from ....utils.fetch_coordinator import get_fetch_coordinator
+from ....utils.web_scrapping.request_blocking import RequestBlocker, wait_for_content
+from ...task_exception import BrowserTaskError
+from ...task_utils import wait_for_result
+from .browser_task_dispatcher import BrowserTaskDispatcher
 
 browser_task_queue = None
+browser_manager = None
 event_loop = None
+event_loop_thread = None
+event_loop_ready = threading.Event()
+event_loop_thread_lock = threading.Lock()
+
+EVENT_LOOP_START_TIMEOUT = 30
 
 
 async def accept_cookies(page, cookies_consent_label, timeout=5000):
@@ -40,15 +53,24 @@ async def fetch_url_content(
     auto_consent_cookies=False,
     enable_ad_blocker=False,
     cookies_consent_label=None,
+    fast_mode=False,
 ):
-    page, context = await browser_manager.get_tab()
+    request_blocker = RequestBlocker.create(
+        fast_mode=fast_mode, enable_ad_blocker=enable_ad_blocker
+    )
+    page, context = await browser_manager.get_tab(request_blocker=request_blocker)
     try:
         await page.goto(url, timeout=30000, wait_until="domcontentloaded")
     except Exception as e:
         logging.error(f"Failed to load page: {str(e)}")
-        return ""
+        await browser_manager.release_tab(page, context)
+        raise BrowserTaskError(url, f"Failed to load page: {e}")
     try:
-        await page.wait_for_load_state("networkidle", timeout=10000)
+        try:
+            await wait_for_content(page, selectors=selectors, fast_mode=fast_mode)
+        except Exception as e:
+            logging.warning(f"Reading {url} before the page is settled: {str(e)}")
+
         content_attempts = 0
         max_attempts = 3
 
@@ -113,6 +135,7 @@ async def scrapping_task(task_data, browser_manager):
     cookies_consent_label = task_data.get("cookies_consent_label", None)
     auto_consent_cookies = task_data.get("auto_consent_cookies", False)
     enable_ad_blocker = task_data.get("enable_ad_blocker", False)
+    fast_mode = task_data.get("fast_mode", is_browser_fast_scrape_mode_enabled())
     content = await fetch_url_content(
         url,
         browser_manager,
@@ -123,6 +146,7 @@ async def scrapping_task(task_data, browser_manager):
         cookies_consent_label=cookies_consent_label,
         auto_consent_cookies=auto_consent_cookies,
         enable_ad_blocker=enable_ad_blocker,
+        fast_mode=fast_mode,
     )
     return content
 
@@ -132,28 +156,16 @@ async def add_task(task_data, result_queue):
 
 
 async def browser_task_worker():
-    global browser_task_queue
+    global browser_task_queue, browser_manager
     browser_task_queue = asyncio.Queue()
+    event_loop_ready.set()
     browser_manager = AsyncBrowserManager()
     await browser_manager.initialize_browser()
 
     logging.info("Starting browser task worker")
-    while True:
-        task_data, result_queue = await browser_task_queue.get()
-        if task_data is None:  # Exit signal
-            logging.info("Exiting browser task worker")
-            break
-        try:
-            result = await scrapping_task(task_data, browser_manager)
-            result_queue.put(result)
-        except Exception as e:
-            logging.error(f"Error in browser task worker: {e}")
-            import traceback
-
-            traceback.print_exc()
-
-
-event_loop = None
+    dispatcher = BrowserTaskDispatcher(browser_manager, scrapping_task)
+    await dispatcher.run(browser_task_queue)
+    logging.info("Exiting browser task worker")
 
 
 def start_event_loop():
@@ -170,12 +182,50 @@ def stop_event_loop():
     event_loop.close()
 
 
+def start_event_loop_thread():
+    """Starts the browser event loop on the first task, and waits for its queue."""
+    global event_loop_thread
+    with event_loop_thread_lock:
+        if event_loop_thread is None:
+            event_loop_thread = threading.Thread(target=start_event_loop)
+            event_loop_thread.start()
+
+    if not event_loop_ready.wait(timeout=EVENT_LOOP_START_TIMEOUT):
+        raise TimeoutError("The browser task worker did not start")
+
+
 def add_task_sync(task_data, result_queue):
+    """
+    Queues a scrapping task. The page content, or a BrowserTaskError if the task
+    failed, is put in result_queue.
+    """
+    start_event_loop_thread()
     future = asyncio.run_coroutine_threadsafe(
         add_task(task_data, result_queue), event_loop
     )
     return future
 
 
-event_loop_thread = threading.Thread(target=start_event_loop)
-event_loop_thread.start()
+def run_browser_task(task_data, timeout=120, is_cancelled=lambda: False, max_age=None):
+    """
+    Scraps the page of the task in the browser and returns its content. Goes through
+    the fetch coordinator, so that identical scrapes are made once and a host is not
+    loaded by too many tabs at once. Used by the URL input processor.
+    """
+
+    def scrap():
+        result_queue = queue.Queue()
+        add_task_sync(task_data, result_queue)
+        result = wait_for_result(result_queue, timeout=timeout)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    return get_fetch_coordinator().fetch(
+        task_data.get("url"),
+        scrap,
+        options=dict(task_data, loading_mode="browser"),
+        should_cache=bool,
+        is_cancelled=is_cancelled,
+        max_age=max_age,
+    )
@@ -0,0 +1,56 @@
+import asyncio
+import logging
+from typing import Awaitable, Callable, Optional
+
+from ...task_exception import BrowserTaskError
+
+
+class BrowserTaskDispatcher:
+    """
+    Runs the queued browser tasks concurrently, each one as its own asyncio task, with
+    at most max_concurrency of them running at once (the tabs of the browser manager
+    by default).
+
+    The result of a task is put in the result queue given with it. A failed task puts
+    a BrowserTaskError there instead, so that the caller does not wait for a result
+    that will never come.
+    """
+
+    def __init__(
+        self,
+        browser_manager,
+        run_task: Callable[[dict, object], Awaitable[str]],
+        max_concurrency: Optional[int] = None,
+    ):
+        self.browser_manager = browser_manager
+        self.run_task = run_task
+        self.max_concurrency = max_concurrency or browser_manager.pool_size
+        self.semaphore = asyncio.Semaphore(self.max_concurrency)
+        self.running_tasks = set()
+
+    async def run(self, task_queue: asyncio.Queue) -> None:
+        """Dispatches the tasks of the queue until the exit signal, a None task_data."""
+        while True:
+            task_data, result_queue = await task_queue.get()
+            if task_data is None:  # Exit signal
+                break
+
+            await self.semaphore.acquire()
+            task = asyncio.create_task(self._run_task(task_data, result_queue))
+            self.running_tasks.add(task)
+            task.add_done_callback(self.running_tasks.discard)
+
+        if self.running_tasks:
+            await asyncio.gather(*self.running_tasks, return_exceptions=True)
+
+    async def _run_task(self, task_data, result_queue) -> None:
+        try:
+            result = await self.run_task(task_data, self.browser_manager)
+        except Exception as e:
+            url = task_data.get("url")
+            logging.exception(f"Error in browser task for {url}")
+            result = e if isinstance(e, BrowserTaskError) else BrowserTaskError(url, e)
+        finally:
+            self.semaphore.release()
+
+        result_queue.put(result)
@@ -4,3 +4,12 @@ class TaskAlreadyRegisteredError(Exception):
     def __init__(self, task_name):
         self.task_name = task_name
         super().__init__(f"Task '{task_name}' is already registered.")
+
+
+class BrowserTaskError(Exception):
+    """Exception returned to the caller of a browser task that failed."""
+
+    def __init__(self, url, reason):
+        self.url = url
+        self.reason = reason
+        super().__init__(f"Browser task failed for '{url}': {reason}")
@@ -0,0 +1,104 @@
+"""
+Catalogue of the extension node configs served by /node/extensions.
+
+The filtered catalogue is serialised once, hashed, and compressed ahead of time, so
+that a page load only costs a validator check or a copy of the bytes. Brotli is used
+when the brotli package is installed, gzip otherwise.
+"""
+
+import gzip
+import hashlib
+import json
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Tuple
+
+from injector import singleton
+
+from ..env_config import get_extensions_blacklist, get_extensions_whitelist
+from .node_extension_utils import get_extensions, very_long_ttl_cache
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+GZIP_COMPRESS_LEVEL = 9
+BROTLI_QUALITY = 11
+
+
+def get_catalogue_env_key() -> Tuple:
+    """The environment the catalogue depends on, a change of it triggers a rebuild."""
+    return (tuple(get_extensions_whitelist()), tuple(get_extensions_blacklist()))
+
+
+@dataclass(frozen=True)
+class ExtensionCatalogue:
+    body: bytes
+    etag: str
+    env_key: Tuple
+    compressed_bodies: Dict[str, bytes] = field(default_factory=dict)
+    built_at: float = field(default_factory=time.time)
+
+    @classmethod
+    def build(cls, extensions, env_key=None) -> "ExtensionCatalogue":
+        body = json.dumps(
+            {"extensions": extensions}, sort_keys=True, separators=(",", ":")
+        ).encode("utf-8")
+        etag = hashlib.sha256(body).hexdigest()[:32]
+
+        compressed_bodies = {
+            "gzip": gzip.compress(body, compresslevel=GZIP_COMPRESS_LEVEL, mtime=0)
+        }
+        if brotli is not None:
+            compressed_bodies["br"] = brotli.compress(body, quality=BROTLI_QUALITY)
+
+        return cls(body, etag, env_key, compressed_bodies)
+
+    def is_valid(self, env_key, ttl=very_long_ttl_cache) -> bool:
+        """Valid for the same environment, and as long as the model lists it contains."""
+        return self.env_key == env_key and time.time() - self.built_at < ttl
+
+    def select_encoding(self, accept_encodings) -> Optional[str]:
+        """
+        Returns the best precompressed encoding accepted by the client, None for the
+        identity. accept_encodings is the werkzeug Accept of the request.
+        """
+        for encoding in ("br", "gzip"):
+            if encoding in self.compressed_bodies and accept_encodings[encoding]:
+                return encoding
+        return None
+
+    def get_body(self, encoding: Optional[str] = None) -> bytes:
+        if encoding is None:
+            return self.body
+        return self.compressed_bodies[encoding]
+
+
+@singleton
+class ExtensionCatalogueStore:
+    """
+    Holds the catalogue of the current root injector. A new one is built on the first
+    request after refresh_root_injector, when the extension filters change, or when
+    the model lists fetched by the extensions expire.
+    """
+
+    def __init__(self):
+        self._catalogue = None
+        self._lock = threading.Lock()
+
+    def get_catalogue(self) -> ExtensionCatalogue:
+        env_key = get_catalogue_env_key()
+        catalogue = self._catalogue
+        if catalogue is not None and catalogue.is_valid(env_key):
+            return catalogue
+
+        with self._lock:
+            if self._catalogue is None or not self._catalogue.is_valid(env_key):
+                self._catalogue = ExtensionCatalogue.build(get_extensions(), env_key)
+            return self._catalogue
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._catalogue = None
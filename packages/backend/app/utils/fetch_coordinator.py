@@ -0,0 +1,233 @@
+"""
+Coordination of the URL fetches made by the processors.
+
+The fetches of a host run at most max_per_host at a time, identical fetches in flight
+(same URL and options) are merged into one, and their result is kept for a short TTL.
+A caller may accept only younger results (max_age), 0 meaning none at all.
+A merged caller only gets the result or the error of the fetch itself: when the caller
+running it is cancelled or times out, another one runs the fetch again instead.
+The coordinator is shared by the greenthreads of the process, it waits with the
+eventlet primitives.
+"""
+
+import copy
+import hashlib
+import json
+import logging
+import time
+from typing import Any, Callable, Dict, Optional
+from urllib.parse import urlparse
+
+from cachetools import TTLCache
+import eventlet
+from eventlet.event import Event
+from eventlet.semaphore import Semaphore
+import requests
+
+from ..env_config import (
+    get_fetch_cache_max_entries,
+    get_fetch_cache_ttl,
+    get_fetch_coalesce_timeout,
+    get_fetch_max_concurrency_per_host,
+)
+
+_LEADER_GONE = object()
+"""Sent to the merged callers when the fetch in flight ended without an outcome"""
+
+_TIMED_OUT = object()
+
+
+def get_fetch_key(url: str, options: Optional[Dict[str, Any]] = None) -> str:
+    """Key of a fetch. Hashed, as the options may hold credentials (headers...)."""
+    raw_key = json.dumps([url, options or {}], sort_keys=True, default=str)
+    return hashlib.sha256(raw_key.encode("utf-8")).hexdigest()
+
+
+def get_host(url: str) -> str:
+    return (urlparse(url).hostname or "").lower()
+
+
+def is_timeout_error(error: Exception) -> bool:
+    """Errors bound to the deadline of the caller rather than to the URL."""
+    return isinstance(error, (TimeoutError, requests.exceptions.Timeout))
+
+
+class HostLimiter:
+    """Semaphore per host, dropped once no fetch of the host uses it."""
+
+    def __init__(self, max_per_host: int):
+        self.max_per_host = max_per_host
+        self._semaphores: Dict[str, list] = {}
+
+    def acquire(self, host: str) -> Semaphore:
+        entry = self._semaphores.get(host)
+        if entry is None:
+            entry = self._semaphores[host] = [Semaphore(self.max_per_host), 0]
+        entry[1] += 1
+        return entry[0]
+
+    def release(self, host: str) -> None:
+        entry = self._semaphores[host]
+        entry[1] -= 1
+        if entry[1] == 0:
+            del self._semaphores[host]
+
+    def get_host_count(self) -> int:
+        return len(self._semaphores)
+
+
+class FetchCoordinator:
+    def __init__(
+        self,
+        max_per_host: Optional[int] = None,
+        cache_ttl: Optional[float] = None,
+        max_cache_entries: Optional[int] = None,
+        coalesce_timeout: Optional[float] = None,
+    ):
+        self.host_limiter = HostLimiter(
+            max_per_host or get_fetch_max_concurrency_per_host()
+        )
+        self.cache_ttl = get_fetch_cache_ttl() if cache_ttl is None else cache_ttl
+        self._cache = (
+            TTLCache(
+                maxsize=max_cache_entries or get_fetch_cache_max_entries(),
+                ttl=self.cache_ttl,
+            )
+            if self.cache_ttl > 0
+            else None
+        )
+        self.coalesce_timeout = (
+            get_fetch_coalesce_timeout()
+            if coalesce_timeout is None
+            else coalesce_timeout
+        )
+        self._in_flight: Dict[str, Event] = {}
+        self._metrics = {
+            "requests": 0,
+            "fetches": 0,
+            "cache_hits": 0,
+            "coalesced": 0,
+            "retried": 0,
+            "coalesce_timeouts": 0,
+        }
+
+    def fetch(
+        self,
+        url: str,
+        fetch: Callable[[], Any],
+        options: Optional[Dict[str, Any]] = None,
+        should_cache: Callable[[Any], bool] = lambda result: True,
+        is_cancelled: Callable[[], bool] = lambda: False,
+        max_age: Optional[float] = None,
+    ) -> Any:
+        """
+        Returns the result of fetch() for the URL and options: from the cache, from
+        the identical fetch in flight, or from a new call once the host has a free
+        slot. Only the results accepted by should_cache are kept.
+
+        is_cancelled tells whether the caller was cancelled, in which case its error
+        is not passed on to the callers merged into its fetch.
+
+        max_age caps the age of the cached result given back, below the TTL of the
+        coordinator: with 0 the URL is always fetched, unless an identical fetch is
+        in flight.
+        """
+        self._metrics["requests"] += 1
+        key = get_fetch_key(url, options)
+
+        while True:
+            cached = self._get_cached(key, max_age)
+            if cached is not None:
+                self._metrics["cache_hits"] += 1
+                return copy.deepcopy(cached[1])
+
+            in_flight = self._in_flight.get(key)
+            if in_flight is None:
+                return self._lead_fetch(key, url, fetch, should_cache, is_cancelled)
+
+            self._metrics["coalesced"] += 1
+            result = self._wait_for_leader(in_flight)
+            if result is _TIMED_OUT:
+                self._metrics["coalesce_timeouts"] += 1
+                return self._fetch_from_host(url, fetch)
+            if result is not _LEADER_GONE:
+                return copy.deepcopy(result)
+            self._metrics["retried"] += 1
+
+    def _get_cached(self, key: str, max_age: Optional[float]) -> Optional[tuple]:
+        """The (stored_at, result) entry of the key, if young enough for max_age"""
+        if self._cache is None:
+            return None
+        cached = self._cache.get(key)
+        if cached is None:
+            return None
+        if max_age is not None and time.monotonic() - cached[0] >= max_age:
+            return None
+        return cached
+
+    def _wait_for_leader(self, in_flight: Event) -> Any:
+        with eventlet.Timeout(self.coalesce_timeout, False):
+            return in_flight.wait()
+        return _TIMED_OUT
+
+    def _lead_fetch(self, key, url, fetch, should_cache, is_cancelled) -> Any:
+        """
+        Runs the fetch for the callers merged into it. They are always woken up, even
+        when the greenthread is killed, and only get the errors of the fetch itself.
+        """
+        in_flight = self._in_flight[key] = Event()
+        outcome = _LEADER_GONE
+        error = None
+        try:
+            result = self._fetch_from_host(url, fetch)
+        except Exception as e:
+            if not is_cancelled() and not is_timeout_error(e):
+                error = e
+            raise
+        else:
+            if self._cache is not None and should_cache(result):
+                self._cache[key] = (time.monotonic(), result)
+            outcome = result
+            return result
+        finally:
+            del self._in_flight[key]
+            if error is not None:
+                in_flight.send_exception(error)
+            else:
+                in_flight.send(outcome)
+
+    def _fetch_from_host(self, url: str, fetch: Callable[[], Any]) -> Any:
+        host = get_host(url)
+        semaphore = self.host_limiter.acquire(host)
+        try:
+            with semaphore:
+                self._metrics["fetches"] += 1
+                return fetch()
+        finally:
+            self.host_limiter.release(host)
+
+    def clear(self) -> None:
+        if self._cache is not None:
+            self._cache.clear()
+
+    def get_metrics(self) -> Dict[str, Any]:
+        return dict(
+            self._metrics,
+            in_flight=len(self._in_flight),
+            hosts=self.host_limiter.get_host_count(),
+            cached=len(self._cache) if self._cache is not None else 0,
+        )
+
+
+_fetch_coordinator: Optional[FetchCoordinator] = None
+
+
+def get_fetch_coordinator() -> FetchCoordinator:
+    global _fetch_coordinator
+    if _fetch_coordinator is None:
+        _fetch_coordinator = FetchCoordinator()
+        logging.info(
+            f"URL fetches limited to {_fetch_coordinator.host_limiter.max_per_host} "
+            f"per host, cached for {_fetch_coordinator.cache_ttl}s"
+        )
+    return _fetch_coordinator
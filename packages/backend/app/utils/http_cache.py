@@ -0,0 +1,477 @@
+"""
+On-disk HTTP cache of the URL fetches made by the processors.
+
+The responses are stored with their validators (ETag, Last-Modified) and served while
+fresh according to their Cache-Control, Expires or Last-Modified headers. A stale
+response is revalidated with If-None-Match / If-Modified-Since, so that an unchanged
+page costs a 304 instead of its body. A request may accept stale responses with the
+standard "Cache-Control: max-stale=N" directive, and bypass the cache with no-store.
+
+The cache is bounded in size; the least recently used entries are evicted first. It is
+stored in the cache folder, which is not served, and the responses to requests with
+credentials (Authorization, Cookie) are only stored when they are explicitly public.
+"""
+
+import hashlib
+import io
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Optional, Tuple
+
+import requests
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from ..env_config import (
+    get_cache_folder_path,
+    get_http_cache_max_entry_size,
+    get_http_cache_max_size,
+    is_http_cache_enabled,
+)
+from .http_session import TimeoutHTTPAdapter, create_session, get_session
+
+CONDITIONAL_HEADERS = frozenset(["if-none-match", "if-modified-since"])
+KEY_EXCLUDED_HEADERS = CONDITIONAL_HEADERS | {"cache-control"}
+BODY_HEADERS = frozenset(["content-encoding", "content-length", "transfer-encoding"])
+CREDENTIAL_HEADERS = frozenset(["authorization", "cookie"])
+
+HEURISTIC_FRESHNESS_RATIO = 0.1
+HEURISTIC_MAX_FRESHNESS = 24 * 3600
+
+
+def parse_cache_control(value: Optional[str]) -> Dict[str, Optional[str]]:
+    directives = {}
+    for directive in (value or "").split(","):
+        name, _, argument = directive.strip().partition("=")
+        if name:
+            directives[name.lower()] = argument.strip('"') if argument else None
+    return directives
+
+
+def parse_http_date(value: Optional[str]) -> Optional[float]:
+    if not value:
+        return None
+    try:
+        return parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError):
+        return None
+
+
+def parse_seconds(value: Optional[str], default: float = 0) -> float:
+    try:
+        return max(float(value), 0)
+    except (TypeError, ValueError):
+        return default
+
+
+def get_freshness_lifetime(headers, now: float) -> float:
+    """Freshness lifetime of a response, from its headers (RFC 9111, section 4.2.1)."""
+    directives = parse_cache_control(headers.get("Cache-Control"))
+    if "no-cache" in directives:
+        return 0
+    if "max-age" in directives:
+        return parse_seconds(directives["max-age"])
+
+    date = parse_http_date(headers.get("Date")) or now
+    expires = headers.get("Expires")
+    if expires is not None:
+        expires_at = parse_http_date(expires)
+        return max(expires_at - date, 0) if expires_at is not None else 0
+
+    last_modified = parse_http_date(headers.get("Last-Modified"))
+    if last_modified is not None:
+        heuristic = (date - last_modified) * HEURISTIC_FRESHNESS_RATIO
+        return min(max(heuristic, 0), HEURISTIC_MAX_FRESHNESS)
+    return 0
+
+
+def get_max_stale(request_directives) -> float:
+    if "max-stale" not in request_directives:
+        return 0
+    return parse_seconds(request_directives["max-stale"], default=float("inf"))
+
+
+def get_cache_control_headers(max_staleness) -> Dict[str, str]:
+    """
+    Request headers accepting a cached response up to max_staleness seconds stale.
+    With 0 the cached response is always revalidated, even when still fresh.
+    """
+    max_staleness = parse_seconds(max_staleness)
+    if max_staleness <= 0:
+        return {"Cache-Control": "no-cache"}
+    return {"Cache-Control": f"max-stale={int(max_staleness)}"}
+
+
+def get_cache_key(request: requests.PreparedRequest) -> str:
+    """Key of a request: its URL and headers, so that a response never crosses
+    credentials or content negotiations."""
+    headers = sorted(
+        (name.lower(), value)
+        for name, value in request.headers.items()
+        if name.lower() not in KEY_EXCLUDED_HEADERS
+    )
+    raw_key = json.dumps([request.method, request.url, headers])
+    return hashlib.sha256(raw_key.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class CacheEntry:
+    url: str
+    status_code: int
+    headers: Dict[str, str]
+    stored_at: float
+    initial_age: float
+    freshness_lifetime: float
+    must_revalidate: bool
+    size: int
+
+    @classmethod
+    def from_response(cls, response: requests.Response, body_size: int, now: float):
+        headers = {
+            name: value
+            for name, value in response.headers.items()
+            if name.lower() not in BODY_HEADERS
+        }
+        headers["Content-Length"] = str(body_size)
+        return cls(
+            url=response.url,
+            status_code=response.status_code,
+            headers=headers,
+            stored_at=now,
+            initial_age=parse_seconds(response.headers.get("Age")),
+            freshness_lifetime=get_freshness_lifetime(response.headers, now),
+            must_revalidate=is_must_revalidate(response.headers),
+            size=body_size,
+        )
+
+    def revalidated(self, not_modified_headers, now: float) -> "CacheEntry":
+        """The entry refreshed by a 304, whose headers replace the stored ones."""
+        headers = CaseInsensitiveDict(self.headers)
+        for name, value in not_modified_headers.items():
+            if name.lower() not in BODY_HEADERS:
+                headers[name] = value
+        return CacheEntry(
+            url=self.url,
+            status_code=self.status_code,
+            headers=dict(headers),
+            stored_at=now,
+            initial_age=parse_seconds(not_modified_headers.get("Age")),
+            freshness_lifetime=get_freshness_lifetime(headers, now),
+            must_revalidate=is_must_revalidate(headers),
+            size=self.size,
+        )
+
+    def get_age(self, now: float) -> float:
+        return self.initial_age + max(now - self.stored_at, 0)
+
+    def is_fresh(self, now: float, max_stale: float = 0) -> bool:
+        allowed_staleness = 0 if self.must_revalidate else max_stale
+        return self.get_age(now) < self.freshness_lifetime + allowed_staleness
+
+    def get_validators(self) -> Dict[str, str]:
+        headers = CaseInsensitiveDict(self.headers)
+        validators = {}
+        if headers.get("ETag"):
+            validators["If-None-Match"] = headers["ETag"]
+        if headers.get("Last-Modified"):
+            validators["If-Modified-Since"] = headers["Last-Modified"]
+        return validators
+
+
+def is_must_revalidate(headers) -> bool:
+    directives = parse_cache_control(CaseInsensitiveDict(headers).get("Cache-Control"))
+    return "must-revalidate" in directives or "no-cache" in directives
+
+
+def is_reusable_when_stale(headers) -> bool:
+    """Whether a response may be given back once stale, within a max-stale."""
+    directives = parse_cache_control(CaseInsensitiveDict(headers).get("Cache-Control"))
+    return "no-store" not in directives and not is_must_revalidate(headers)
+
+
+def is_storable(response: requests.Response, request_directives) -> bool:
+    if response.request.method != "GET" or response.status_code != 200:
+        return False
+    if "no-store" in request_directives:
+        return False
+    response_directives = parse_cache_control(response.headers.get("Cache-Control"))
+    if "no-store" in response_directives:
+        return False
+    has_credentials = any(
+        name.lower() in CREDENTIAL_HEADERS for name in response.request.headers
+    )
+    if has_credentials and "public" not in response_directives:
+        return False
+    if response.headers.get("Vary", "").strip() == "*":
+        return False
+    return True
+
+
+class HttpCache:
+    """Entries stored as a JSON metadata file and a body file, in LRU order."""
+
+    CACHE_FOLDER_NAME = "http_cache"
+
+    def __init__(
+        self,
+        cache_dir: Optional[str] = None,
+        max_size: Optional[int] = None,
+        max_entry_size: Optional[int] = None,
+    ):
+        if cache_dir is None:
+            cache_dir = os.path.join(get_cache_folder_path(), self.CACHE_FOLDER_NAME)
+        self.cache_dir = cache_dir
+        self.max_size = max_size or get_http_cache_max_size()
+        self.max_entry_size = min(
+            max_entry_size or get_http_cache_max_entry_size(), self.max_size
+        )
+        self._index: "OrderedDict[str, int]" = OrderedDict()
+        self._total_size = 0
+        self._lock = threading.Lock()
+        self._metrics = {
+            "hits": 0,
+            "revalidated": 0,
+            "misses": 0,
+            "stored": 0,
+            "evicted": 0,
+        }
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self._load_index()
+
+    def _get_paths(self, key: str) -> Tuple[str, str]:
+        base_path = os.path.join(self.cache_dir, key)
+        return f"{base_path}.json", f"{base_path}.body"
+
+    def _load_index(self) -> None:
+        """Rebuilds the LRU order of the entries left by a previous process."""
+        entries = []
+        for filename in os.listdir(self.cache_dir):
+            if not filename.endswith(".json"):
+                continue
+            meta_path = os.path.join(self.cache_dir, filename)
+            try:
+                with open(meta_path, "r") as file:
+                    size = json.load(file)["size"]
+                entries.append((os.path.getmtime(meta_path), filename[:-5], size))
+            except (OSError, ValueError, KeyError):
+                self._remove_files(filename[:-5])
+
+        for _, key, size in sorted(entries):
+            self._index[key] = size
+            self._total_size += size
+
+    def get(self, key: str) -> Tuple[Optional[CacheEntry], Optional[bytes]]:
+        with self._lock:
+            if key not in self._index:
+                return None, None
+            self._index.move_to_end(key)
+
+        meta_path, body_path = self._get_paths(key)
+        try:
+            with open(meta_path, "r") as file:
+                entry = CacheEntry(**json.load(file))
+            with open(body_path, "rb") as file:
+                body = file.read()
+            if len(body) != entry.size:
+                raise ValueError("Body size does not match its metadata")
+            os.utime(meta_path)
+        except (OSError, ValueError, TypeError) as e:
+            logging.warning(f"Unreadable HTTP cache entry {key}: {e}")
+            self.remove(key)
+            return None, None
+        return entry, body
+
+    def set(self, key: str, entry: CacheEntry, body: bytes) -> None:
+        if entry.size > self.max_entry_size:
+            return
+
+        meta_path, body_path = self._get_paths(key)
+        self._write_atomically(body_path, body)
+        self._write_atomically(meta_path, json.dumps(asdict(entry)).encode("utf-8"))
+
+        with self._lock:
+            self._total_size += entry.size - self._index.pop(key, 0)
+            self._index[key] = entry.size
+            self._metrics["stored"] += 1
+            evicted_keys = []
+            while self._total_size > self.max_size and self._index:
+                evicted_key, size = self._index.popitem(last=False)
+                self._total_size -= size
+                evicted_keys.append(evicted_key)
+            self._metrics["evicted"] += len(evicted_keys)
+
+        for evicted_key in evicted_keys:
+            self._remove_files(evicted_key)
+
+    def update(self, key: str, entry: CacheEntry) -> None:
+        """Replaces the metadata of an entry, whose body is unchanged."""
+        meta_path, _ = self._get_paths(key)
+        self._write_atomically(meta_path, json.dumps(asdict(entry)).encode("utf-8"))
+
+    def remove(self, key: str) -> None:
+        with self._lock:
+            self._total_size -= self._index.pop(key, 0)
+        self._remove_files(key)
+
+    def get_size(self) -> int:
+        with self._lock:
+            return self._total_size
+
+    def record(self, metric: str) -> None:
+        with self._lock:
+            self._metrics[metric] += 1
+
+    def get_metrics(self) -> Dict[str, Any]:
+        with self._lock:
+            return dict(self._metrics, entries=len(self._index), size=self._total_size)
+
+    def _write_atomically(self, path: str, content: bytes) -> None:
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as file:
+                file.write(content)
+            os.replace(tmp_path, path)
+        except Exception:
+            self._remove_path(tmp_path)
+            raise
+
+    def _remove_files(self, key: str) -> None:
+        for path in self._get_paths(key):
+            self._remove_path(path)
+
+    @staticmethod
+    def _remove_path(path: str) -> None:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+class CachingRawResponse:
+    """
+    Wraps the raw response of a storable request, to keep a copy of the body as the
+    caller reads it. on_complete(body) is called once the body is read to its end,
+    unless it exceeded max_size.
+    """
+
+    def __init__(self, raw, on_complete, max_size: int):
+        self._raw = raw
+        self._on_complete = on_complete
+        self._max_size = max_size
+
+    def stream(self, amt=2**16, decode_content=None):
+        body = bytearray()
+        for chunk in self._raw.stream(amt, decode_content=decode_content):
+            if body is not None:
+                body += chunk
+                if len(body) > self._max_size:
+                    body = None
+            yield chunk
+        if body is not None and decode_content:
+            self._on_complete(bytes(body))
+
+    def __getattr__(self, name):
+        return getattr(self._raw, name)
+
+
+class CachingHTTPAdapter(TimeoutHTTPAdapter):
+    """Adapter serving the GET requests from the HttpCache, and revalidating them."""
+
+    def __init__(self, cache: HttpCache, **kwargs):
+        self.cache = cache
+        super().__init__(**kwargs)
+
+    def send(self, request, **kwargs):
+        request_directives = parse_cache_control(request.headers.get("Cache-Control"))
+        if (
+            request.method != "GET"
+            or "no-store" in request_directives
+            or any(name.lower() in CONDITIONAL_HEADERS for name in request.headers)
+        ):
+            return super().send(request, **kwargs)
+
+        key = get_cache_key(request)
+        entry, body = self.cache.get(key)
+        now = time.time()
+
+        if entry is not None:
+            must_revalidate = (
+                "no-cache" in request_directives
+                or request_directives.get("max-age") == "0"
+            )
+            if not must_revalidate and entry.is_fresh(
+                now, get_max_stale(request_directives)
+            ):
+                self.cache.record("hits")
+                return self.build_cached_response(request, entry, body)
+            request.headers.update(entry.get_validators())
+
+        response = super().send(request, **kwargs)
+
+        if entry is not None and response.status_code == 304:
+            response.close()
+            entry = entry.revalidated(response.headers, time.time())
+            self.cache.update(key, entry)
+            self.cache.record("revalidated")
+            return self.build_cached_response(request, entry, body)
+
+        self.cache.record("misses")
+        if is_storable(response, request_directives):
+
+            def store(body):
+                entry = CacheEntry.from_response(response, len(body), time.time())
+                if entry.freshness_lifetime > 0 or entry.get_validators():
+                    self.cache.set(key, entry, body)
+
+            response.raw = CachingRawResponse(
+                response.raw, store, self.cache.max_entry_size
+            )
+        elif entry is not None:
+            self.cache.remove(key)
+        return response
+
+    def build_cached_response(self, request, entry: CacheEntry, body: bytes):
+        response = requests.Response()
+        response.status_code = entry.status_code
+        response.reason = "OK"
+        response.headers = CaseInsensitiveDict(entry.headers)
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        response.raw = io.BytesIO(body)
+        response._content = body
+        response._content_consumed = True
+        response.from_cache = True
+        return response
+
+
+def create_cached_session(cache: Optional[HttpCache] = None) -> requests.Session:
+    return create_session(adapter_class=CachingHTTPAdapter, cache=cache or HttpCache())
+
+
+_cached_session: Optional[requests.Session] = None
+_cached_session_lock = threading.Lock()
+
+
+def get_cached_session() -> requests.Session:
+    """
+    Session of the fetches worth caching (pages, feeds, APIs polled by the flows).
+    The shared session when the cache is disabled with HTTP_CACHE_ENABLED=false.
+    """
+    global _cached_session
+    if not is_http_cache_enabled():
+        return get_session()
+    if _cached_session is None:
+        with _cached_session_lock:
+            if _cached_session is None:
+                _cached_session = create_cached_session()
+                logging.info("HTTP cache enabled for the URL fetches")
+    return _cached_session
@@ -0,0 +1,150 @@
+"""
+Shared requests session for the raw HTTP calls of the processors and utils.
+
+The session keeps alive a connection pool per host, applies a default timeout to the
+calls made without one, retries idempotent requests on connection errors and
+gateway errors, and records the time of every request per host. It keeps no cookies,
+as it is shared by the fetches of every user.
+"""
+
+from http.cookiejar import DefaultCookiePolicy
+import logging
+import threading
+from collections import defaultdict
+from typing import Any, Dict, Optional
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from ..env_config import (
+    get_http_connect_timeout,
+    get_http_max_retries,
+    get_http_pool_connections,
+    get_http_pool_maxsize,
+    get_http_read_timeout,
+)
+
+RETRY_STATUS_CODES = (502, 503, 504)
+RETRY_METHODS = frozenset(["GET", "HEAD", "OPTIONS"])
+
+
+class TimeoutHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter applying a default timeout to the requests sent without one."""
+
+    def __init__(self, timeout=None, **kwargs):
+        self.timeout = timeout
+        super().__init__(**kwargs)
+
+    def send(self, request, timeout=None, **kwargs):
+        if timeout is None:
+            timeout = self.timeout
+        return super().send(request, timeout=timeout, **kwargs)
+
+
+class HttpTimingRecorder:
+    """Response hook recording the number of requests and their time, per host."""
+
+    def __init__(self):
+        self._hosts = defaultdict(lambda: {"requests": 0, "total_time": 0.0})
+        self._lock = threading.Lock()
+
+    def __call__(self, response: requests.Response, *args, **kwargs):
+        host = urlparse(response.url).netloc
+        with self._lock:
+            host_timing = self._hosts[host]
+            host_timing["requests"] += 1
+            host_timing["total_time"] += response.elapsed.total_seconds()
+        return response
+
+    def get_timings(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            return {
+                host: {
+                    "requests": timing["requests"],
+                    "average_time_ms": timing["total_time"] / timing["requests"] * 1000,
+                }
+                for host, timing in self._hosts.items()
+            }
+
+
+def create_adapter(
+    timeout=None,
+    max_retries=None,
+    pool_connections=None,
+    pool_maxsize=None,
+    adapter_class=TimeoutHTTPAdapter,
+    **adapter_kwargs,
+) -> TimeoutHTTPAdapter:
+    retries = get_http_max_retries() if max_retries is None else max_retries
+    return adapter_class(
+        timeout=timeout or (get_http_connect_timeout(), get_http_read_timeout()),
+        max_retries=Retry(
+            total=retries,
+            read=0,
+            status_forcelist=RETRY_STATUS_CODES,
+            allowed_methods=RETRY_METHODS,
+            backoff_factor=0.3,
+            raise_on_status=False,
+            respect_retry_after_header=False,
+        ),
+        pool_connections=pool_connections or get_http_pool_connections(),
+        pool_maxsize=pool_maxsize or get_http_pool_maxsize(),
+        **adapter_kwargs,
+    )
+
+
+def create_session(**adapter_options) -> requests.Session:
+    session = requests.Session()
+    # The cookies set by a response would otherwise be sent on the requests of others
+    session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+    adapter = create_adapter(**adapter_options)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.hooks["response"].append(HttpTimingRecorder())
+    return session
+
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+
+def get_session() -> requests.Session:
+    """The session shared by the process, created on the first call."""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = create_session()
+                logging.info("Shared HTTP session created")
+    return _session
+
+
+def get_connection_counts(session: requests.Session) -> Dict[str, int]:
+    """Requests sent and connections opened by the pools the session still holds."""
+    counts = {"requests": 0, "connections_opened": 0}
+    for adapter in set(session.adapters.values()):
+        pools = adapter.poolmanager.pools
+        for key in pools.keys():
+            pool = pools.get(key)
+            if pool is None:
+                continue
+            counts["requests"] += pool.num_requests
+            counts["connections_opened"] += pool.num_connections
+    return counts
+
+
+def get_http_metrics(session: Optional[requests.Session] = None) -> Dict[str, Any]:
+    session = session or get_session()
+    metrics = get_connection_counts(session)
+    metrics["connection_reuse_rate"] = (
+        max(0.0, 1 - metrics["connections_opened"] / metrics["requests"])
+        if metrics["requests"]
+        else None
+    )
+    metrics["hosts"] = {}
+    for hook in session.hooks["response"]:
+        if isinstance(hook, HttpTimingRecorder):
+            metrics["hosts"] = hook.get_timings()
+    return metrics
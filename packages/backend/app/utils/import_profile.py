@@ -0,0 +1,116 @@
+"""
+Report the import cost of the backend startup, per module and per top level package.
+
+The startup is run in a new interpreter with "-X importtime": the server modules are
+imported and the processors are loaded, as done before the first flow is run.
+
+Usage (from packages/backend):
+    python -m app.utils.import_profile [--top 30] [--eager] [--code "import app.x"]
+"""
+
+import argparse
+import os
+import re
+import subprocess
+import sys
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+STARTUP_CODE = (
+    "import server\n"
+    "from app.processors.factory.processor_factory_iter_modules import "
+    "ProcessorFactoryIterModules\n"
+    "ProcessorFactoryIterModules().load_processors()\n"
+)
+
+IMPORT_TIME_PATTERN = re.compile(
+    r"^import time:\s*(\d+)\s*\|\s*(\d+)\s*\|(\s*)(\S+)\s*$"
+)
+
+
+@dataclass
+class ImportTime:
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+    @property
+    def package(self) -> str:
+        return self.module.split(".")[0]
+
+
+def parse_import_times(output: str) -> List[ImportTime]:
+    import_times = []
+    for line in output.splitlines():
+        match = IMPORT_TIME_PATTERN.match(line)
+        if match is None:
+            continue
+        self_us, cumulative_us, indent, module = match.groups()
+        import_times.append(
+            ImportTime(module, int(self_us), int(cumulative_us), (len(indent) - 1) // 2)
+        )
+    return import_times
+
+
+def profile_imports(
+    code: str = STARTUP_CODE, env: Optional[Dict[str, str]] = None
+) -> List[ImportTime]:
+    """Runs the code in a new interpreter and returns the time spent on each import."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        env={**os.environ, **(env or {})},
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"The profiled code failed:\n{result.stderr[-2000:]}")
+    return parse_import_times(result.stderr)
+
+
+def get_package_times(import_times: List[ImportTime]) -> Dict[str, int]:
+    """Self time of the imports, summed by top level package."""
+    package_times = defaultdict(int)
+    for import_time in import_times:
+        package_times[import_time.package] += import_time.self_us
+    return dict(package_times)
+
+
+def print_report(import_times: List[ImportTime], top: int) -> None:
+    total_us = sum(import_time.self_us for import_time in import_times)
+    print(f"{len(import_times)} modules imported in {total_us / 1000:.1f} ms\n")
+
+    print(f"{'package':<40}{'self (ms)':>12}{'share':>8}")
+    package_times = sorted(
+        get_package_times(import_times).items(), key=lambda item: -item[1]
+    )
+    for package, self_us in package_times[:top]:
+        print(f"{package:<40}{self_us / 1000:>12.1f}{self_us / total_us:>8.1%}")
+
+    print(f"\n{'module':<60}{'self (ms)':>12}{'cumulative (ms)':>18}")
+    slowest = sorted(import_times, key=lambda item: -item.cumulative_us)
+    for import_time in slowest[:top]:
+        print(
+            f"{import_time.module:<60}{import_time.self_us / 1000:>12.1f}"
+            f"{import_time.cumulative_us / 1000:>18.1f}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--top", type=int, default=30)
+    parser.add_argument(
+        "--eager",
+        action="store_true",
+        help="Import every processor module at registration, as without lazy loading",
+    )
+    parser.add_argument("--code", default=STARTUP_CODE, help="Code to profile")
+    args = parser.parse_args()
+
+    env = {"LAZY_PROCESSOR_LOADING": "false"} if args.eager else None
+    print_report(profile_imports(args.code, env), args.top)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,42 +1,64 @@
 import importlib
+import json
 import logging
-import os
 import pkgutil
-from cachetools import TTLCache, cached
+import threading
+from cachetools import LRUCache, TTLCache, cached
 
+from ..env_config import (
+    get_extensions_blacklist,
+    get_extensions_whitelist,
+    get_processor_manifest_path,
+)
 from ..processors.components.extension.extension_processor import (
     DynamicExtensionProcessor,
     ExtensionProcessor,
 )
+from ..processors.factory.processor_registry import (
+    DEFAULT_MANIFEST_PATH,
+    load_processor_classes,
+    resolve_processor_class,
+)
 
 very_long_ttl_cache = 120000
 
-raw_blacklist = os.getenv("EXTENSIONS_BLACKLIST", "").strip()
-EXTENSIONS_BLACKLIST = raw_blacklist.split(",") if raw_blacklist else []
+DYNAMIC_EXTENSION_CACHE_SIZE = 256
 
-raw_whitelist = os.getenv("EXTENSIONS_WHITELIST", "").strip()
-EXTENSIONS_WHITELIST = raw_whitelist.split(",") if raw_whitelist else []
 
+def get_dynamic_extension_class(processor_type):
+    """
+    Returns the dynamic extension class of the processor type, None if there is none.
+    The index of the processor classes is built once per process, and only the module
+    of the requested type is imported.
+    """
+    processor_classes = load_processor_classes(
+        get_processor_manifest_path() or DEFAULT_MANIFEST_PATH, lazy=True
+    )
+    processor_class = processor_classes.get(processor_type)
+    if processor_class is None:
+        return None
 
-def _load_dynamic_extension(processor_type, data):
-    package = importlib.import_module("app.processors.components.extension")
-    prefix = package.__name__ + "."
+    processor_class = resolve_processor_class(processor_class)
+    if not issubclass(processor_class, DynamicExtensionProcessor):
+        return None
+    return processor_class
 
-    for importer, module_name, is_pkg in pkgutil.iter_modules(package.__path__, prefix):
-        module = importlib.import_module(module_name)
 
-        for attribute_name in dir(module):
-            attribute = getattr(module, attribute_name)
-            if isinstance(attribute, type) and issubclass(
-                attribute, DynamicExtensionProcessor
-            ):
-                if hasattr(attribute, "get_dynamic_node_config") and hasattr(
-                    attribute, "processor_type"
-                ):
-                    if attribute.processor_type == processor_type:
-                        schema = attribute.get_dynamic_node_config(attribute, data)
-                        return schema
-    return None
+def get_dynamic_extension_cache_key(processor_type, data):
+    """The processor type and the data, serialised so that key order does not matter."""
+    return (processor_type, json.dumps(data, sort_keys=True, default=str))
+
+
+@cached(
+    LRUCache(maxsize=DYNAMIC_EXTENSION_CACHE_SIZE),
+    key=get_dynamic_extension_cache_key,
+    lock=threading.Lock(),
+)
+def _load_dynamic_extension(processor_type, data):
+    processor_class = get_dynamic_extension_class(processor_type)
+    if processor_class is None:
+        return None
+    return processor_class.get_dynamic_node_config(processor_class, data)
 
 
 def _load_all_extension_schemas():
@@ -66,12 +88,12 @@ def _load_all_extension_schemas():
 
 
 def filter_extensions(extensions):
-    if len(EXTENSIONS_WHITELIST) > 0:
-        extensions = [e for e in extensions if e.processorType in EXTENSIONS_WHITELIST]
-    if len(EXTENSIONS_BLACKLIST) > 0:
-        extensions = [
-            e for e in extensions if e.processorType not in EXTENSIONS_BLACKLIST
-        ]
+    whitelist = get_extensions_whitelist()
+    blacklist = get_extensions_blacklist()
+    if len(whitelist) > 0:
+        extensions = [e for e in extensions if e.processorType in whitelist]
+    if len(blacklist) > 0:
+        extensions = [e for e in extensions if e.processorType not in blacklist]
     return extensions
 
 
@@ -1,8 +1,9 @@
 import logging
 from typing import Optional
-import requests
 import eventlet
 
+from .http_session import get_session
+
 
 class Client:
 
@@ -35,7 +36,7 @@ class Client:
         }
 
         if files:
-            response = requests.post(
+            response = get_session().post(
                 f"{self._base_url}{path}",
                 headers=headers,
                 files=files,
@@ -46,7 +47,7 @@ class Client:
             )
         else:
             logging.info("JSON BOI")
-            response = requests.post(
+            response = get_session().post(
                 f"{self._base_url}{path}",
                 headers=headers,
                 json=data,
@@ -71,7 +72,7 @@ class Client:
         accept: str = "application/json",
         **kwargs,
     ) -> dict:
-        response = requests.get(
+        response = get_session().get(
             f"{self._base_url}{path}",
             headers={
                 "Content-Type": content_type,
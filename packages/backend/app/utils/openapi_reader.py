@@ -1,13 +1,113 @@
 import json
 import hashlib
-from openapi_spec_validator.readers import read_from_filename
+import logging
+import os
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+
+def get_file_hash(file_path) -> str:
+    with open(file_path, "rb") as file:
+        return hashlib.sha256(file.read()).hexdigest()
+
+
+@dataclass(frozen=True)
+class OpenAPIOperation:
+    """What is needed to call an operation, with its request schema already resolved."""
+
+    request_schema: Any
+    accept: Optional[str]
+    response_content_types: Tuple[str, ...]
+    polling_path: Optional[str] = None
+
+    def to_dict(self):
+        return {
+            "request_schema": self.request_schema,
+            "accept": self.accept,
+            "response_content_types": list(self.response_content_types),
+            "polling_path": self.polling_path,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(
+            request_schema=data["request_schema"],
+            accept=data["accept"],
+            response_content_types=tuple(data["response_content_types"]),
+            polling_path=data["polling_path"],
+        )
+
+
+class OpenAPIOperationIndex:
+    """
+    Operations of a spec by (path, method), resolved once. The index can be saved to
+    disk, with the hash of its spec, so that other processes load it without parsing
+    the spec. The operations are shared, their schemas must not be modified.
+    """
+
+    def __init__(
+        self,
+        operations: Dict[Tuple[str, str], OpenAPIOperation],
+        paths_names: List[str],
+        spec_hash: Optional[str] = None,
+    ):
+        self._operations = operations
+        self._paths_names = paths_names
+        self.spec_hash = spec_hash
+
+    def get_operation(self, path, method) -> Optional[OpenAPIOperation]:
+        return self._operations.get((path, method.lower()))
+
+    def get_all_paths_names(self) -> List[str]:
+        return list(self._paths_names)
+
+    def to_dict(self):
+        return {
+            "spec_hash": self.spec_hash,
+            "paths": self._paths_names,
+            "operations": [
+                {"path": path, "method": method, **operation.to_dict()}
+                for (path, method), operation in self._operations.items()
+            ],
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        operations = {
+            (item["path"], item["method"]): OpenAPIOperation.from_dict(item)
+            for item in data["operations"]
+        }
+        return cls(operations, data["paths"], data.get("spec_hash"))
+
+    def save(self, index_path) -> None:
+        with open(index_path, "w") as file:
+            json.dump(self.to_dict(), file)
+
+    @classmethod
+    def load(cls, index_path, spec_hash=None) -> Optional["OpenAPIOperationIndex"]:
+        """Returns the saved index, None if missing, unreadable or made from another spec."""
+        if not os.path.isfile(index_path):
+            return None
+        try:
+            with open(index_path, "r") as file:
+                index = cls.from_dict(json.load(file))
+        except (OSError, ValueError, KeyError) as e:
+            logging.warning(f"Ignoring invalid OpenAPI index {index_path}: {e}")
+            return None
+        if spec_hash is not None and index.spec_hash != spec_hash:
+            return None
+        return index
 
 
 class OpenAPIReader:
     HTTP_METHODS_LIST = ["get", "post", "put", "delete", "patch", "options", "head"]
 
     def __init__(self, file_path):
+        # Imported here so that the validator is not loaded when an index is used
+        from openapi_spec_validator.readers import read_from_filename
+
         spec_dict, base_uri = read_from_filename(file_path)
+        self._file_path = file_path
         self._api_data = spec_dict
         self._paths = self.get_all_paths()
 
@@ -57,7 +157,9 @@ class OpenAPIReader:
         path_details = self._api_data.get("paths", {}).get(path, {})
         parameters = path_details[method].get("parameters", {})
         for param in parameters:
-            if param["name"] == "accept":
+            if "$ref" in param:
+                param = self.resolve_ref(param["$ref"])
+            if param.get("name") == "accept":
                 return param["schema"]["default"]
         return None
 
@@ -91,9 +193,13 @@ class OpenAPIReader:
         return "{}"
 
     def merge_schemas(base_schema, additions):
+        # Copied, as the base schema can be a component of the spec
+        base_schema = dict(base_schema)
         if "required" in additions:
             if "required" in base_schema:
-                base_schema["required"].extend(additions["required"])
+                base_schema["required"] = (
+                    base_schema["required"] + additions["required"]
+                )
             else:
                 base_schema["required"] = additions["required"]
         return base_schema
@@ -120,10 +226,12 @@ class OpenAPIReader:
             for item in oneOf:
                 resolved_parts.append(self.resolve_schema(item))
 
+            schema = dict(schema)
             schema["oneOf"] = resolved_parts
 
             if "discriminator" in schema:
-                discriminator = schema["discriminator"]
+                discriminator = dict(schema["discriminator"])
+                schema["discriminator"] = discriminator
                 discriminator_mapping = discriminator["mapping"]
                 discriminator_resolved = {}
                 for key, value in discriminator_mapping.items():
@@ -161,6 +269,62 @@ class OpenAPIReader:
             return component_part
         return {}
 
+    def get_polling_path(self, path, polling_path_marker) -> Optional[str]:
+        """The first path containing the marker and starting with the given path."""
+        for candidate in self._paths:
+            if polling_path_marker in candidate and candidate.startswith(path):
+                return candidate
+        return None
+
+    def build_operation_index(self, polling_path_marker=None) -> OpenAPIOperationIndex:
+        """
+        Resolves every operation of the spec. If a polling path marker is given, the
+        polling path of each operation is the first path containing the marker and
+        starting with the operation path.
+        """
+        operations = {}
+        for path, path_details in self._api_data.get("paths", {}).items():
+            for method in path_details:
+                if method not in OpenAPIReader.HTTP_METHODS_LIST:
+                    continue
+                polling_path = (
+                    self.get_polling_path(path, polling_path_marker)
+                    if polling_path_marker
+                    else None
+                )
+                operations[(path, method)] = OpenAPIOperation(
+                    request_schema=self.get_request_schema_for_path(path, method),
+                    accept=self.get_path_accept(path, method),
+                    response_content_types=tuple(
+                        self.get_response_content_type(path, method)
+                    ),
+                    polling_path=polling_path,
+                )
+        return OpenAPIOperationIndex(
+            operations, self.get_all_paths_names(), get_file_hash(self._file_path)
+        )
+
+    @staticmethod
+    def load_operation_index(
+        file_path, index_path=None, polling_path_marker=None
+    ) -> OpenAPIOperationIndex:
+        """
+        Loads the index saved next to the spec if it was made from the same spec,
+        otherwise builds it and tries to save it for the next processes.
+        """
+        index_path = index_path or f"{os.path.splitext(file_path)[0]}.index.json"
+        spec_hash = get_file_hash(file_path)
+        index = OpenAPIOperationIndex.load(index_path, spec_hash)
+        if index is not None:
+            return index
+
+        index = OpenAPIReader(file_path).build_operation_index(polling_path_marker)
+        try:
+            index.save(index_path)
+        except OSError as e:
+            logging.warning(f"Cannot save the OpenAPI index {index_path}: {e}")
+        return index
+
     def get_response_schema_for_path(self, path, method, content_type=None):
         path_details = self._api_data.get("paths", {}).get(path, {})
         if method.lower() in path_details:
@@ -181,6 +345,7 @@ class OpenAPIReader:
 
 # Usage de la classe
 if __name__ == "__main__":
+    from openapi_spec_validator.readers import read_from_filename
 
     def resolve_references(schema, root):
         if isinstance(schema, dict):
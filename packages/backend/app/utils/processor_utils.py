@@ -1,9 +1,13 @@
 from datetime import datetime
 import os
 import tempfile
+from typing import BinaryIO, Iterator, Optional
 from urllib.parse import urlparse
+
 import requests
 
+from .http_session import get_session
+
 
 def create_empty_tmp_file(prefix="tmp"):
     temp_dir = tempfile.TemporaryDirectory()
@@ -26,28 +30,14 @@ def create_temp_file_with_bytes_content(content):
     return temp_file, temp_dir
 
 
-def get_file_size_from_url(url):
-    response = requests.head(url)
-    if response.status_code != 200:
-        raise ValueError(
-            f"Failed to reach the URL: returned status code {response.status_code}"
-        )
-
-    content_length = response.headers.get("Content-Length")
-    return content_length
-
-
-def get_file_size_from_url_in_mb(url):
-    content_length = get_file_size_from_url(url)
-    if content_length is None:
-        raise ValueError("Failed to get file size from URL")
-    return round(int(content_length) / (1024 * 1024), 2)
-
-
 def get_max_file_size_in_mb():
     return int(os.getenv("MAX_TMP_FILE_SIZE_MB", 300))
 
 
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+SPOOLED_FILE_MAX_MEMORY_SIZE = 8 * 1024 * 1024
+
+
 def is_s3_file(url):
     bucket_name = os.getenv("S3_BUCKET_NAME")
     if not bucket_name:
@@ -57,13 +47,6 @@ def is_s3_file(url):
     )
 
 
-def is_accepted_url_file_size(url):
-    size_mb = get_file_size_from_url_in_mb(url)
-    if size_mb > get_max_file_size_in_mb():
-        return False
-    return True
-
-
 def is_valid_url(url):
     result = urlparse(url)
     if not all([result.scheme, result.netloc]):
@@ -71,38 +54,102 @@ def is_valid_url(url):
     return True
 
 
-def file_downloable_check(url):
-    if is_s3_file(url):
-        return
-    if not is_accepted_url_file_size(url):
-        raise ValueError(
-            f"File size is too large. Max file size is {get_max_file_size_in_mb()} MB"
-        )
-    if not is_valid_url(url):
-        raise ValueError(f"Invalid URL: {url}")
+class FileTooLargeError(ValueError):
+    pass
 
 
-def download_file_as_binary(url):
-    try:
-        file_downloable_check(url)
-    except ValueError as e:
-        raise ValueError(f"Can't download file: {e}")
+def get_max_file_size_error():
+    return FileTooLargeError(
+        f"File size is too large. Max file size is {get_max_file_size_in_mb()} MB"
+    )
+
+
+def get_max_download_size(url) -> Optional[int]:
+    """Max size of a download in bytes, None for the files of our own bucket."""
+    if is_s3_file(url):
+        return None
+    return get_max_file_size_in_mb() * 1024 * 1024
 
-    response = requests.get(url)
-    response.raise_for_status()
 
-    return response.content
+def open_download(url) -> requests.Response:
+    """
+    Sends the GET request of a download and returns the streamed response, whose body
+    is not read yet. A Content-Length above the max size is rejected before any byte
+    of the body is received.
+    """
+    if not is_valid_url(url):
+        raise ValueError(f"Invalid URL: {url}")
 
+    response = get_session().get(url, stream=True)
+    if response.status_code != 200:
+        response.close()
+        raise ValueError(
+            f"Failed to reach the URL: returned status code {response.status_code}"
+        )
+
+    max_size = get_max_download_size(url)
+    content_length = response.headers.get("Content-Length")
+    if (
+        max_size is not None
+        and content_length is not None
+        and content_length.isdigit()
+        and int(content_length) > max_size
+    ):
+        response.close()
+        raise get_max_file_size_error()
+
+    return response
+
+
+def iter_response_chunks(
+    response: requests.Response, max_size: Optional[int] = None
+) -> Iterator[bytes]:
+    """
+    Yields the body of a streamed response chunk by chunk. The max size is enforced as
+    the bytes arrive, so that a missing or wrong Content-Length cannot bypass it.
+    """
+    size = 0
+    for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+        size += len(chunk)
+        if max_size is not None and size > max_size:
+            raise get_max_file_size_error()
+        yield chunk
+
+
+def copy_response_to_sink(
+    response: requests.Response, sink: BinaryIO, max_size: Optional[int] = None
+) -> int:
+    """Writes the body of a streamed response to the sink and returns its size."""
+    size = 0
+    for chunk in iter_response_chunks(response, max_size):
+        sink.write(chunk)
+        size += len(chunk)
+    return size
+
+
+def stream_download_file(url, sink: Optional[BinaryIO] = None) -> BinaryIO:
+    """
+    Downloads the file with a single request, into the sink if given, or into a
+    temporary file kept in memory up to SPOOLED_FILE_MAX_MEMORY_SIZE. Returns the
+    sink, rewound when it is seekable. The caller closes it, the temporary file is
+    closed here on failure.
+    """
+    owns_sink = sink is None
+    if owns_sink:
+        sink = tempfile.SpooledTemporaryFile(max_size=SPOOLED_FILE_MAX_MEMORY_SIZE)
 
-def stream_download_file_as_binary(url):
     try:
-        file_downloable_check(url)
-    except ValueError as e:
-        raise ValueError(f"Can't download file: {e}")
-
-    with requests.get(url, stream=True) as response:
-        response.raise_for_status()
-        chunks = []
-        for chunk in response.iter_content(chunk_size=8192):
-            chunks.append(chunk)
-        return b"".join(chunks)
+        with open_download(url) as response:
+            copy_response_to_sink(response, sink, get_max_download_size(url))
+    except Exception as e:
+        if owns_sink:
+            sink.close()
+        if isinstance(e, FileTooLargeError):
+            raise FileTooLargeError(f"Can't download file: {e}") from e
+        if isinstance(e, ValueError):
+            raise ValueError(f"Can't download file: {e}") from e
+        raise
+
+    if sink.seekable():
+        sink.seek(0)
+    return sink
@@ -0,0 +1,244 @@
+"""
+Long-lived SDK clients of the model providers, shared by the processors.
+
+A client is kept per (provider, api_key, base_url), with a bounded connection pool,
+so that consecutive nodes using the same key reuse its connections instead of
+repeating the TLS handshake. The SDKs are imported when their first client is made.
+"""
+
+import hashlib
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import httpx
+
+from ..env_config import (
+    get_provider_client_max_clients,
+    get_provider_client_max_connections,
+    get_provider_client_max_idle_time,
+)
+
+PROVIDER_OPENAI = "openai"
+PROVIDER_ANTHROPIC = "anthropic"
+PROVIDER_REPLICATE = "replicate"
+
+
+class ConnectionTracker:
+    """
+    Counts the requests sent and the connections opened by the clients, through the
+    trace extension of httpcore, to report how often a connection is reused.
+    """
+
+    def __init__(self):
+        self.requests = 0
+        self.connections_opened = 0
+        self._lock = threading.Lock()
+
+    def on_request(self, request: httpx.Request) -> None:
+        request.extensions["trace"] = self.trace
+        with self._lock:
+            self.requests += 1
+
+    def trace(self, event_name: str, info: Dict[str, Any]) -> None:
+        if event_name.endswith("connect_tcp.complete"):
+            with self._lock:
+                self.connections_opened += 1
+
+    def get_reuse_rate(self) -> Optional[float]:
+        with self._lock:
+            if self.requests == 0:
+                return None
+            return max(0.0, 1 - self.connections_opened / self.requests)
+
+
+@dataclass
+class ClientEntry:
+    client: Any
+    last_used: float
+
+
+class ProviderClientRegistry:
+    """
+    Hands out one client per (provider, api_key, base_url).
+
+    Clients idle for longer than max_idle_time, or the least recently used ones above
+    max_clients, are dropped from the registry. They are not closed, as a node may
+    still be using them; their connections are released with the last reference.
+    """
+
+    def __init__(
+        self,
+        max_idle_time: Optional[float] = None,
+        max_clients: Optional[int] = None,
+        max_connections: Optional[int] = None,
+    ):
+        self.max_idle_time = max_idle_time or get_provider_client_max_idle_time()
+        self.max_clients = max_clients or get_provider_client_max_clients()
+        self.max_connections = max_connections or get_provider_client_max_connections()
+        self.connection_tracker = ConnectionTracker()
+        self._clients: "OrderedDict[Tuple, ClientEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._metrics = {
+            "created_clients": 0,
+            "reused_clients": 0,
+            "evicted_clients": 0,
+        }
+
+    @staticmethod
+    def get_client_key(provider, api_key, base_url) -> Tuple:
+        """The api key is hashed, so that it does not stay in the keys of the registry."""
+        api_key_hash = (
+            hashlib.sha256(api_key.encode("utf-8")).hexdigest()
+            if api_key is not None
+            else None
+        )
+        return (provider, api_key_hash, base_url)
+
+    def get_http_options(self) -> Dict[str, Any]:
+        """Options of the httpx client of a new SDK client: bounded pool and tracking."""
+        return {
+            "limits": httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_connections,
+            ),
+            "event_hooks": {"request": [self.connection_tracker.on_request]},
+        }
+
+    def get_client(
+        self,
+        provider: str,
+        api_key: Optional[str],
+        base_url: Optional[str],
+        create_client: Callable[[Dict[str, Any]], Any],
+    ):
+        """
+        Returns the client of the key, made with create_client(http_options) if there
+        is none yet.
+        """
+        key = self.get_client_key(provider, api_key, base_url)
+        now = time.monotonic()
+
+        with self._lock:
+            self._evict_clients(now)
+            entry = self._clients.get(key)
+            if entry is not None:
+                entry.last_used = now
+                self._clients.move_to_end(key)
+                self._metrics["reused_clients"] += 1
+                return entry.client
+
+        client = create_client(self.get_http_options())
+
+        with self._lock:
+            entry = self._clients.get(key)
+            if entry is not None:
+                # Another greenthread made the same client meanwhile
+                entry.last_used = now
+                self._metrics["reused_clients"] += 1
+                return entry.client
+            self._clients[key] = ClientEntry(client, now)
+            self._metrics["created_clients"] += 1
+            self._evict_clients(now)
+            return client
+
+    def _evict_clients(self, now: float) -> None:
+        expired_keys = [
+            key
+            for key, entry in self._clients.items()
+            if now - entry.last_used > self.max_idle_time
+        ]
+        for key in expired_keys:
+            del self._clients[key]
+        self._metrics["evicted_clients"] += len(expired_keys)
+
+        while len(self._clients) > self.max_clients:
+            self._clients.popitem(last=False)
+            self._metrics["evicted_clients"] += 1
+
+    def get_client_count(self) -> int:
+        with self._lock:
+            return len(self._clients)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        with self._lock:
+            metrics = dict(self._metrics, clients=len(self._clients))
+        metrics["requests"] = self.connection_tracker.requests
+        metrics["connections_opened"] = self.connection_tracker.connections_opened
+        metrics["connection_reuse_rate"] = self.connection_tracker.get_reuse_rate()
+        return metrics
+
+    def clear(self) -> None:
+        with self._lock:
+            self._clients.clear()
+
+
+_client_registry: Optional[ProviderClientRegistry] = None
+_client_registry_lock = threading.Lock()
+
+
+def get_client_registry() -> ProviderClientRegistry:
+    global _client_registry
+    if _client_registry is None:
+        with _client_registry_lock:
+            if _client_registry is None:
+                _client_registry = ProviderClientRegistry()
+                logging.info(
+                    f"Provider clients pooled with up to "
+                    f"{_client_registry.max_connections} connections each"
+                )
+    return _client_registry
+
+
+def get_openai_client(api_key, base_url=None, timeout=None):
+    """
+    OpenAI client of the key, also used for the OpenAI compatible APIs through
+    base_url. The timeout applies to the returned copy only, which shares the
+    connection pool of the registered client.
+    """
+
+    def create_client(http_options):
+        from openai import DefaultHttpxClient, OpenAI
+
+        return OpenAI(
+            api_key=api_key,
+            base_url=base_url,
+            http_client=DefaultHttpxClient(**http_options),
+        )
+
+    client = get_client_registry().get_client(
+        PROVIDER_OPENAI, api_key, base_url, create_client
+    )
+    return client.with_options(timeout=timeout) if timeout is not None else client
+
+
+def get_anthropic_client(api_key, timeout=None):
+    def create_client(http_options):
+        from anthropic import Anthropic, DefaultHttpxClient
+
+        return Anthropic(
+            api_key=api_key, http_client=DefaultHttpxClient(**http_options)
+        )
+
+    client = get_client_registry().get_client(
+        PROVIDER_ANTHROPIC, api_key, None, create_client
+    )
+    return client.with_options(timeout=timeout) if timeout is not None else client
+
+
+def get_replicate_client(api_token):
+    def create_client(http_options):
+        import replicate
+
+        return replicate.Client(
+            api_token=api_token,
+            transport=httpx.HTTPTransport(limits=http_options["limits"]),
+            event_hooks=http_options["event_hooks"],
+        )
+
+    return get_client_registry().get_client(
+        PROVIDER_REPLICATE, api_token, None, create_client
+    )
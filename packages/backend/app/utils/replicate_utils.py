@@ -1,10 +1,9 @@
 import os
-import requests
 from ..env_config import get_replicate_api_key
+from .http_session import get_session
 from cachetools import TTLCache, cached
 import logging
 
-
 short_ttl_cache = 600
 long_ttl_cache = 12000
 very_long_ttl_cache = 120000
@@ -28,7 +27,7 @@ def get_replicate_models(cursor: str = None):
     if cursor:
         url += f"?cursor={cursor}"
 
-    response = requests.get(url=url, headers=headers)
+    response = get_session().get(url=url, headers=headers)
 
     if response.status_code != 200:
         raise Exception(f"Failed to fetch models: {response.status_code}")
@@ -53,7 +52,7 @@ def get_replicate_collections():
 
     headers = {"Authorization": f"Token {api_token}"}
 
-    response = requests.get(REPLICATE_COLLECTION_API_URL, headers=headers)
+    response = get_session().get(REPLICATE_COLLECTION_API_URL, headers=headers)
 
     if response.status_code != 200:
         raise Exception(f"Failed to fetch collections: {response.status_code}")
@@ -77,7 +76,7 @@ def get_replicate_collection_models(collection_slug: str, cursor=None):
     if cursor:
         url += f"?cursor={cursor}"
 
-    response = requests.get(url=url, headers=headers)
+    response = get_session().get(url=url, headers=headers)
 
     if response.status_code != 200:
         raise Exception(
@@ -125,7 +124,7 @@ def get_model_info(model_id: str):
 
     headers = {"Authorization": f"Token {api_token}"}
 
-    response = requests.get(url, headers=headers)
+    response = get_session().get(url, headers=headers)
 
     if response.status_code != 200:
         raise Exception(
@@ -149,7 +148,7 @@ def get_model_openapi_schema(model_id: str):
 
     headers = {"Authorization": f"Token {api_token}"}
 
-    response = requests.get(url, headers=headers)
+    response = get_session().get(url, headers=headers)
 
     if response.status_code != 200:
         raise Exception(
@@ -1,24 +1,77 @@
 import logging
 import asyncio
-from asyncio import Queue
-from queue import Empty
+from collections import deque
+from dataclasses import dataclass, field
+import shutil
 import tempfile
 import time
+from typing import Optional
 import zipfile
 
-from ...env_config import get_browser_tab_max_usage, get_browser_tab_pool_size
+from ...env_config import (
+    get_browser_tab_idle_timeout,
+    get_browser_tab_max_usage,
+    get_browser_tab_pool_min_size,
+    get_browser_tab_pool_size,
+)
+from .request_blocking import RequestBlocker
 from playwright.async_api import async_playwright
 
+LIVENESS_PROBE_TIMEOUT = 2
+
+
+@dataclass(eq=False)
+class BrowserTab:
+    page: object
+    context: object
+    user_data_dir: str
+    created_at: float = field(default_factory=time.monotonic)
+    last_used: float = field(default_factory=time.monotonic)
+    usage_count: int = 0
+    crashed: bool = False
+    request_blocker: Optional[RequestBlocker] = None
+
 
 class AsyncBrowserManager:
-    def __init__(self):
+    """
+    Pool of browser tabs, each one in its own persistent context.
+
+    The pool keeps min_size tabs open, grows up to pool_size under load, and closes
+    the tabs idle for longer than idle_timeout. A tab is replaced after max_usage uses,
+    when its page crashed, or when it fails the liveness probe made before it is
+    handed out. The profile directory of a tab is removed when it is closed.
+    """
+
+    def __init__(
+        self, pool_size=None, min_size=None, max_usage=None, idle_timeout=None
+    ):
         self.playwright = None
         self.browser = None
-        self.pool_size = get_browser_tab_pool_size()
-        self.max_usage = get_browser_tab_max_usage()
-        self.lock = asyncio.Lock()
-        self.tab_pool = Queue(maxsize=self.pool_size)
-        self.tab_usage_count = {}
+        self.pool_size = get_browser_tab_pool_size() if pool_size is None else pool_size
+        self.min_size = min(
+            get_browser_tab_pool_min_size() if min_size is None else min_size,
+            self.pool_size,
+        )
+        self.max_usage = get_browser_tab_max_usage() if max_usage is None else max_usage
+        self.idle_timeout = (
+            get_browser_tab_idle_timeout() if idle_timeout is None else idle_timeout
+        )
+        self.condition = asyncio.Condition()
+        self.idle_tabs = deque()
+        self.tabs = {}
+        self.tab_count = 0
+        self.shrink_task = None
+        self.metrics = {
+            "created_tabs": 0,
+            "recycled_tabs": 0,
+            "crashed_tabs": 0,
+            "shrunk_tabs": 0,
+            "tab_requests": 0,
+            "total_wait_time": 0.0,
+            "max_wait_time": 0.0,
+            "closed_tabs": 0,
+            "total_tab_lifetime": 0.0,
+        }
 
     async def initialize_browser(self):
         self.playwright = await async_playwright().start()
@@ -29,8 +82,7 @@ class AsyncBrowserManager:
         with zipfile.ZipFile(zip_path, "r") as zip_ref:
             zip_ref.extractall(extract_to)
 
-    async def launch_context(self):
-        user_data_dir = tempfile.mkdtemp()
+    async def launch_context(self, user_data_dir):
         args = []
         args.append("--headless=new")
 
@@ -44,11 +96,203 @@ class AsyncBrowserManager:
         return context
 
     async def initialize_pool(self):
-        for _ in range(self.pool_size):
-            context = await self.launch_context()
+        for _ in range(self.min_size):
+            tab = await self._create_tab()
+            async with self.condition:
+                self.tab_count += 1
+                self.idle_tabs.append(tab)
+                self.condition.notify()
+
+        if self.shrink_task is None and self.min_size < self.pool_size:
+            self.shrink_task = asyncio.create_task(self._shrink_idle_tabs_loop())
+
+    async def _create_tab(self) -> BrowserTab:
+        user_data_dir = tempfile.mkdtemp(prefix="ai-flow-browser-")
+        try:
+            context = await self.launch_context(user_data_dir)
             page = await context.new_page()
-            await self.tab_pool.put((page, context))
-            self.tab_usage_count[page] = 0
+        except Exception:
+            shutil.rmtree(user_data_dir, ignore_errors=True)
+            raise
+
+        tab = BrowserTab(page, context, user_data_dir)
+
+        def on_crash(_):
+            tab.crashed = True
+
+        page.on("crash", on_crash)
+        self.tabs[page] = tab
+        self.metrics["created_tabs"] += 1
+        return tab
+
+    async def _close_tab(self, tab: BrowserTab):
+        self.tabs.pop(tab.page, None)
+        try:
+            await tab.context.close()
+        except Exception as e:
+            logging.error(f"Error closing context: {e}")
+        shutil.rmtree(tab.user_data_dir, ignore_errors=True)
+        self.metrics["closed_tabs"] += 1
+        self.metrics["total_tab_lifetime"] += time.monotonic() - tab.created_at
+
+    async def _discard_tab(self, tab: BrowserTab):
+        """Closes a tab and frees its slot in the pool, for a new one to be created."""
+        await self._close_tab(tab)
+        async with self.condition:
+            self.tab_count -= 1
+            self.condition.notify()
+
+    async def _is_alive(self, tab: BrowserTab) -> bool:
+        if tab.crashed or tab.page.is_closed():
+            return False
+        try:
+            await asyncio.wait_for(
+                tab.page.evaluate("1"), timeout=LIVENESS_PROBE_TIMEOUT
+            )
+            return True
+        except Exception:
+            return False
+
+    async def _recycle_tab(self, tab: BrowserTab) -> BrowserTab:
+        """Replaces the tab with a new one, in the same slot of the pool."""
+        await self._close_tab(tab)
+        try:
+            new_tab = await self._create_tab()
+        except Exception:
+            async with self.condition:
+                self.tab_count -= 1
+                self.condition.notify()
+            raise
+        self.metrics["recycled_tabs"] += 1
+        return new_tab
+
+    async def _acquire_tab(self, timeout) -> BrowserTab:
+        """Takes an idle tab, the most recently used first, or a new slot in the pool."""
+        deadline = time.monotonic() + timeout
+        async with self.condition:
+            while True:
+                if self.idle_tabs:
+                    return self.idle_tabs.pop()
+                if self.tab_count < self.pool_size:
+                    self.tab_count += 1
+                    break
+                remaining_time = deadline - time.monotonic()
+                if remaining_time <= 0:
+                    raise Exception("No available tabs in the pool after waiting")
+                try:
+                    await asyncio.wait_for(self.condition.wait(), remaining_time)
+                except asyncio.TimeoutError:
+                    pass
+
+        try:
+            return await self._create_tab()
+        except Exception:
+            async with self.condition:
+                self.tab_count -= 1
+                self.condition.notify()
+            raise
+
+    async def get_tab(self, timeout=10, request_blocker: RequestBlocker = None):
+        """
+        Hands out a tab, whose requests go through the request_blocker if given until
+        the tab is released.
+        """
+        start_time = time.monotonic()
+        tab = await self._acquire_tab(timeout)
+
+        if tab.usage_count >= self.max_usage:
+            tab = await self._recycle_tab(tab)
+        elif not await self._is_alive(tab):
+            self.metrics["crashed_tabs"] += 1
+            tab = await self._recycle_tab(tab)
+
+        if request_blocker is not None:
+            try:
+                await tab.page.route("**/*", request_blocker.handle_route)
+            except Exception:
+                await self._discard_tab(tab)
+                raise
+            tab.request_blocker = request_blocker
+
+        tab.usage_count += 1
+        wait_time = time.monotonic() - start_time
+        self.metrics["tab_requests"] += 1
+        self.metrics["total_wait_time"] += wait_time
+        self.metrics["max_wait_time"] = max(self.metrics["max_wait_time"], wait_time)
+        return tab.page, tab.context
+
+    async def release_tab(self, page, context):
+        tab = self.tabs.get(page)
+        if tab is None:
+            return
+
+        if tab.crashed or page.is_closed():
+            self.metrics["crashed_tabs"] += 1
+            await self._discard_tab(tab)
+            return
+
+        try:
+            if tab.request_blocker is not None:
+                await page.unroute("**/*", tab.request_blocker.handle_route)
+                tab.request_blocker = None
+            await context.clear_cookies()
+        except Exception as e:
+            logging.error(f"Error releasing tab: {e}")
+            await self._discard_tab(tab)
+            return
+
+        tab.last_used = time.monotonic()
+        async with self.condition:
+            self.idle_tabs.append(tab)
+            self.condition.notify()
+
+    async def shrink_idle_tabs(self):
+        """Closes the tabs idle for longer than idle_timeout, down to min_size."""
+        now = time.monotonic()
+        expired_tabs = []
+        async with self.condition:
+            # The least recently used tabs are at the left of the deque
+            while (
+                self.idle_tabs
+                and self.tab_count > self.min_size
+                and now - self.idle_tabs[0].last_used > self.idle_timeout
+            ):
+                expired_tabs.append(self.idle_tabs.popleft())
+                self.tab_count -= 1
+
+        for tab in expired_tabs:
+            await self._close_tab(tab)
+        self.metrics["shrunk_tabs"] += len(expired_tabs)
+
+    async def _shrink_idle_tabs_loop(self):
+        while True:
+            await asyncio.sleep(max(self.idle_timeout / 2, 1))
+            try:
+                await self.shrink_idle_tabs()
+            except Exception as e:
+                logging.error(f"Error closing idle tabs: {e}")
+
+    def get_metrics(self):
+        metrics = self.metrics
+        return {
+            "tabs": self.tab_count,
+            "idle_tabs": len(self.idle_tabs),
+            "created_tabs": metrics["created_tabs"],
+            "recycled_tabs": metrics["recycled_tabs"],
+            "crashed_tabs": metrics["crashed_tabs"],
+            "shrunk_tabs": metrics["shrunk_tabs"],
+            "average_wait_time_ms": (
+                metrics["total_wait_time"] / metrics["tab_requests"] * 1000
+                if metrics["tab_requests"]
+                else None
+            ),
+            "max_wait_time_ms": metrics["max_wait_time"] * 1000,
+            "average_tab_lifetime_s": (
+                metrics["total_tab_lifetime"] / metrics["closed_tabs"]
+                if metrics["closed_tabs"]
+                else None
+            ),
+        }
 
     async def check_extensions_loaded(self, take_extensions_screenshot=False):
         page, context = await self.get_tab()
@@ -58,8 +302,7 @@ class AsyncBrowserManager:
         await page.wait_for_selector("extensions-manager")
 
         # Extract the extensions displayed
-        extensions = await page.evaluate(
-            """() => {
+        extensions = await page.evaluate("""() => {
             return new Promise((resolve, reject) => {
                 try {
                     chrome.management.getAll((extensions) => {
@@ -69,8 +312,7 @@ class AsyncBrowserManager:
                     reject(error);
                 }
             });
-        }"""
-        )
+        }""")
 
         extension_names = [ext["name"] for ext in extensions]
         logging.info(f"Extensions loaded in Chromium : {extension_names}")
@@ -78,47 +320,17 @@ class AsyncBrowserManager:
             screenshot_path = "extensions_screenshot.png"
             await page.screenshot(path=screenshot_path)
             logging.info(f"Screenshot saved to {screenshot_path}")
+        await self.release_tab(page, context)
 
     async def close_browser(self):
+        if self.shrink_task is not None:
+            self.shrink_task.cancel()
+            self.shrink_task = None
+        for tab in list(self.tabs.values()):
+            await self._close_tab(tab)
+        self.idle_tabs.clear()
+        self.tab_count = 0
         if self.browser:
             await self.browser.close()
         if self.playwright:
             await self.playwright.stop()
-
-    async def _recycle_tab(self, page, context):
-        try:
-            await context.close()  # Close existing context to free memory
-        except Exception as e:
-            logging.error(f"Error closing context: {e}")
-        context = await self.launch_context()
-        page = await context.new_page()
-        self.tab_usage_count[page] = 1
-        return page, context
-
-    async def get_tab(self, timeout=10):
-        start_time = time.time()
-        while time.time() - start_time < timeout:
-            try:
-                async with self.lock:
-                    page, context = await self.tab_pool.get()
-
-                self.tab_usage_count[page] += 1
-                if self.tab_usage_count[page] > self.max_usage:
-                    # Recycle tab if max usage is reached
-                    page, context = await self._recycle_tab(page, context)
-
-                return page, context
-            except Empty:
-                await asyncio.sleep(0.1)  # Yield control to other tasks
-        raise Exception("No available tabs in the pool after waiting")
-
-    async def release_tab(self, page, context):
-        async with self.lock:
-            try:
-                await context.clear_cookies()
-                await self.tab_pool.put((page, context))
-            except Exception as e:
-                logging.error(f"Error releasing tab: {e}")
-                # Recycle the tab if an error occurs during release
-                page, context = await self._recycle_tab(page, context)
-                await self.tab_pool.put((page, context))
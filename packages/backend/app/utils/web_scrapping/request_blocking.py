@@ -0,0 +1,105 @@
+"""
+Request interception of the browser tabs, to skip what a scrape does not read.
+
+The fast mode aborts the images, media and fonts, which the text of a page does not
+depend on. The ad blocker aborts the requests sent to ad and analytics hosts.
+"""
+
+from dataclasses import dataclass, field
+from typing import FrozenSet, Iterable, Optional
+from urllib.parse import urlparse
+
+FAST_MODE_BLOCKED_RESOURCE_TYPES = frozenset(["image", "media", "font"])
+
+BLOCKED_HOSTS = frozenset(
+    [
+        "2mdn.net",
+        "adnxs.com",
+        "adsrvr.org",
+        "adservice.google.com",
+        "amazon-adsystem.com",
+        "chartbeat.com",
+        "criteo.com",
+        "criteo.net",
+        "doubleclick.net",
+        "facebook.net",
+        "google-analytics.com",
+        "googleadservices.com",
+        "googlesyndication.com",
+        "googletagmanager.com",
+        "googletagservices.com",
+        "hotjar.com",
+        "moatads.com",
+        "outbrain.com",
+        "pubmatic.com",
+        "quantserve.com",
+        "rubiconproject.com",
+        "scorecardresearch.com",
+        "segment.io",
+        "taboola.com",
+    ]
+)
+
+WAIT_FOR_SELECTORS_TIMEOUT = 10000
+WAIT_FOR_NETWORK_IDLE_TIMEOUT = 10000
+WAIT_FOR_LOAD_TIMEOUT = 5000
+
+
+def is_blocked_host(host: str, blocked_hosts: Iterable[str]) -> bool:
+    """True for a blocked host and its subdomains."""
+    parts = host.split(".")
+    return any(".".join(parts[i:]) in blocked_hosts for i in range(len(parts) - 1))
+
+
+@dataclass
+class RequestBlocker:
+    blocked_resource_types: FrozenSet[str] = frozenset()
+    blocked_hosts: FrozenSet[str] = frozenset()
+    blocked_requests: int = field(default=0, compare=False)
+
+    @classmethod
+    def create(
+        cls, fast_mode=False, enable_ad_blocker=False
+    ) -> Optional["RequestBlocker"]:
+        """The blocker of the scrape options, None when nothing has to be blocked."""
+        if not fast_mode and not enable_ad_blocker:
+            return None
+        return cls(
+            blocked_resource_types=(
+                FAST_MODE_BLOCKED_RESOURCE_TYPES if fast_mode else frozenset()
+            ),
+            blocked_hosts=BLOCKED_HOSTS,
+        )
+
+    def should_block(self, resource_type: str, url: str) -> bool:
+        if resource_type in self.blocked_resource_types:
+            return True
+        host = urlparse(url).hostname or ""
+        return is_blocked_host(host, self.blocked_hosts)
+
+    async def handle_route(self, route) -> None:
+        """Route handler of playwright, registered for every request of the page."""
+        request = route.request
+        if self.should_block(request.resource_type, request.url):
+            self.blocked_requests += 1
+            await route.abort()
+        else:
+            await route.continue_()
+
+
+async def wait_for_content(page, selectors=None, fast_mode=False) -> None:
+    """
+    Waits for the content to read, once the DOM is loaded. With selectors, until one
+    of them is attached; otherwise until the network is idle, or until the load event
+    in fast mode, as the blocked resources no longer delay it.
+    """
+    if selectors:
+        await page.wait_for_selector(
+            ", ".join(selectors), state="attached", timeout=WAIT_FOR_SELECTORS_TIMEOUT
+        )
+    elif fast_mode:
+        await page.wait_for_load_state("load", timeout=WAIT_FOR_LOAD_TIMEOUT)
+    else:
+        await page.wait_for_load_state(
+            "networkidle", timeout=WAIT_FOR_NETWORK_IDLE_TIMEOUT
+        )
@@ -0,0 +1,184 @@
+"""
+Measure the pages per second of the browser task worker as the tab pool grows.
+
+A local HTTP server stands in for the scraped sites and answers every page after an
+artificial delay. The same batch of scrapping tasks is run through the former loop,
+which awaits the tasks one by one, and through BrowserTaskDispatcher, which runs them
+concurrently up to the size of the pool.
+
+Tabs are Chromium pages of AsyncBrowserManager, which needs "playwright install
+chromium". With --http-tabs, the pages are loaded with a plain GET instead, to
+measure the dispatch alone on machines without a browser.
+
+Usage (from packages/backend):
+    python -m tests.benchmarks.browser_dispatch_benchmark [--pool-sizes 1 2 4 8]
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+from app.tasks.single_thread_tasks.browser.async_browser_task import scrapping_task
+from app.tasks.single_thread_tasks.browser.browser_task_dispatcher import (
+    BrowserTaskDispatcher,
+)
+
+
+class DelayedPageHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    delay = 0.2
+
+    def do_GET(self):
+        time.sleep(DelayedPageHandler.delay)
+        body = (
+            f"<html><body><h1>Page {self.path}</h1><p>Lorem Ipsum</p></body></html>"
+        ).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class HttpPage:
+    """Tab loading the page with a GET, with the page methods used by the task."""
+
+    def __init__(self, session):
+        self.session = session
+        self.text = ""
+
+    async def goto(self, url, **kwargs):
+        response = await asyncio.to_thread(self.session.get, url)
+        self.text = response.text
+
+    async def wait_for_load_state(self, *args, **kwargs):
+        pass
+
+    async def content(self):
+        return self.text
+
+    async def inner_text(self, selector):
+        return self.text
+
+
+class HttpTabManager:
+    def __init__(self, pool_size):
+        self.pool_size = pool_size
+        self.session = requests.Session()
+        self.tab_pool = asyncio.Queue()
+
+    async def initialize_browser(self):
+        for _ in range(self.pool_size):
+            await self.tab_pool.put((HttpPage(self.session), None))
+
+    async def get_tab(self, request_blocker=None):
+        return await self.tab_pool.get()
+
+    async def release_tab(self, page, context):
+        await self.tab_pool.put((page, context))
+
+    async def close_browser(self):
+        self.session.close()
+
+
+async def create_browser_manager(pool_size, http_tabs):
+    if http_tabs:
+        browser_manager = HttpTabManager(pool_size)
+    else:
+        from app.utils.web_scrapping.async_browser_manager import AsyncBrowserManager
+
+        os.environ["BROWSER_TAB_POOL_SIZE"] = str(pool_size)
+        browser_manager = AsyncBrowserManager()
+    await browser_manager.initialize_browser()
+    return browser_manager
+
+
+async def run_sequentially(task_queue, browser_manager):
+    """Former worker loop, awaiting each task before taking the next one."""
+    while True:
+        task_data, result_queue = await task_queue.get()
+        if task_data is None:
+            break
+        result_queue.append(await scrapping_task(task_data, browser_manager))
+
+
+async def run_concurrently(task_queue, browser_manager):
+    await BrowserTaskDispatcher(browser_manager, scrapping_task).run(task_queue)
+
+
+class ResultList(list):
+    def put(self, result):
+        self.append(result)
+
+
+async def measure(run_worker, browser_manager, urls):
+    task_queue = asyncio.Queue()
+    results = ResultList()
+    for url in urls:
+        await task_queue.put(({"url": url}, results))
+    await task_queue.put((None, None))
+
+    start_time = time.perf_counter()
+    await run_worker(task_queue, browser_manager)
+    duration = time.perf_counter() - start_time
+
+    failures = sum(1 for result in results if not isinstance(result, str))
+    return duration, failures
+
+
+async def run_benchmark(args, base_url):
+    urls = [f"{base_url}page-{i}" for i in range(args.pages)]
+    workers = [("sequential", run_sequentially), ("dispatcher", run_concurrently)]
+
+    print(f"{'pool size':<12}{'worker':<14}{'duration (s)':>14}{'pages/s':>10}")
+    for pool_size in args.pool_sizes:
+        browser_manager = await create_browser_manager(pool_size, args.http_tabs)
+        try:
+            for worker_name, run_worker in workers:
+                duration, failures = await measure(run_worker, browser_manager, urls)
+                failed = f"  ({failures} failed)" if failures else ""
+                print(
+                    f"{pool_size:<12}{worker_name:<14}{duration:>14.2f}"
+                    f"{args.pages / duration:>10.1f}{failed}"
+                )
+        finally:
+            await browser_manager.close_browser()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--pages", type=int, default=24)
+    parser.add_argument("--pool-sizes", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument(
+        "--delay", type=float, default=0.2, help="Response delay, in seconds"
+    )
+    parser.add_argument(
+        "--http-tabs",
+        action="store_true",
+        help="Load the pages with a GET instead of Chromium",
+    )
+    args = parser.parse_args()
+
+    logging.getLogger().setLevel(logging.WARNING)
+
+    DelayedPageHandler.delay = args.delay
+    server = ThreadingHTTPServer(("127.0.0.1", 0), DelayedPageHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        asyncio.run(run_benchmark(args, f"http://127.0.0.1:{server.server_port}/"))
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""
+Compare ancestor collection with the FlowGraph index against the former linear scans.
+
+Synthetic flows of 1k and 10k nodes are generated, either as a chain or with each
+node linked to up to two random earlier nodes. For each flow, the benchmark
+collects the ancestors of the last nodes, as done on every run_node event.
+
+Usage (from packages/backend):
+    python -m tests.benchmarks.flow_graph_benchmark
+"""
+
+import argparse
+import random
+import sys
+import time
+
+from app.processors.launcher.flow_graph import FlowGraph
+
+SHAPES = ["chain", "random"]
+
+
+def create_flow(size, shape, seed=0):
+    rng = random.Random(seed)
+    flow = []
+    for i in range(size):
+        if i == 0:
+            parents = set()
+        elif shape == "chain":
+            parents = {f"node-{i - 1}"}
+        else:
+            parents = {f"node-{rng.randrange(i)}" for _ in range(2)}
+        flow.append(
+            {
+                "name": f"node-{i}",
+                "processorType": "llm-prompt",
+                "inputs": [{"inputNode": parent} for parent in sorted(parents)],
+            }
+        )
+    return flow
+
+
+def linear_related_config_data(config_data, node_name, visited):
+    """Former implementation, with a linear lookup per visited node."""
+    if node_name in visited:
+        return []
+    visited.append(node_name)
+
+    current_config = next(
+        (config for config in config_data if config["name"] == node_name), None
+    )
+    if not current_config:
+        return []
+
+    related_configs = [current_config]
+    for input in current_config.get("inputs", []):
+        related_configs.extend(
+            linear_related_config_data(config_data, input.get("inputNode"), visited)
+        )
+    return related_configs
+
+
+def measure(func, repeat):
+    durations = []
+    for _ in range(repeat):
+        start_time = time.perf_counter()
+        func()
+        durations.append(time.perf_counter() - start_time)
+    return min(durations)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--queries", type=int, default=5)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), max(args.sizes) * 2 + 100))
+
+    print(
+        f"{'shape':<8}{'nodes':>8}{'build (ms)':>14}"
+        f"{'graph query (ms)':>20}{'linear query (ms)':>20}"
+    )
+    for shape, size in [(shape, size) for shape in SHAPES for size in args.sizes]:
+        flow = create_flow(size, shape)
+        targets = [f"node-{size - 1 - i}" for i in range(args.queries)]
+
+        build_duration = measure(lambda: FlowGraph(flow), args.repeat)
+        graph = FlowGraph(flow)
+        graph_duration = measure(
+            lambda: [graph.get_related_node_names(target) for target in targets],
+            args.repeat,
+        )
+        linear_duration = measure(
+            lambda: [
+                linear_related_config_data(flow, target, []) for target in targets
+            ],
+            1,
+        )
+
+        print(
+            f"{shape:<8}{size:>8}{build_duration * 1000:>14.2f}"
+            f"{graph_duration / args.queries * 1000:>20.3f}"
+            f"{linear_duration / args.queries * 1000:>20.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Compare the cost of building a launcher per request before and after the registry.
+
+Before, every launcher walked the components package to register the processor
+classes. The registry now discovers them once per process, from the package or
+from a manifest, and the factory registers them once.
+
+Usage (from packages/backend):
+    python -m tests.benchmarks.launcher_construction_benchmark
+"""
+
+import argparse
+import logging
+import os
+import tempfile
+import time
+
+from app.processors.factory import processor_registry
+from app.processors.factory.processor_factory_iter_modules import (
+    ProcessorFactoryIterModules,
+)
+from app.processors.launcher.async_processor_launcher import AsyncProcessorLauncher
+
+
+def create_launcher_with_module_walk(factory):
+    """Former construction, walking the components package for every launcher."""
+    processor_classes = processor_registry.discover_processor_classes()
+    for processor_type, processor_class in processor_classes.items():
+        factory.register_processor(processor_type, processor_class)
+    return AsyncProcessorLauncher(factory, None)
+
+
+def measure(func, iterations, repeat):
+    durations = []
+    for _ in range(repeat):
+        start_time = time.perf_counter()
+        for _ in range(iterations):
+            func()
+        durations.append(time.perf_counter() - start_time)
+    return min(durations) / iterations
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    logging.getLogger().setLevel(logging.WARNING)
+
+    with tempfile.TemporaryDirectory() as manifest_dir:
+        manifest_path = os.path.join(manifest_dir, "processor_manifest.json")
+        processor_registry.write_manifest(manifest_path)
+
+        shared_factory = ProcessorFactoryIterModules()
+        scenarios = [
+            (
+                "module walk",
+                lambda: create_launcher_with_module_walk(ProcessorFactoryIterModules()),
+            ),
+            (
+                "registry",
+                lambda: AsyncProcessorLauncher(ProcessorFactoryIterModules(), None),
+            ),
+            (
+                "registry (shared factory)",
+                lambda: AsyncProcessorLauncher(shared_factory, None),
+            ),
+            (
+                "manifest, uncached",
+                lambda: processor_registry.import_manifest_classes(
+                    processor_registry.load_manifest(manifest_path)
+                ),
+            ),
+        ]
+
+        print(f"{'scenario':<28}{'per launcher (us)':>20}")
+        for scenario_name, create_launcher in scenarios:
+            duration = measure(create_launcher, args.iterations, args.repeat)
+            print(f"{scenario_name:<28}{duration * 1e6:>20.1f}")
+
+
+if __name__ == "__main__":
+    main()
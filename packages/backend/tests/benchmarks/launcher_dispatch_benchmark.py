@@ -0,0 +1,88 @@
+"""
+Measure the overhead of the AsyncProcessorLauncher scheduler itself.
+
+Processors are mocked with ProcessorFactoryMock and do no work, so the wall
+clock of a run is the cost of dispatching the DAG. The result is reported per
+edge, for chains and for stacked diamonds (one node fanning out to N branches
+that merge back into a single node).
+
+Usage (from packages/backend):
+    python -m tests.benchmarks.launcher_dispatch_benchmark
+"""
+
+import argparse
+import logging
+import time
+
+from app.processors.launcher.async_processor_launcher import AsyncProcessorLauncher
+from tests.utils.processor_context_mock import ProcessorContextMock
+from tests.utils.processor_factory_mock import ProcessorFactoryMock
+
+
+def create_node_config(name, parents):
+    return {
+        "name": name,
+        "processorType": "llm-prompt",
+        "inputs": [{"inputNode": parent} for parent in parents],
+    }
+
+
+def create_chain_flow(length):
+    flow = [create_node_config("node-0", [])]
+    for i in range(1, length):
+        flow.append(create_node_config(f"node-{i}", [f"node-{i - 1}"]))
+    return flow, length - 1
+
+
+def create_diamonds_flow(diamonds, width):
+    flow = [create_node_config("merge-0", [])]
+    edges = 0
+    for d in range(1, diamonds + 1):
+        branches = [f"branch-{d}-{b}" for b in range(width)]
+        for branch in branches:
+            flow.append(create_node_config(branch, [f"merge-{d - 1}"]))
+        flow.append(create_node_config(f"merge-{d}", branches))
+        edges += 2 * width
+    return flow, edges
+
+
+def run_flow(launcher, flow, repeat):
+    durations = []
+    for _ in range(repeat):
+        processors = launcher.load_processors(flow)
+        start_time = time.perf_counter()
+        launcher.launch_processors(processors)
+        durations.append(time.perf_counter() - start_time)
+    return min(durations)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    logging.getLogger().setLevel(logging.WARNING)
+
+    launcher = AsyncProcessorLauncher(ProcessorFactoryMock(), None)
+    launcher.set_context(ProcessorContextMock(""))
+
+    scenarios = [
+        ("chain x20", create_chain_flow(20)),
+        ("chain x200", create_chain_flow(200)),
+        ("diamond 5 x 4", create_diamonds_flow(5, 4)),
+        ("diamond 20 x 8", create_diamonds_flow(20, 8)),
+    ]
+
+    print(
+        f"{'scenario':<18}{'nodes':>8}{'edges':>8}{'total (ms)':>14}{'per edge (us)':>16}"
+    )
+    for scenario_name, (flow, edges) in scenarios:
+        duration = run_flow(launcher, flow, args.repeat)
+        print(
+            f"{scenario_name:<18}{len(flow):>8}{edges:>8}"
+            f"{duration * 1000:>14.2f}{duration / edges * 1e6:>16.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
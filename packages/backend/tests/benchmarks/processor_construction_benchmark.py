@@ -0,0 +1,107 @@
+"""
+Measure the cost of building the processors of a flow with ProcessorFactoryIterModules.
+
+A synthetic flow mixing processor types with and without a context is instantiated
+node by node, with the construction plans of the factory and with the former
+inspection of the constructor signature for every node. The full load_processors
+of a launcher, which also indexes the flow and links the inputs, is reported too.
+
+Usage (from packages/backend):
+    python -m tests.benchmarks.processor_construction_benchmark
+"""
+
+import argparse
+import inspect
+import logging
+import time
+
+from app.processors.factory.processor_factory_iter_modules import (
+    ProcessorFactoryIterModules,
+)
+from app.processors.launcher.async_processor_launcher import AsyncProcessorLauncher
+from tests.utils.processor_context_mock import ProcessorContextMock
+
+PROCESSOR_TYPES = ["input-text", "llm-prompt", "merger-prompt", "display"]
+
+
+def create_flow(size):
+    flow = []
+    for i in range(size):
+        processor_type = PROCESSOR_TYPES[i % len(PROCESSOR_TYPES)]
+        inputs = [] if i == 0 else [{"inputNode": f"node-{i - 1}"}]
+        flow.append(
+            {
+                "name": f"node-{i}",
+                "processorType": processor_type,
+                "inputs": inputs,
+                "inputText": "Lorem Ipsum",
+                "prompt": "Lorem Ipsum",
+                "mergeMode": 1,
+            }
+        )
+    return flow
+
+
+def create_processor_with_signature(factory, config, context):
+    """Former implementation, inspecting the constructor for every node."""
+    processor_class = factory.get_processor_class(config["processorType"])
+    params = inspect.signature(processor_class.__init__).parameters
+    if params.get("context") is not None:
+        processor = processor_class(config=config, context=context)
+    else:
+        processor = processor_class(config=config)
+    processor.set_storage_strategy(None)
+    return processor
+
+
+def measure(func, repeat):
+    durations = []
+    for _ in range(repeat):
+        start_time = time.perf_counter()
+        func()
+        durations.append(time.perf_counter() - start_time)
+    return min(durations)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--size", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    logging.getLogger().setLevel(logging.WARNING)
+
+    factory = ProcessorFactoryIterModules()
+    factory.load_processors()
+    context = ProcessorContextMock("")
+    flow = create_flow(args.size)
+
+    launcher = AsyncProcessorLauncher(factory, None)
+    launcher.set_context(context)
+
+    scenarios = [
+        (
+            "signature per node",
+            lambda: [
+                create_processor_with_signature(factory, config, context)
+                for config in flow
+            ],
+        ),
+        (
+            "construction plan",
+            lambda: [factory.create_processor(config, context) for config in flow],
+        ),
+        ("launcher load_processors", lambda: launcher.load_processors(flow)),
+    ]
+
+    print(f"{'scenario':<28}{'total (ms)':>14}{'per node (us)':>16}")
+    for scenario_name, build_processors in scenarios:
+        duration = measure(build_processors, args.repeat)
+        print(
+            f"{scenario_name:<28}{duration * 1000:>14.2f}"
+            f"{duration / args.size * 1e6:>16.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,182 @@
+import asyncio
+import os
+import unittest
+from unittest.mock import patch
+
+from app.utils.web_scrapping.async_browser_manager import AsyncBrowserManager
+from app.utils.web_scrapping.request_blocking import RequestBlocker
+
+
+class FakePage:
+    def __init__(self):
+        self.closed = False
+        self.responsive = True
+        self.handlers = {}
+        self.routes = {}
+
+    def on(self, event, handler):
+        self.handlers[event] = handler
+
+    def crash(self):
+        self.handlers["crash"](self)
+
+    async def route(self, pattern, handler):
+        self.routes[pattern] = handler
+
+    async def unroute(self, pattern, handler):
+        del self.routes[pattern]
+
+    def is_closed(self):
+        return self.closed
+
+    async def evaluate(self, expression):
+        if not self.responsive:
+            await asyncio.sleep(10)
+        return 1
+
+
+class FakeContext:
+    def __init__(self, user_data_dir):
+        self.user_data_dir = user_data_dir
+        self.page = None
+        self.closed = False
+
+    async def new_page(self):
+        self.page = FakePage()
+        return self.page
+
+    async def clear_cookies(self):
+        pass
+
+    async def close(self):
+        self.closed = True
+        self.page.closed = True
+
+
+class FakeChromium:
+    def __init__(self):
+        self.contexts = []
+
+    async def launch_persistent_context(self, user_data_dir, **kwargs):
+        context = FakeContext(user_data_dir)
+        self.contexts.append(context)
+        return context
+
+
+class FakePlaywright:
+    def __init__(self):
+        self.chromium = FakeChromium()
+
+    async def stop(self):
+        pass
+
+
+class TestAsyncBrowserManager(unittest.IsolatedAsyncioTestCase):
+    async def create_manager(self, **kwargs):
+        options = {"pool_size": 3, "min_size": 1, "max_usage": 100, "idle_timeout": 60}
+        options.update(kwargs)
+        manager = AsyncBrowserManager(**options)
+        manager.playwright = FakePlaywright()
+        await manager.initialize_pool()
+        self.addAsyncCleanup(manager.close_browser)
+        return manager
+
+    async def test_pool_grows_up_to_its_size_and_waits_for_a_release(self):
+        manager = await self.create_manager()
+        self.assertEqual(manager.get_metrics()["tabs"], 1)
+
+        tabs = [await manager.get_tab() for _ in range(3)]
+        self.assertEqual(manager.get_metrics()["tabs"], 3)
+
+        with self.assertRaises(Exception):
+            await manager.get_tab(timeout=0.05)
+
+        waiting_tab = asyncio.create_task(manager.get_tab(timeout=1))
+        await asyncio.sleep(0.01)
+        await manager.release_tab(*tabs[0])
+        self.assertIs((await waiting_tab)[0], tabs[0][0])
+        self.assertGreater(manager.get_metrics()["max_wait_time_ms"], 0)
+
+    async def test_tab_is_recycled_after_max_usage(self):
+        manager = await self.create_manager(max_usage=2)
+
+        first_page, context = await manager.get_tab()
+        await manager.release_tab(first_page, context)
+        page, context = await manager.get_tab()
+        await manager.release_tab(page, context)
+        self.assertIs(page, first_page)
+
+        page, context = await manager.get_tab()
+
+        self.assertIsNot(page, first_page)
+        self.assertFalse(
+            os.path.exists(manager.playwright.chromium.contexts[0].user_data_dir)
+        )
+        metrics = manager.get_metrics()
+        self.assertEqual(metrics["recycled_tabs"], 1)
+        self.assertIsNotNone(metrics["average_tab_lifetime_s"])
+
+    async def test_crashed_tab_is_replaced(self):
+        manager = await self.create_manager(pool_size=1)
+
+        page, context = await manager.get_tab()
+        page.crash()
+        await manager.release_tab(page, context)
+        new_page, _ = await manager.get_tab()
+
+        self.assertIsNot(new_page, page)
+        self.assertEqual(manager.get_metrics()["crashed_tabs"], 1)
+
+    async def test_unresponsive_tab_fails_the_liveness_probe(self):
+        manager = await self.create_manager(pool_size=1)
+        page, context = await manager.get_tab()
+        await manager.release_tab(page, context)
+        page.responsive = False
+
+        with patch(
+            "app.utils.web_scrapping.async_browser_manager.LIVENESS_PROBE_TIMEOUT",
+            0.01,
+        ):
+            new_page, _ = await manager.get_tab()
+
+        self.assertIsNot(new_page, page)
+
+    async def test_idle_tabs_are_closed_down_to_the_min_size(self):
+        manager = await self.create_manager(idle_timeout=0)
+        tabs = [await manager.get_tab() for _ in range(3)]
+        for tab in tabs:
+            await manager.release_tab(*tab)
+
+        await asyncio.sleep(0.01)
+        await manager.shrink_idle_tabs()
+
+        metrics = manager.get_metrics()
+        self.assertEqual(metrics["tabs"], 1)
+        self.assertEqual(metrics["shrunk_tabs"], 2)
+        user_data_dirs = [
+            context.user_data_dir for context in manager.playwright.chromium.contexts
+        ]
+        self.assertEqual(sum(os.path.exists(path) for path in user_data_dirs), 1)
+
+    async def test_request_blocker_is_set_until_the_tab_is_released(self):
+        manager = await self.create_manager()
+        request_blocker = RequestBlocker.create(fast_mode=True)
+
+        page, context = await manager.get_tab(request_blocker=request_blocker)
+        self.assertEqual(page.routes, {"**/*": request_blocker.handle_route})
+
+        await manager.release_tab(page, context)
+        self.assertEqual(page.routes, {})
+
+    async def test_profile_directories_are_removed_on_close(self):
+        manager = await self.create_manager()
+        await manager.get_tab()
+
+        await manager.close_browser()
+
+        for context in manager.playwright.chromium.contexts:
+            self.assertFalse(os.path.exists(context.user_data_dir))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,235 @@
+import time
+import unittest
+
+import eventlet
+
+from app.processors.launcher.async_processor_launcher import (
+    AsyncProcessorLauncher,
+    NodeTimeoutError,
+)
+from app.processors.components.core.input_processor import InputProcessor
+from tests.utils.processor_context_mock import ProcessorContextMock
+from tests.utils.processor_factory_mock import ProcessorFactoryMock
+
+
+def create_node_config(name, parents=None, **kwargs):
+    config = {
+        "name": name,
+        "processorType": "llm-prompt",
+        "inputs": [{"inputNode": parent} for parent in (parents or [])],
+    }
+    config.update(kwargs)
+    return config
+
+
+class TestAsyncProcessorLauncher(unittest.TestCase):
+    def setUp(self):
+        self.factory = ProcessorFactoryMock(fake_text_output="Lorem Ipsum")
+        self.launcher = AsyncProcessorLauncher(self.factory, None)
+        self.launcher.set_context(ProcessorContextMock("000000000"))
+
+        self.events = []
+        self.launcher.add_observer(self)
+
+    def notify(self, event, data):
+        self.events.append((event, data.instance_name))
+        if event == "error":
+            self.error_time = time.time()
+
+    def get_completed_node_names(self):
+        return [name for event, name in self.events if event == "progress"]
+
+    def test_chain_runs_every_node_in_order(self):
+        flow = [create_node_config("node-0")]
+        flow += [
+            create_node_config(f"node-{i}", [f"node-{i - 1}"]) for i in range(1, 5)
+        ]
+
+        processors = self.launcher.load_processors(flow)
+        self.launcher.launch_processors(processors)
+
+        self.assertEqual(
+            self.get_completed_node_names(), [f"node-{i}" for i in range(5)]
+        )
+
+    def test_chain_does_not_wait_between_nodes(self):
+        flow = [create_node_config("node-0")]
+        flow += [
+            create_node_config(f"node-{i}", [f"node-{i - 1}"]) for i in range(1, 20)
+        ]
+
+        processors = self.launcher.load_processors(flow)
+        start_time = time.time()
+        self.launcher.launch_processors(processors)
+        duration = time.time() - start_time
+
+        self.assertEqual(len(self.get_completed_node_names()), 20)
+        self.assertLess(duration, 0.5)
+
+    def test_diamond_child_runs_after_every_parent(self):
+        flow = [
+            create_node_config("top"),
+            create_node_config("left", ["top"], sleepDuration=0.1),
+            create_node_config("right", ["top"]),
+            create_node_config("bottom", ["left", "right"]),
+        ]
+
+        processors = self.launcher.load_processors(flow)
+        self.launcher.launch_processors(processors)
+
+        completed = self.get_completed_node_names()
+        self.assertEqual(completed[0], "top")
+        self.assertEqual(completed[-1], "bottom")
+        self.assertCountEqual(completed, ["top", "left", "right", "bottom"])
+
+    def test_error_stops_the_dispatch_of_children(self):
+        flow = [
+            create_node_config("node-0"),
+            create_node_config("node-1", ["node-0"], raiseError=True),
+            create_node_config("node-2", ["node-1"]),
+        ]
+
+        processors = self.launcher.load_processors(flow)
+        self.launcher.launch_processors(processors)
+
+        self.assertIn(("error", "node-1"), self.events)
+        self.assertNotIn("node-2", [name for _, name in self.events])
+
+    def test_error_cancels_running_siblings_and_frees_the_pool(self):
+        flow = [create_node_config("failing", raiseError=True)]
+        flow += [
+            create_node_config(f"slow-{i}", sleepDuration=5)
+            for i in range(AsyncProcessorLauncher.GREENTHREAD_POOL_SIZE - 1)
+        ]
+
+        processors = self.launcher.load_processors(flow)
+        self.launcher.launch_processors(processors)
+        slots_freed_after = time.time() - self.error_time
+        eventlet.sleep(0)
+
+        self.assertLess(slots_freed_after, 0.2)
+        for name, processor in processors.items():
+            if name.startswith("slow"):
+                processor.cancel.assert_called_once()
+                self.assertTrue(processor.is_cancelled)
+        self.assertEqual(self.get_completed_node_names(), [])
+
+    def test_node_timeout_stops_and_cancels_the_node(self):
+        flow = [
+            create_node_config("slow", sleepDuration=5, timeout=0.1),
+            create_node_config("child", ["slow"]),
+        ]
+
+        processors = self.launcher.load_processors(flow)
+        start_time = time.time()
+        self.launcher.launch_processors(processors)
+        duration = time.time() - start_time
+        eventlet.sleep(0)
+
+        self.assertLess(duration, 0.5)
+        self.assertIn(("error", "slow"), self.events)
+        self.assertNotIn("child", [name for _, name in self.events])
+        processors["slow"].cancel.assert_called_once()
+
+    def test_flow_deadline_bounds_every_node(self):
+        flow = [
+            create_node_config("fast"),
+            create_node_config("slow", ["fast"], sleepDuration=5, timeout=60),
+        ]
+
+        processors = self.launcher.load_processors_for_node(flow, "slow")
+        self.launcher.set_deadline(time.time() + 0.2)
+        start_time = time.time()
+        with self.assertRaises(NodeTimeoutError):
+            self.launcher.launch_processors_for_node(processors, "slow")
+
+        self.assertLess(time.time() - start_time, 0.5)
+        self.assertEqual(self.get_completed_node_names(), ["fast"])
+        self.assertLessEqual(processors["slow"].deadline, start_time + 0.2)
+
+    def test_run_node_runs_independent_branches_concurrently(self):
+        flow = [
+            create_node_config("image-branch", sleepDuration=0.3),
+            create_node_config("llm-branch", sleepDuration=0.3),
+            create_node_config("merge", ["image-branch", "llm-branch"]),
+        ]
+
+        processors = self.launcher.load_processors_for_node(flow, "merge")
+        start_time = time.time()
+        self.launcher.launch_processors_for_node(processors, "merge")
+        duration = time.time() - start_time
+
+        self.assertCountEqual(
+            self.get_completed_node_names(), ["image-branch", "llm-branch", "merge"]
+        )
+        self.assertLess(duration, 0.5)
+
+    def test_run_node_skips_nodes_with_supplied_output(self):
+        flow = [
+            create_node_config("root"),
+            create_node_config("parent", ["root"], outputData="Supplied output"),
+            create_node_config("other-parent", ["root"]),
+            create_node_config("target", ["parent", "other-parent"]),
+            create_node_config("child", ["target"]),
+        ]
+
+        processors = self.launcher.load_processors_for_node(flow, "target")
+        self.launcher.launch_processors_for_node(processors, "target")
+
+        completed = self.get_completed_node_names()
+        self.assertEqual(completed, ["root", "other-parent", "target"])
+
+    def test_run_node_does_not_run_ancestors_of_supplied_outputs(self):
+        flow = [
+            create_node_config("root"),
+            create_node_config("parent", ["root"], outputData="Supplied output"),
+            create_node_config("target", ["parent"]),
+        ]
+
+        processors = self.launcher.load_processors_for_node(flow, "target")
+        self.launcher.launch_processors_for_node(processors, "target")
+
+        self.assertEqual(self.get_completed_node_names(), ["target"])
+
+    def test_run_node_raises_the_node_error(self):
+        flow = [
+            create_node_config("parent", raiseError=True),
+            create_node_config("target", ["parent"]),
+        ]
+
+        processors = self.launcher.load_processors_for_node(flow, "target")
+
+        with self.assertRaises(Exception):
+            self.launcher.launch_processors_for_node(processors, "target")
+        self.assertNotIn("target", self.get_completed_node_names())
+
+
+class TestProcessorDeadline(unittest.TestCase):
+    def create_processor(self, **kwargs):
+        config = {"name": "node", "processorType": "input-text", "inputText": ""}
+        config.update(kwargs)
+        return InputProcessor(config)
+
+    def test_remaining_time_is_capped_by_the_deadline(self):
+        processor = self.create_processor()
+        self.assertIsNone(processor.get_remaining_time())
+        self.assertEqual(processor.get_remaining_time(30), 30)
+        self.assertEqual(processor.get_timeout_options(), {})
+
+        processor.deadline = time.time() + 10
+        self.assertLessEqual(processor.get_remaining_time(30), 10)
+        self.assertEqual(processor.get_remaining_time(1), 1)
+        self.assertLessEqual(processor.get_timeout_options()["timeout"], 10)
+
+        processor.deadline = time.time() - 1
+        self.assertEqual(processor.get_remaining_time(30), 0)
+
+    def test_timeout_is_read_from_the_config(self):
+        self.assertEqual(self.create_processor(timeout="2.5").get_timeout(), 2.5)
+        self.assertIsNone(self.create_processor(timeout="").get_timeout())
+        self.assertIsNone(self.create_processor(timeout="invalid").get_timeout())
+        self.assertIsNone(self.create_processor().get_timeout())
+
+
+if __name__ == "__main__":
+    unittest.main()
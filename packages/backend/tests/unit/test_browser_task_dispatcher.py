@@ -0,0 +1,70 @@
+import asyncio
+import queue
+import time
+import unittest
+
+from app.tasks.single_thread_tasks.browser.browser_task_dispatcher import (
+    BrowserTaskDispatcher,
+)
+from app.tasks.task_exception import BrowserTaskError
+
+
+class BrowserManagerStub:
+    def __init__(self, pool_size):
+        self.pool_size = pool_size
+
+
+class TestBrowserTaskDispatcher(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.running = 0
+        self.max_running = 0
+
+    async def load_page(self, task_data, browser_manager):
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        try:
+            await asyncio.sleep(0.05)
+            if task_data["url"].endswith("error"):
+                raise RuntimeError("Page crashed")
+            return f"content of {task_data['url']}"
+        finally:
+            self.running -= 1
+
+    async def dispatch(self, urls, pool_size):
+        task_queue = asyncio.Queue()
+        result_queues = []
+        for url in urls:
+            result_queue = queue.Queue()
+            result_queues.append(result_queue)
+            await task_queue.put(({"url": url}, result_queue))
+        await task_queue.put((None, None))
+
+        dispatcher = BrowserTaskDispatcher(
+            BrowserManagerStub(pool_size), self.load_page
+        )
+        await dispatcher.run(task_queue)
+        return [result_queue.get_nowait() for result_queue in result_queues]
+
+    async def test_tasks_run_concurrently_up_to_the_pool_size(self):
+        urls = [f"https://example.com/{i}" for i in range(6)]
+
+        start_time = time.perf_counter()
+        results = await self.dispatch(urls, pool_size=3)
+        duration = time.perf_counter() - start_time
+
+        self.assertEqual(results, [f"content of {url}" for url in urls])
+        self.assertEqual(self.max_running, 3)
+        self.assertLess(duration, 0.25)
+
+    async def test_failed_task_reports_an_error_to_its_caller(self):
+        results = await self.dispatch(
+            ["https://example.com/ok", "https://example.com/error"], pool_size=2
+        )
+
+        self.assertEqual(results[0], "content of https://example.com/ok")
+        self.assertIsInstance(results[1], BrowserTaskError)
+        self.assertEqual(results[1].url, "https://example.com/error")
+
+
+if __name__ == "__main__":
+    unittest.main()
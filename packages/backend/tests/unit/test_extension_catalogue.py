@@ -0,0 +1,98 @@
+import gzip
+import json
+import os
+import unittest
+from unittest.mock import patch
+
+from flask import Flask
+from werkzeug.datastructures import Accept
+
+from app.flask.app_routes.node_routes import node_blueprint
+from app.root_injector import refresh_root_injector
+from app.utils.extension_catalogue import ExtensionCatalogue, ExtensionCatalogueStore
+
+EXTENSIONS = [
+    {"processorType": "first-extension", "nodeName": "First"},
+    {"processorType": "second-extension", "nodeName": "Second"},
+]
+
+
+def fake_get_extensions():
+    blacklist = os.getenv("EXTENSIONS_BLACKLIST", "").split(",")
+    return [e for e in EXTENSIONS if e["processorType"] not in blacklist]
+
+
+@patch("app.utils.extension_catalogue.get_extensions", side_effect=fake_get_extensions)
+class TestExtensionCatalogue(unittest.TestCase):
+    def setUp(self):
+        refresh_root_injector()
+        app = Flask(__name__)
+        app.register_blueprint(node_blueprint)
+        self.client = app.test_client()
+
+    def test_catalogue_is_serialised_once(self, get_extensions):
+        store = ExtensionCatalogueStore()
+
+        catalogue = store.get_catalogue()
+        self.assertIs(store.get_catalogue(), catalogue)
+
+        get_extensions.assert_called_once()
+        self.assertEqual(json.loads(catalogue.body), {"extensions": EXTENSIONS})
+        self.assertEqual(gzip.decompress(catalogue.get_body("gzip")), catalogue.body)
+
+    def test_catalogue_is_rebuilt_when_the_filters_change(self, get_extensions):
+        store = ExtensionCatalogueStore()
+        catalogue = store.get_catalogue()
+
+        with patch.dict(os.environ, {"EXTENSIONS_BLACKLIST": "first-extension"}):
+            filtered_catalogue = store.get_catalogue()
+
+        self.assertNotEqual(filtered_catalogue.etag, catalogue.etag)
+        self.assertEqual(
+            json.loads(filtered_catalogue.body), {"extensions": EXTENSIONS[1:]}
+        )
+
+    def test_select_encoding_prefers_the_accepted_precompressed_body(self, _):
+        catalogue = ExtensionCatalogue.build(EXTENSIONS)
+
+        self.assertEqual(catalogue.select_encoding(Accept([("gzip", 1)])), "gzip")
+        self.assertIsNone(catalogue.select_encoding(Accept([("deflate", 1)])))
+        self.assertIsNone(catalogue.select_encoding(Accept([("gzip", 0)])))
+
+    def test_route_serves_the_catalogue_with_an_etag(self, _):
+        response = self.client.get("/node/extensions")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.get_json(), {"extensions": EXTENSIONS})
+        self.assertIsNotNone(response.headers.get("ETag"))
+        self.assertEqual(response.headers["Vary"], "Accept-Encoding")
+
+    def test_route_answers_not_modified_for_a_known_etag(self, _):
+        etag = self.client.get("/node/extensions").headers["ETag"]
+
+        response = self.client.get("/node/extensions", headers={"If-None-Match": etag})
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.data, b"")
+
+    def test_route_serves_the_gzip_body(self, _):
+        response = self.client.get(
+            "/node/extensions", headers={"Accept-Encoding": "gzip"}
+        )
+
+        self.assertEqual(response.headers["Content-Encoding"], "gzip")
+        self.assertEqual(
+            json.loads(gzip.decompress(response.data)), {"extensions": EXTENSIONS}
+        )
+
+    def test_catalogue_is_rebuilt_after_refresh_root_injector(self, get_extensions):
+        self.client.get("/node/extensions")
+        self.client.get("/node/extensions")
+        refresh_root_injector()
+        self.client.get("/node/extensions")
+
+        self.assertEqual(get_extensions.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
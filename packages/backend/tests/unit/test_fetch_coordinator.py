@@ -0,0 +1,198 @@
+import unittest
+
+import eventlet
+
+from app.utils.fetch_coordinator import FetchCoordinator, get_fetch_key
+
+
+class TestFetchCoordinator(unittest.TestCase):
+    def setUp(self):
+        self.calls = []
+        self.running = 0
+        self.max_running = 0
+
+    def create_fetch(self, result, delay=0.02, error=None):
+        def fetch():
+            self.calls.append(result)
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+            try:
+                eventlet.sleep(delay)
+                if error is not None:
+                    raise error
+                return result
+            finally:
+                self.running -= 1
+
+        return fetch
+
+    def test_identical_fetches_in_flight_are_merged(self):
+        coordinator = FetchCoordinator(max_per_host=4, cache_ttl=0)
+        pool = eventlet.GreenPool()
+        greenthreads = [
+            pool.spawn(
+                coordinator.fetch,
+                "https://example.com/article",
+                self.create_fetch({"content": "article"}),
+                {"selectors": ["main"]},
+            )
+            for _ in range(5)
+        ]
+
+        results = [greenthread.wait() for greenthread in greenthreads]
+
+        self.assertEqual(results, [{"content": "article"}] * 5)
+        self.assertEqual(len(self.calls), 1)
+        self.assertEqual(coordinator.get_metrics()["coalesced"], 4)
+        results[1]["content"] = "modified"
+        self.assertEqual(results[0], {"content": "article"})
+
+    def test_concurrency_is_capped_per_host(self):
+        coordinator = FetchCoordinator(max_per_host=2, cache_ttl=0)
+        pool = eventlet.GreenPool()
+        for i in range(6):
+            pool.spawn(
+                coordinator.fetch,
+                f"https://example.com/page-{i}",
+                self.create_fetch(f"page-{i}"),
+            )
+        pool.spawn(coordinator.fetch, "https://other.com/", self.create_fetch("other"))
+        pool.waitall()
+
+        self.assertEqual(len(self.calls), 7)
+        self.assertEqual(self.max_running, 3)
+        self.assertEqual(coordinator.get_metrics()["hosts"], 0)
+
+    def test_results_are_cached_per_url_and_options(self):
+        coordinator = FetchCoordinator(max_per_host=2, cache_ttl=60)
+
+        coordinator.fetch("https://example.com/", self.create_fetch("a", 0))
+        cached = coordinator.fetch("https://example.com/", self.create_fetch("b", 0))
+        other_options = coordinator.fetch(
+            "https://example.com/",
+            self.create_fetch("c", 0),
+            options={"with_html_tags": True},
+        )
+
+        self.assertEqual(cached, "a")
+        self.assertEqual(other_options, "c")
+        self.assertEqual(self.calls, ["a", "c"])
+
+    def test_rejected_results_are_not_cached(self):
+        coordinator = FetchCoordinator(max_per_host=2, cache_ttl=60)
+
+        coordinator.fetch("https://example.com/", self.create_fetch("", 0), None, bool)
+        coordinator.fetch("https://example.com/", self.create_fetch("a", 0), None, bool)
+
+        self.assertEqual(self.calls, ["", "a"])
+
+    def test_max_age_caps_the_age_of_the_cached_result(self):
+        coordinator = FetchCoordinator(max_per_host=2, cache_ttl=60)
+        url = "https://example.com/"
+
+        coordinator.fetch(url, self.create_fetch("a", 0), max_age=0)
+        coordinator.fetch(url, self.create_fetch("b", 0), max_age=0)
+        eventlet.sleep(0.05)
+        recent = coordinator.fetch(url, self.create_fetch("c", 0), max_age=0.01)
+        cached = coordinator.fetch(url, self.create_fetch("d", 0), max_age=30)
+
+        self.assertEqual(recent, "c")
+        self.assertEqual(cached, "c")
+        self.assertEqual(self.calls, ["a", "b", "c"])
+
+    def test_fetches_in_flight_are_merged_without_cached_result(self):
+        coordinator = FetchCoordinator(max_per_host=2, cache_ttl=60)
+        pool = eventlet.GreenPool()
+        for _ in range(3):
+            pool.spawn(
+                coordinator.fetch,
+                "https://example.com/",
+                self.create_fetch("a"),
+                max_age=0,
+            )
+        pool.waitall()
+
+        self.assertEqual(self.calls, ["a"])
+
+    def test_error_is_raised_to_every_merged_caller_and_not_cached(self):
+        coordinator = FetchCoordinator(max_per_host=2, cache_ttl=60)
+        pool = eventlet.GreenPool()
+        fetch = self.create_fetch(None, error=ConnectionError("Unreachable"))
+        greenthreads = [
+            pool.spawn(coordinator.fetch, "https://example.com/", fetch)
+            for _ in range(3)
+        ]
+
+        for greenthread in greenthreads:
+            with self.assertRaises(ConnectionError):
+                greenthread.wait()
+
+        self.assertEqual(len(self.calls), 1)
+        self.assertEqual(
+            coordinator.fetch("https://example.com/", self.create_fetch("a", 0)), "a"
+        )
+
+    def test_merged_callers_retry_when_the_fetch_is_killed(self):
+        coordinator = FetchCoordinator(max_per_host=2, cache_ttl=0)
+        leader = eventlet.spawn(
+            coordinator.fetch, "https://example.com/", self.create_fetch("a", 1)
+        )
+        eventlet.sleep(0)
+        follower = eventlet.spawn(
+            coordinator.fetch, "https://example.com/", self.create_fetch("b", 0)
+        )
+        eventlet.sleep(0)
+
+        leader.kill()
+
+        with eventlet.Timeout(1):
+            self.assertEqual(follower.wait(), "b")
+        self.assertEqual(coordinator.get_metrics()["retried"], 1)
+        self.assertEqual(coordinator.get_metrics()["in_flight"], 0)
+
+    def test_timeout_and_cancellation_errors_are_not_passed_on(self):
+        for error, is_cancelled in [
+            (TimeoutError("Node timeout"), False),
+            (ConnectionError("Response closed"), True),
+        ]:
+            with self.subTest(error=error):
+                coordinator = FetchCoordinator(max_per_host=2, cache_ttl=0)
+                leader = eventlet.spawn(
+                    coordinator.fetch,
+                    "https://example.com/",
+                    self.create_fetch(None, error=error),
+                    is_cancelled=lambda: is_cancelled,
+                )
+                eventlet.sleep(0)
+                follower = eventlet.spawn(
+                    coordinator.fetch, "https://example.com/", self.create_fetch("b")
+                )
+
+                with self.assertRaises(type(error)):
+                    leader.wait()
+                self.assertEqual(follower.wait(), "b")
+
+    def test_merged_caller_fetches_itself_after_the_coalesce_timeout(self):
+        coordinator = FetchCoordinator(
+            max_per_host=2, cache_ttl=0, coalesce_timeout=0.05
+        )
+        leader = eventlet.spawn(
+            coordinator.fetch, "https://example.com/", self.create_fetch("a", 1)
+        )
+        eventlet.sleep(0)
+
+        result = coordinator.fetch("https://example.com/", self.create_fetch("b", 0))
+
+        self.assertEqual(result, "b")
+        self.assertEqual(coordinator.get_metrics()["coalesce_timeouts"], 1)
+        leader.kill()
+
+    def test_fetch_key_does_not_contain_the_options(self):
+        key = get_fetch_key("https://example.com/", {"headers": {"Authorization": "t"}})
+
+        self.assertNotIn("Authorization", key)
+        self.assertNotEqual(key, get_fetch_key("https://example.com/"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,85 @@
+import unittest
+
+from app.processors.launcher.flow_graph import FlowCycleError, FlowGraph
+
+
+def create_node_config(name, parents=None):
+    return {
+        "name": name,
+        "processorType": "llm-prompt",
+        "inputs": [{"inputNode": parent} for parent in (parents or [])],
+    }
+
+
+class TestFlowGraph(unittest.TestCase):
+    def test_topological_order_puts_parents_first(self):
+        graph = FlowGraph(
+            [
+                create_node_config("bottom", ["left", "right"]),
+                create_node_config("left", ["top"]),
+                create_node_config("right", ["top"]),
+                create_node_config("top"),
+            ]
+        )
+
+        order = graph.topological_order
+        self.assertEqual(order[0], "top")
+        self.assertEqual(order[-1], "bottom")
+        self.assertCountEqual(order, ["top", "left", "right", "bottom"])
+
+    def test_parents_and_children_are_indexed(self):
+        graph = FlowGraph(
+            [
+                create_node_config("top"),
+                create_node_config("child", ["top", "top"]),
+            ]
+        )
+
+        self.assertEqual(graph.get_parents("child"), ["top"])
+        self.assertEqual(graph.get_children("top"), ["child"])
+        self.assertEqual(graph.get_config("top")["name"], "top")
+        self.assertIsNone(graph.get_config("unknown"))
+
+    def test_related_node_names_only_contains_ancestors(self):
+        graph = FlowGraph(
+            [
+                create_node_config("root"),
+                create_node_config("parent", ["root"]),
+                create_node_config("unrelated", ["root"]),
+                create_node_config("target", ["parent"]),
+                create_node_config("child", ["target"]),
+            ]
+        )
+
+        self.assertEqual(
+            graph.get_related_node_names("target"), ["root", "parent", "target"]
+        )
+        self.assertEqual(graph.get_related_node_names("unknown"), [])
+
+    def test_unknown_input_node_is_not_an_edge(self):
+        graph = FlowGraph([create_node_config("node", ["deleted-node"])])
+
+        self.assertEqual(graph.topological_order, ["node"])
+        self.assertEqual(graph.get_related_node_names("node"), ["node"])
+
+    def test_cycle_raises_a_clear_error(self):
+        with self.assertRaises(FlowCycleError) as context:
+            FlowGraph(
+                [
+                    create_node_config("root"),
+                    create_node_config("a", ["root", "c"]),
+                    create_node_config("b", ["a"]),
+                    create_node_config("c", ["b"]),
+                    create_node_config("after_cycle", ["c"]),
+                    create_node_config("self_loop", ["self_loop"]),
+                ]
+            )
+
+        self.assertCountEqual(
+            context.exception.node_names, ["a", "b", "c", "self_loop"]
+        )
+        self.assertIn("cycle", str(context.exception))
+
+
+if __name__ == "__main__":
+    unittest.main()
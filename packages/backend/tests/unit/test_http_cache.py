@@ -0,0 +1,270 @@
+import gzip
+import os
+import tempfile
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+from app.env_config import get_cache_folder_path, get_local_storage_folder_path
+from app.processors.components.extension.http_get_processor import HttpGetProcessor
+from app.utils.fetch_coordinator import FetchCoordinator
+from app.utils.http_cache import (
+    CacheEntry,
+    HttpCache,
+    create_cached_session,
+    get_cache_control_headers,
+    get_freshness_lifetime,
+)
+
+from tests.utils.processor_context_mock import ProcessorContextMock
+
+ETAG = '"v1"'
+LAST_MODIFIED = "Mon, 01 Jan 2024 00:00:00 GMT"
+
+
+class CacheableHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    received = []
+
+    def do_GET(self):
+        CacheableHandler.received.append((self.path, dict(self.headers)))
+        headers = {"Content-Type": "text/html; charset=utf-8"}
+        body = f"<p>{self.path}</p>".encode("utf-8")
+
+        if self.path == "/fresh":
+            headers["Cache-Control"] = "max-age=60"
+        elif self.path in ("/etag", "/stale"):
+            headers["Cache-Control"] = (
+                "no-cache" if self.path == "/etag" else "max-age=0"
+            )
+            headers["ETag"] = ETAG
+            if self.headers.get("If-None-Match") == ETAG:
+                self.send_response(304)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.end_headers()
+                return
+        elif self.path == "/last-modified":
+            headers["Last-Modified"] = LAST_MODIFIED
+            if self.headers.get("If-Modified-Since") == LAST_MODIFIED:
+                self.send_response(304)
+                self.end_headers()
+                return
+        elif self.path == "/public":
+            headers["Cache-Control"] = "public, max-age=60"
+        elif self.path == "/no-store":
+            headers["Cache-Control"] = "no-store"
+        elif self.path == "/gzip":
+            headers["Cache-Control"] = "max-age=60"
+            headers["Content-Encoding"] = "gzip"
+            body = gzip.compress(body)
+
+        self.send_response(200)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestCachingHTTPAdapter(unittest.TestCase):
+    def setUp(self):
+        CacheableHandler.received = []
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), CacheableHandler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+        self.base_url = f"http://127.0.0.1:{self.server.server_port}"
+
+        cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(cache_dir.cleanup)
+        self.cache = HttpCache(cache_dir.name, max_size=1024 * 1024)
+        self.session = create_cached_session(self.cache)
+        self.addCleanup(self.session.close)
+
+    def get(self, path, **kwargs):
+        return self.session.get(f"{self.base_url}{path}", **kwargs)
+
+    def test_fresh_response_is_served_without_request(self):
+        first = self.get("/fresh")
+        second = self.get("/fresh")
+
+        self.assertEqual(second.text, first.text)
+        self.assertTrue(getattr(second, "from_cache", False))
+        self.assertEqual(len(CacheableHandler.received), 1)
+
+    def test_stale_response_is_revalidated_with_its_etag(self):
+        first = self.get("/etag")
+        second = self.get("/etag")
+
+        self.assertEqual(second.status_code, 200)
+        self.assertEqual(second.text, first.text)
+        self.assertTrue(second.from_cache)
+        self.assertEqual(CacheableHandler.received[1][1].get("If-None-Match"), ETAG)
+        self.assertEqual(self.cache.get_metrics()["revalidated"], 1)
+
+    def test_max_stale_serves_a_stale_response(self):
+        self.get("/stale")
+        self.get("/stale", headers={"Cache-Control": "max-stale=60"})
+
+        self.assertEqual(len(CacheableHandler.received), 1)
+
+    def test_max_stale_does_not_apply_to_no_cache_responses(self):
+        self.get("/etag")
+        self.get("/etag", headers={"Cache-Control": "max-stale=60"})
+
+        self.assertEqual(len(CacheableHandler.received), 2)
+
+    def test_no_store_response_is_not_cached(self):
+        self.get("/no-store")
+        self.get("/no-store")
+
+        self.assertEqual(len(CacheableHandler.received), 2)
+        self.assertEqual(self.cache.get_metrics()["entries"], 0)
+
+    def test_decoded_body_is_cached(self):
+        first = self.get("/gzip")
+        second = self.get("/gzip")
+
+        self.assertEqual(second.text, "<p>/gzip</p>")
+        self.assertEqual(second.text, first.text)
+        self.assertNotIn("Content-Encoding", second.headers)
+
+    def test_partially_read_stream_is_not_cached(self):
+        response = self.get("/fresh", stream=True)
+        next(response.iter_content(chunk_size=2))
+        response.close()
+
+        self.assertEqual(self.cache.get_metrics()["entries"], 0)
+
+    def test_requests_with_other_headers_do_not_share_entries(self):
+        self.get("/public", headers={"Authorization": "Bearer a"})
+        self.get("/public", headers={"Authorization": "Bearer b"})
+
+        self.assertEqual(len(CacheableHandler.received), 2)
+
+    def test_responses_to_requests_with_credentials_are_stored_only_if_public(self):
+        for headers in [{"Authorization": "Bearer a"}, {"Cookie": "session=a"}]:
+            self.get("/fresh", headers=headers)
+            self.get("/public", headers=headers)
+
+        self.assertEqual(self.cache.get_metrics()["entries"], 2)
+
+    def run_http_get(self, path, max_staleness):
+        processor = HttpGetProcessor(
+            {
+                "name": "http",
+                "processorType": HttpGetProcessor.processor_type,
+                "url": f"{self.base_url}{path}",
+                "max_staleness": max_staleness,
+            },
+            ProcessorContextMock(""),
+        )
+        return processor.process()
+
+    def test_http_get_result_is_shared_only_within_max_staleness(self):
+        module = "app.processors.components.extension.http_get_processor"
+        coordinator = FetchCoordinator(max_per_host=2, cache_ttl=60)
+        with patch(f"{module}.get_fetch_coordinator", return_value=coordinator):
+            with patch(f"{module}.get_cached_session", return_value=self.session):
+                for path, max_staleness in [
+                    ("/", 0),
+                    ("/", 0),
+                    ("/etag", 60),
+                    ("/etag", 60),
+                    ("/stale", 60),
+                    ("/stale", 60),
+                ]:
+                    self.assertEqual(
+                        self.run_http_get(path, max_staleness), f"<p>{path}</p>"
+                    )
+
+        paths = [path for path, headers in CacheableHandler.received]
+        self.assertEqual(paths, ["/", "/", "/etag", "/etag", "/stale"])
+
+    def test_http_get_without_max_staleness_always_revalidates(self):
+        module = "app.processors.components.extension.http_get_processor"
+        coordinator = FetchCoordinator(max_per_host=2, cache_ttl=60)
+        with patch(f"{module}.get_fetch_coordinator", return_value=coordinator):
+            with patch(f"{module}.get_cached_session", return_value=self.session):
+                for path in ["/fresh", "/fresh", "/last-modified", "/last-modified"]:
+                    self.assertEqual(self.run_http_get(path, 0), f"<p>{path}</p>")
+
+        self.assertEqual(len(CacheableHandler.received), 4)
+        self.assertEqual(
+            CacheableHandler.received[3][1].get("If-Modified-Since"), LAST_MODIFIED
+        )
+        self.assertEqual(self.cache.get_metrics()["revalidated"], 1)
+
+    def test_max_staleness_of_0_asks_for_a_revalidation(self):
+        self.assertEqual(get_cache_control_headers(0), {"Cache-Control": "no-cache"})
+        self.assertEqual(
+            get_cache_control_headers("30"), {"Cache-Control": "max-stale=30"}
+        )
+
+
+class TestHttpCache(unittest.TestCase):
+    def setUp(self):
+        cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(cache_dir.cleanup)
+        self.cache_dir = cache_dir.name
+
+    def create_entry(self, size):
+        return CacheEntry(
+            url="https://example.com/",
+            status_code=200,
+            headers={"ETag": ETAG},
+            stored_at=time.time(),
+            initial_age=0,
+            freshness_lifetime=60,
+            must_revalidate=False,
+            size=size,
+        )
+
+    def test_least_recently_used_entries_are_evicted(self):
+        cache = HttpCache(self.cache_dir, max_size=250, max_entry_size=100)
+        for key in ("a", "b"):
+            cache.set(key, self.create_entry(100), b"x" * 100)
+        cache.get("a")
+
+        cache.set("c", self.create_entry(100), b"x" * 100)
+
+        self.assertIsNotNone(cache.get("a")[0])
+        self.assertIsNone(cache.get("b")[0])
+        self.assertEqual(cache.get_size(), 200)
+
+    def test_entries_are_kept_across_instances(self):
+        HttpCache(self.cache_dir).set("a", self.create_entry(4), b"body")
+
+        entry, body = HttpCache(self.cache_dir).get("a")
+
+        self.assertEqual(body, b"body")
+        self.assertEqual(entry.headers["ETag"], ETAG)
+
+    def test_cache_is_not_stored_in_the_served_local_storage(self):
+        local_storage = os.path.join(get_local_storage_folder_path(), "")
+
+        self.assertFalse(get_cache_folder_path().startswith(local_storage))
+
+    def test_freshness_falls_back_to_expires_and_last_modified(self):
+        now = time.time()
+        expires = {
+            "Date": "Mon, 01 Jan 2024 00:00:00 GMT",
+            "Expires": "Mon, 01 Jan 2024 00:10:00 GMT",
+        }
+        last_modified = {
+            "Date": "Mon, 01 Jan 2024 00:00:00 GMT",
+            "Last-Modified": "Sun, 31 Dec 2023 23:00:00 GMT",
+        }
+
+        self.assertEqual(get_freshness_lifetime(expires, now), 600)
+        self.assertEqual(get_freshness_lifetime(last_modified, now), 360)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,102 @@
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+from requests.adapters import HTTPAdapter
+
+from app.utils.http_session import create_session, get_http_metrics
+
+
+class FlakyHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    failures_left = 0
+    received = []
+
+    def respond(self):
+        FlakyHandler.received.append((self.command, self.path, self.headers))
+        self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        status = 200
+        if FlakyHandler.failures_left > 0:
+            FlakyHandler.failures_left -= 1
+            status = 503
+        body = b"OK"
+        self.send_response(status)
+        self.send_header("Set-Cookie", "session=user-a; Path=/")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_GET = respond
+    do_POST = respond
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestHttpSession(unittest.TestCase):
+    def setUp(self):
+        FlakyHandler.failures_left = 0
+        FlakyHandler.received = []
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), FlakyHandler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+
+        self.url = f"http://127.0.0.1:{self.server.server_port}/"
+        self.session = create_session(max_retries=2)
+        self.addCleanup(self.session.close)
+
+    def test_connections_are_reused_and_measured(self):
+        for _ in range(4):
+            self.session.get(self.url)
+
+        metrics = get_http_metrics(self.session)
+        self.assertEqual(metrics["requests"], 4)
+        self.assertEqual(metrics["connections_opened"], 1)
+        self.assertEqual(metrics["connection_reuse_rate"], 0.75)
+        host_metrics = metrics["hosts"][f"127.0.0.1:{self.server.server_port}"]
+        self.assertEqual(host_metrics["requests"], 4)
+
+    def test_get_is_retried_on_gateway_errors(self):
+        FlakyHandler.failures_left = 1
+
+        with patch("urllib3.util.retry.Retry.sleep"):
+            response = self.session.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(FlakyHandler.received), 2)
+
+    def test_post_is_not_retried(self):
+        FlakyHandler.failures_left = 1
+
+        response = self.session.post(self.url, data={"key": "value"})
+
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(len(FlakyHandler.received), 1)
+
+    def test_cookies_of_a_response_are_not_sent_on_the_next_requests(self):
+        self.session.get(self.url)
+        self.session.get(self.url)
+        self.session.get(self.url, cookies={"own": "cookie"})
+
+        cookie_headers = [
+            headers.get("Cookie") for _, _, headers in FlakyHandler.received
+        ]
+        self.assertEqual(cookie_headers, [None, None, "own=cookie"])
+        self.assertEqual(len(self.session.cookies), 0)
+
+    def test_default_timeout_is_only_used_without_one(self):
+        with patch.object(
+            HTTPAdapter, "send", autospec=True, side_effect=HTTPAdapter.send
+        ) as send:
+            self.session.get(self.url)
+            self.session.get(self.url, timeout=3)
+
+        default_timeout = send.call_args_list[0].kwargs["timeout"]
+        self.assertIsNotNone(default_timeout)
+        self.assertEqual(send.call_args_list[1].kwargs["timeout"], 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
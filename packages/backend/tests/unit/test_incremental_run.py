@@ -0,0 +1,134 @@
+import unittest
+
+from app.processors.cache.flow_run_store import FlowRunStore
+from app.processors.launcher.async_processor_launcher import AsyncProcessorLauncher
+from tests.utils.processor_context_mock import ProcessorContextMock
+from tests.utils.processor_factory_mock import ProcessorFactoryMock
+
+
+def create_node_config(name, parents=None, **kwargs):
+    config = {
+        "name": name,
+        "processorType": "llm-prompt",
+        "inputs": [{"inputNode": parent} for parent in (parents or [])],
+    }
+    config.update(kwargs)
+    return config
+
+
+def create_flow(prompt="First prompt"):
+    return [
+        create_node_config("root"),
+        create_node_config("edited", ["root"], prompt=prompt),
+        create_node_config("untouched", ["root"]),
+        create_node_config("downstream", ["edited"]),
+    ]
+
+
+class TestFlowRunStore(unittest.TestCase):
+    def test_output_is_only_returned_for_the_same_fingerprint(self):
+        store = FlowRunStore(max_sessions=10, ttl=60)
+        store.enable_session("session")
+        store.set_output("session", "node", "fingerprint", ["output"])
+
+        self.assertEqual(store.get_output("session", "node", "fingerprint"), ["output"])
+        self.assertIsNone(store.get_output("session", "node", "other"))
+        self.assertIsNone(store.get_output("other-session", "node", "fingerprint"))
+
+    def test_clear_session_removes_its_outputs(self):
+        store = FlowRunStore(max_sessions=10, ttl=60)
+        store.enable_session("session")
+        store.set_output("session", "node", "fingerprint", ["output"])
+        store.clear_session("session")
+
+        self.assertIsNone(store.get_output("session", "node", "fingerprint"))
+
+    def test_sessions_without_incremental_runs_are_not_recorded(self):
+        store = FlowRunStore(max_sessions=10, ttl=60)
+        store.set_output("session", "node", "fingerprint", ["output"])
+
+        self.assertFalse(store.is_session_enabled("session"))
+        self.assertIsNone(store.get_output("session", "node", "fingerprint"))
+
+    def test_outputs_beyond_the_session_size_are_not_recorded(self):
+        store = FlowRunStore(max_sessions=10, ttl=60, max_session_size=20)
+        store.enable_session("session")
+        store.set_output("session", "first", "fingerprint", ["a" * 10])
+        store.set_output("session", "second", "fingerprint", ["b" * 10])
+        store.set_output("session", "first", "fingerprint", ["c" * 2])
+
+        self.assertIsNone(store.get_output("session", "second", "fingerprint"))
+        self.assertEqual(store.get_output("session", "first", "fingerprint"), ["cc"])
+
+
+class TestIncrementalRun(unittest.TestCase):
+    def setUp(self):
+        self.store = FlowRunStore(max_sessions=10, ttl=60)
+        self.events = []
+
+    def notify(self, event, data):
+        self.events.append((event, data.instance_name, data.cache_status))
+
+    def run_flow(self, flow, incremental, session_id=1, output="Lorem Ipsum"):
+        launcher = AsyncProcessorLauncher(
+            ProcessorFactoryMock(fake_text_output=output),
+            None,
+            flow_run_store=self.store,
+        )
+        launcher.set_context(ProcessorContextMock("", user_id=session_id))
+        launcher.add_observer(self)
+
+        self.events = []
+        processors = launcher.load_processors(flow)
+        launcher.launch_processors(processors, incremental=incremental)
+
+    def get_executed_node_names(self):
+        return [
+            name
+            for event, name, cache_status in self.events
+            if event == "progress" and cache_status != "hit"
+        ]
+
+    def test_unchanged_nodes_reuse_their_previous_output(self):
+        self.run_flow(create_flow(), incremental=True)
+        self.run_flow(create_flow(), incremental=True)
+
+        self.assertEqual(self.get_executed_node_names(), [])
+        self.assertCountEqual(
+            [name for event, name, _ in self.events if event == "progress"],
+            ["root", "edited", "untouched", "downstream"],
+        )
+
+    def test_edited_node_and_downstream_nodes_are_executed_again(self):
+        self.run_flow(create_flow(), incremental=True)
+        self.run_flow(create_flow("Second prompt"), incremental=True, output="New")
+
+        self.assertEqual(self.get_executed_node_names(), ["edited", "downstream"])
+
+    def test_downstream_node_is_reused_when_the_new_output_is_unchanged(self):
+        self.run_flow(create_flow(), incremental=True)
+        self.run_flow(create_flow("Second prompt"), incremental=True)
+
+        self.assertEqual(self.get_executed_node_names(), ["edited"])
+
+    def test_full_run_executes_every_node(self):
+        self.run_flow(create_flow(), incremental=False)
+        self.run_flow(create_flow(), incremental=False)
+
+        self.assertEqual(len(self.get_executed_node_names()), 4)
+
+    def test_full_runs_are_not_recorded_before_an_incremental_run(self):
+        self.run_flow(create_flow(), incremental=False)
+        self.run_flow(create_flow(), incremental=True)
+
+        self.assertEqual(len(self.get_executed_node_names()), 4)
+
+    def test_outputs_are_not_shared_between_sessions(self):
+        self.run_flow(create_flow(), incremental=True, session_id=1)
+        self.run_flow(create_flow(), incremental=True, session_id=2)
+
+        self.assertEqual(len(self.get_executed_node_names()), 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
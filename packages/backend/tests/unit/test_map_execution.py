@@ -0,0 +1,193 @@
+import time
+import unittest
+
+from app.processors.components.core.display_processor import DisplayProcessor
+from app.processors.launcher.async_processor_launcher import AsyncProcessorLauncher
+from app.processors.launcher.map_execution import MapConfig, MapErrorPolicy
+from tests.utils.processor_context_mock import ProcessorContextMock
+from tests.utils.processor_factory_mock import ProcessorFactoryMock
+
+
+def create_node_config(name, parents=None, processor_type="llm-prompt", **kwargs):
+    config = {
+        "name": name,
+        "processorType": processor_type,
+        "inputs": [{"inputNode": parent} for parent in (parents or [])],
+    }
+    config.update(kwargs)
+    return config
+
+
+class TestMapConfig(unittest.TestCase):
+    def test_node_without_map_mode_has_no_map_config(self):
+        self.assertIsNone(MapConfig.from_node_config(create_node_config("node", ["a"])))
+
+    def test_map_config_defaults_to_the_first_input(self):
+        map_config = MapConfig.from_node_config(
+            create_node_config("node", ["a", "b"], executionMode="map")
+        )
+
+        self.assertEqual(map_config.mapped_input_indexes, [0])
+        self.assertEqual(map_config.concurrency, MapConfig.DEFAULT_CONCURRENCY)
+        self.assertEqual(map_config.error_policy, MapErrorPolicy.FAIL)
+
+    def test_item_config_points_mapped_inputs_to_the_item(self):
+        config = create_node_config("node", ["a", "b"], executionMode="map")
+        config["inputs"][1]["mapOver"] = True
+        map_config = MapConfig.from_node_config(config)
+
+        item_config = map_config.create_item_config(config, 3)
+
+        self.assertEqual(map_config.mapped_input_indexes, [1])
+        self.assertNotIn("inputNodeOutputKey", item_config["inputs"][0])
+        self.assertEqual(item_config["inputs"][1]["inputNodeOutputKey"], 3)
+        self.assertNotIn("inputNodeOutputKey", config["inputs"][1])
+
+    def test_unknown_error_policy_raises(self):
+        with self.assertRaises(ValueError):
+            MapConfig.from_node_config(
+                create_node_config(
+                    "node", ["a"], executionMode="map", mapErrorPolicy="retry"
+                )
+            )
+
+
+class TestMapExecution(unittest.TestCase):
+    def setUp(self):
+        self.factory = ProcessorFactoryMock(
+            fake_text_output="Lorem Ipsum", fake_multiple_output=["a", "b", "c"]
+        )
+        self.launcher = AsyncProcessorLauncher(self.factory, None)
+        self.launcher.set_context(ProcessorContextMock(""))
+
+        self.events = []
+        self.launcher.add_observer(self)
+
+    def notify(self, event, data):
+        self.events.append((event, data))
+
+    def get_events(self, event_type):
+        return [data for event, data in self.events if event == event_type]
+
+    def run_flow(self, flow):
+        processors = self.launcher.load_processors(flow)
+        self.launcher.launch_processors(processors)
+        return processors
+
+    def test_map_node_runs_once_per_item_and_collects_a_list(self):
+        processors = self.run_flow(
+            [
+                create_node_config("splitter", processor_type="ai-data-splitter"),
+                create_node_config(
+                    "map",
+                    ["splitter"],
+                    processor_type="transition",
+                    executionMode="map",
+                ),
+            ]
+        )
+
+        self.assertEqual(processors["map"].get_output(), ["a", "b", "c"])
+        item_events = self.get_events("map_item_progress")
+        self.assertCountEqual([data.item_index for data in item_events], [0, 1, 2])
+        self.assertTrue(all(data.item_count == 3 for data in item_events))
+        self.assertEqual(self.get_events("progress")[-1].output, ["a", "b", "c"])
+
+    def test_map_over_an_empty_list_outputs_an_empty_list(self):
+        self.factory.fake_multiple_output = []
+        processors = self.run_flow(
+            [
+                create_node_config("splitter", processor_type="ai-data-splitter"),
+                create_node_config(
+                    "map",
+                    ["splitter"],
+                    processor_type="transition",
+                    executionMode="map",
+                ),
+            ]
+        )
+
+        self.assertEqual(processors["map"].get_output(), [])
+        self.assertIsNone(processors["map"].get_output(0))
+        self.assertEqual(self.get_events("progress")[-1].output, [])
+        self.assertEqual(self.get_events("map_item_progress"), [])
+
+    def test_empty_list_output_is_no_output_outside_of_map_mode(self):
+        processor = DisplayProcessor({"name": "display", "processorType": "display"})
+        processor.set_output([])
+
+        self.assertIsNone(processor.get_output())
+        self.assertEqual(
+            self.launcher.get_processors_to_run({"display": processor}),
+            {"display": processor},
+        )
+
+    def test_map_items_run_concurrently_up_to_the_cap(self):
+        self.factory.fake_multiple_output = [str(i) for i in range(6)]
+        flow = [
+            create_node_config("splitter", processor_type="ai-data-splitter"),
+            create_node_config(
+                "map",
+                ["splitter"],
+                executionMode="map",
+                mapConcurrency=3,
+                sleepDuration=0.2,
+            ),
+        ]
+
+        start_time = time.time()
+        processors = self.run_flow(flow)
+        duration = time.time() - start_time
+
+        self.assertEqual(len(processors["map"].get_output()), 6)
+        self.assertGreaterEqual(duration, 0.4)
+        self.assertLess(duration, 0.8)
+
+    def test_fail_policy_fails_the_node(self):
+        self.run_flow(
+            [
+                create_node_config("splitter", processor_type="ai-data-splitter"),
+                create_node_config(
+                    "map", ["splitter"], executionMode="map", raiseError=True
+                ),
+                create_node_config("child", ["map"]),
+            ]
+        )
+
+        self.assertEqual(
+            [data.instance_name for data in self.get_events("error")], ["map"]
+        )
+        self.assertNotIn("child", [data.instance_name for _, data in self.events])
+
+    def test_skip_and_null_policies_keep_the_node_running(self):
+        processors = self.run_flow(
+            [
+                create_node_config("splitter", processor_type="ai-data-splitter"),
+                create_node_config(
+                    "skip",
+                    ["splitter"],
+                    executionMode="map",
+                    mapErrorPolicy="skip",
+                    raiseError=True,
+                ),
+                create_node_config(
+                    "null",
+                    ["splitter"],
+                    executionMode="map",
+                    mapErrorPolicy="null",
+                    raiseError=True,
+                ),
+            ]
+        )
+
+        self.assertEqual(self.get_events("error"), [])
+        self.assertFalse(processors["skip"].get_output())
+        self.assertEqual(processors["null"].get_output(), [None, None, None])
+        failed_items = [
+            data for data in self.get_events("map_item_progress") if data.error
+        ]
+        self.assertEqual(len(failed_items), 6)
+
+
+if __name__ == "__main__":
+    unittest.main()
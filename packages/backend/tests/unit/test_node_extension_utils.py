@@ -0,0 +1,52 @@
+import unittest
+from unittest.mock import patch
+
+from app.processors.components.extension.gpt_image_processor import (
+    GPTImageProcessor,
+)
+from app.utils import node_extension_utils
+from app.utils.node_extension_utils import (
+    get_dynamic_extension_class,
+    get_dynamic_extension_config,
+)
+
+
+class TestDynamicExtension(unittest.TestCase):
+    def setUp(self):
+        node_extension_utils._load_dynamic_extension.cache.clear()
+
+    def test_dynamic_extension_class_is_found_by_processor_type(self):
+        self.assertIs(
+            get_dynamic_extension_class("gpt-image-processor"), GPTImageProcessor
+        )
+        self.assertIsNone(get_dynamic_extension_class("llm-prompt"))
+        self.assertIsNone(get_dynamic_extension_class("unknown-processor"))
+
+    def test_config_is_memoized_by_processor_type_and_data(self):
+        with patch.object(
+            GPTImageProcessor,
+            "get_dynamic_node_config",
+            autospec=True,
+            side_effect=lambda self, data: data["method"],
+        ) as get_dynamic_node_config:
+            first = get_dynamic_extension_config(
+                "gpt-image-processor", {"method": "edit", "extra": 1}
+            )
+            second = get_dynamic_extension_config(
+                "gpt-image-processor", {"extra": 1, "method": "edit"}
+            )
+            other = get_dynamic_extension_config(
+                "gpt-image-processor", {"method": "generate"}
+            )
+
+        self.assertEqual((first, second, other), ("edit", "edit", "generate"))
+        self.assertEqual(get_dynamic_node_config.call_count, 2)
+
+    def test_config_of_the_dynamic_extension_is_built(self):
+        config = get_dynamic_extension_config("gpt-image-processor", {"method": "edit"})
+
+        self.assertEqual(config.processorType, "gpt-image-processor")
+
+
+if __name__ == "__main__":
+    unittest.main()
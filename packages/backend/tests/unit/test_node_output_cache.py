@@ -0,0 +1,129 @@
+import os
+import tempfile
+import time
+import unittest
+
+from app.processors.cache.disk_node_output_cache import DiskNodeOutputCache
+from app.processors.cache.memory_node_output_cache import InMemoryNodeOutputCache
+from app.processors.cache.node_output_cache import compute_cache_key
+from app.processors.components.core.input_processor import InputProcessor
+from app.processors.launcher.async_processor_launcher import AsyncProcessorLauncher
+from tests.utils.processor_context_mock import ProcessorContextMock
+from tests.utils.processor_factory_mock import ProcessorFactoryMock
+
+
+class TestNodeOutputCacheBackends(unittest.TestCase):
+    def test_memory_cache_evicts_least_recently_used(self):
+        cache = InMemoryNodeOutputCache(max_size=2)
+        cache.set("a", ["output a"])
+        cache.set("b", ["output b"])
+        cache.get("a")
+        cache.set("c", ["output c"])
+
+        self.assertEqual(cache.get("a"), ["output a"])
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("c"), ["output c"])
+
+    def test_memory_cache_expires_entries(self):
+        cache = InMemoryNodeOutputCache(max_size=2, ttl=0.01)
+        cache.set("key", ["output"])
+        time.sleep(0.02)
+
+        self.assertIsNone(cache.get("key"))
+
+    def test_disk_cache_returns_stored_output(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cache = DiskNodeOutputCache(cache_dir=cache_dir, ttl=60)
+            cache.set("key", ["output"])
+
+            self.assertEqual(cache.get("key"), ["output"])
+            self.assertIsNone(cache.get("unknown"))
+
+    def test_disk_cache_expires_entries(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cache = DiskNodeOutputCache(cache_dir=cache_dir, ttl=0)
+            cache.set("key", ["output"])
+            time.sleep(0.01)
+
+            self.assertIsNone(cache.get("key"))
+            self.assertEqual(os.listdir(cache_dir), [])
+
+    def test_cache_key_depends_on_resolved_inputs(self):
+        def create_processor(input_text):
+            input_processor = InputProcessor(
+                {"name": "input", "processorType": "input-text", "inputText": ""}
+            )
+            input_processor.set_output(input_text)
+            processor = InputProcessor(
+                {
+                    "name": "node",
+                    "processorType": "input-text",
+                    "x": 10,
+                    "inputText": "",
+                    "inputs": [{"inputNode": "input", "inputName": "inputText"}],
+                }
+            )
+            processor.add_input_processor(input_processor)
+            return processor
+
+        self.assertEqual(
+            compute_cache_key(create_processor("a")),
+            compute_cache_key(create_processor("a")),
+        )
+        self.assertNotEqual(
+            compute_cache_key(create_processor("a")),
+            compute_cache_key(create_processor("b")),
+        )
+
+
+class TestLauncherWithNodeOutputCache(unittest.TestCase):
+    def setUp(self):
+        self.factory = ProcessorFactoryMock(fake_text_output="Lorem Ipsum")
+        self.cache = InMemoryNodeOutputCache(max_size=10)
+        self.events = []
+
+    def notify(self, event, data):
+        if event == "progress":
+            self.events.append((data.instance_name, data.cache_status))
+
+    def run_flow(self, flow, user_id=0):
+        launcher = AsyncProcessorLauncher(self.factory, None, output_cache=self.cache)
+        launcher.set_context(ProcessorContextMock("000000000", user_id=user_id))
+        launcher.add_observer(self)
+        launcher.launch_processors(launcher.load_processors(flow))
+
+    def test_second_run_reuses_cacheable_outputs(self):
+        flow = [
+            {"name": "scrape", "processorType": "llm-prompt", "cacheable": True},
+            {
+                "name": "llm",
+                "processorType": "llm-prompt",
+                "inputs": [{"inputNode": "scrape"}],
+            },
+        ]
+
+        self.run_flow(flow)
+        self.events.clear()
+        self.run_flow(flow)
+
+        self.assertEqual(self.events, [("scrape", "hit"), ("llm", None)])
+
+    def test_outputs_are_not_shared_between_users(self):
+        flow = [{"name": "scrape", "processorType": "llm-prompt", "cacheable": True}]
+
+        self.run_flow(flow, user_id=1)
+        self.events.clear()
+        self.run_flow(flow, user_id=2)
+
+        self.assertEqual(self.events, [("scrape", "miss")])
+
+    def test_first_run_reports_miss(self):
+        flow = [{"name": "scrape", "processorType": "llm-prompt", "cacheable": True}]
+
+        self.run_flow(flow)
+
+        self.assertEqual(self.events, [("scrape", "miss")])
+
+
+if __name__ == "__main__":
+    unittest.main()
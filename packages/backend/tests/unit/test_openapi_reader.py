@@ -0,0 +1,98 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from app.processors.components.extension.stabilityai_generic_processor import (
+    StabilityAIGenericProcessor,
+)
+from app.utils.openapi_reader import (
+    OpenAPIOperationIndex,
+    OpenAPIReader,
+    get_file_hash,
+)
+
+SPEC_PATH = "./resources/openapi/stabilityai.json"
+VIDEO_PATH = "/v2beta/image-to-video"
+
+
+class TestOpenAPIOperationIndex(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.reader = OpenAPIReader(SPEC_PATH)
+        cls.index = cls.reader.build_operation_index(polling_path_marker="/result/")
+
+    def test_index_holds_the_resolved_operation(self):
+        operation = self.index.get_operation(VIDEO_PATH, "POST")
+
+        self.assertEqual(
+            operation.request_schema,
+            self.reader.get_request_schema_for_path(VIDEO_PATH, "post"),
+        )
+        self.assertEqual(
+            list(operation.response_content_types),
+            self.reader.get_response_content_type(VIDEO_PATH, "post"),
+        )
+        self.assertEqual(operation.polling_path, f"{VIDEO_PATH}/result/{{id}}")
+        self.assertIsNone(self.index.get_operation(VIDEO_PATH, "delete"))
+
+    def test_saved_index_is_loaded_for_the_same_spec_only(self):
+        with tempfile.TemporaryDirectory() as index_dir:
+            index_path = os.path.join(index_dir, "index.json")
+            self.index.save(index_path)
+
+            loaded_index = OpenAPIOperationIndex.load(index_path, self.index.spec_hash)
+            self.assertEqual(loaded_index.to_dict(), self.index.to_dict())
+            self.assertIsNone(OpenAPIOperationIndex.load(index_path, "other-spec"))
+
+    def test_load_operation_index_does_not_parse_the_spec_twice(self):
+        with tempfile.TemporaryDirectory() as index_dir:
+            index_path = os.path.join(index_dir, "index.json")
+            with patch.object(
+                OpenAPIReader,
+                "build_operation_index",
+                autospec=True,
+                side_effect=OpenAPIReader.build_operation_index,
+            ) as build_operation_index:
+                first_index = OpenAPIReader.load_operation_index(
+                    SPEC_PATH, index_path, "/result/"
+                )
+                second_index = OpenAPIReader.load_operation_index(
+                    SPEC_PATH, index_path, "/result/"
+                )
+
+            build_operation_index.assert_called_once()
+            self.assertEqual(first_index.to_dict(), second_index.to_dict())
+
+    def test_committed_index_matches_the_spec(self):
+        index = OpenAPIOperationIndex.load(
+            "./resources/openapi/stabilityai.index.json", get_file_hash(SPEC_PATH)
+        )
+        self.assertIsNotNone(index)
+
+
+class TestStabilityAIGenericProcessor(unittest.TestCase):
+    def create_processor(self, path):
+        config = {
+            "name": "stabilityai",
+            "processorType": StabilityAIGenericProcessor.processor_type,
+            "path": path,
+            "inputs": [],
+        }
+        return StabilityAIGenericProcessor(config, None)
+
+    def test_nodes_of_the_same_path_share_the_node_config(self):
+        first = self.create_processor(VIDEO_PATH)
+        second = self.create_processor(VIDEO_PATH)
+
+        self.assertIs(first.final_node_config, second.final_node_config)
+        self.assertEqual(first.pooling_path, f"{VIDEO_PATH}/result/{{id}}")
+        self.assertEqual(first.response_content_type, "video/mp4")
+
+    def test_unknown_path_raises_a_clear_error(self):
+        with self.assertRaises(ValueError):
+            self.create_processor("/v2beta/unknown")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,4 +1,13 @@
+import inspect
+import json
+import os
+import subprocess
+import sys
+import tempfile
 import unittest
+from unittest.mock import patch
+
+from app.processors.factory import processor_registry
 from app.processors.factory.processor_factory_iter_modules import (
     ProcessorFactoryIterModules,
 )
@@ -58,3 +67,121 @@ class TestProcessorFactory(unittest.TestCase):
         self.assertIsInstance(processor, APIDummyProcessor)
         self.assertIsInstance(processor, ContextAwareProcessor)
         self.assertEqual(processor._processor_context, "api_data")
+
+    def test_load_processors_registers_the_classes_once(self):
+        with patch(
+            "app.processors.factory.processor_factory_iter_modules.load_processor_classes",
+            return_value={DummyProcessor.processor_type: DummyProcessor},
+        ) as load_processor_classes:
+            self.factory.load_processors()
+            self.factory.load_processors()
+
+        load_processor_classes.assert_called_once()
+        processor = self.factory.create_processor(
+            {"processorType": "dummy_processor", "name": "dummy_processor"}
+        )
+        self.assertIsInstance(processor, DummyProcessor)
+
+    def test_constructor_signature_is_inspected_once_per_class(self):
+        with patch(
+            "app.processors.factory.processor_factory_iter_modules.inspect.signature",
+            wraps=inspect.signature,
+        ) as signature:
+            self.factory.register_processor(
+                APIDummyProcessor.processor_type, APIDummyProcessor
+            )
+            processors = [
+                self.factory.create_processor(
+                    {"processorType": "api_dummy_processor", "name": f"node-{i}"},
+                    context_data="api_data",
+                )
+                for i in range(3)
+            ]
+
+        signature.assert_called_once()
+        for processor in processors:
+            self.assertEqual(processor._processor_context, "api_data")
+
+    def test_lazy_processor_class_is_resolved_on_creation(self):
+        lazy_class = processor_registry.LazyProcessorClass(
+            DummyProcessor.processor_type,
+            f"{__name__}:DummyProcessor",
+        )
+        self.factory.register_processor(DummyProcessor.processor_type, lazy_class)
+        self.assertFalse(lazy_class.is_resolved())
+
+        processor = self.factory.create_processor(
+            {"processorType": "dummy_processor", "name": "dummy_processor"}
+        )
+
+        self.assertIsInstance(processor, DummyProcessor)
+        self.assertTrue(lazy_class.is_resolved())
+
+
+class TestProcessorRegistry(unittest.TestCase):
+    def test_processor_classes_are_discovered_once_per_process(self):
+        processor_registry.clear_registry_cache()
+        with patch.object(
+            processor_registry,
+            "discover_processor_classes",
+            wraps=processor_registry.discover_processor_classes,
+        ) as discover_processor_classes:
+            first_classes = processor_registry.get_processor_classes()
+            second_classes = processor_registry.get_processor_classes()
+
+        top_level_calls = [
+            call
+            for call in discover_processor_classes.call_args_list
+            if call.args in ((), (processor_registry.COMPONENTS_PACKAGE,))
+        ]
+        self.assertEqual(len(top_level_calls), 1)
+        self.assertIs(first_classes, second_classes)
+        self.assertIn("llm-prompt", first_classes)
+
+    def test_manifest_loads_the_same_classes_as_the_discovery(self):
+        with tempfile.TemporaryDirectory() as manifest_dir:
+            manifest_path = os.path.join(manifest_dir, "manifest.json")
+            manifest = processor_registry.write_manifest(manifest_path)
+
+            with open(manifest_path) as file:
+                self.assertEqual(json.load(file), manifest)
+            self.assertEqual(
+                processor_registry.load_processor_classes(manifest_path),
+                processor_registry.get_processor_classes(),
+            )
+
+    def test_missing_manifest_falls_back_to_the_discovery(self):
+        self.assertIs(
+            processor_registry.load_processor_classes("/unknown/manifest.json"),
+            processor_registry.get_processor_classes(),
+        )
+
+    def test_committed_manifest_is_up_to_date(self):
+        self.assertEqual(
+            processor_registry.load_manifest(),
+            processor_registry.generate_manifest(),
+            "Regenerate it with: python -m app.processors.factory.processor_registry",
+        )
+
+    def test_lazy_loading_does_not_import_the_processor_modules(self):
+        module_name = "app.processors.components.extension.claude_anthropic_processor"
+        code = (
+            "import sys\n"
+            "from app.processors.factory.processor_factory_iter_modules import "
+            "ProcessorFactoryIterModules\n"
+            "factory = ProcessorFactoryIterModules()\n"
+            "factory.load_processors()\n"
+            f"print('{module_name}' in sys.modules)\n"
+            "factory.create_processor({'processorType': 'claude-anthropic-processor', "
+            "'name': 'claude', 'inputs': []})\n"
+            f"print('{module_name}' in sys.modules)\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            env={**os.environ, "LAZY_PROCESSOR_LOADING": "true"},
+        )
+
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertEqual(result.stdout.split(), ["False", "True"])
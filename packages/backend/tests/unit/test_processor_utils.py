@@ -0,0 +1,128 @@
+import io
+import os
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+from app.utils.processor_utils import (
+    FileTooLargeError,
+    SPOOLED_FILE_MAX_MEMORY_SIZE,
+    stream_download_file,
+)
+
+MB = 1024 * 1024
+
+
+class FileHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    body = b""
+    send_length = True
+    received = []
+
+    def do_GET(self):
+        FileHandler.received.append(self.command)
+        if self.path == "/missing":
+            self.send_response(404)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/octet-stream")
+        if FileHandler.send_length:
+            self.send_header("Content-Length", str(len(FileHandler.body)))
+            self.end_headers()
+            self.wfile.write(FileHandler.body)
+            return
+
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        chunk_size = 256 * 1024
+        body = FileHandler.body
+        try:
+            for start in range(0, len(body), chunk_size):
+                chunk = body[start : start + chunk_size]
+                self.wfile.write(f"{len(chunk):x}\r\n".encode() + chunk + b"\r\n")
+            self.wfile.write(b"0\r\n\r\n")
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+    def do_HEAD(self):
+        FileHandler.received.append(self.command)
+        self.send_response(405)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestStreamDownloadFile(unittest.TestCase):
+    def setUp(self):
+        FileHandler.body = b""
+        FileHandler.send_length = True
+        FileHandler.received = []
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), FileHandler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+        self.url = f"http://127.0.0.1:{self.server.server_port}/file.bin"
+
+        env_patcher = patch.dict(os.environ, {"MAX_TMP_FILE_SIZE_MB": "1"})
+        env_patcher.start()
+        self.addCleanup(env_patcher.stop)
+
+    def test_file_is_downloaded_with_a_single_get(self):
+        FileHandler.body = os.urandom(64 * 1024)
+
+        with stream_download_file(self.url) as file:
+            self.assertEqual(file.read(), FileHandler.body)
+
+        self.assertEqual(FileHandler.received, ["GET"])
+
+    def test_large_file_is_spooled_to_disk(self):
+        FileHandler.body = os.urandom(SPOOLED_FILE_MAX_MEMORY_SIZE + 1)
+
+        with patch.dict(os.environ, {"MAX_TMP_FILE_SIZE_MB": "100"}):
+            with stream_download_file(self.url) as file:
+                self.assertTrue(file._rolled)
+                self.assertEqual(file.read(), FileHandler.body)
+
+    def test_body_is_written_to_the_given_sink(self):
+        FileHandler.body = b"content"
+        sink = io.BytesIO()
+
+        file = stream_download_file(self.url, sink=sink)
+
+        self.assertIs(file, sink)
+        self.assertEqual(file.tell(), 0)
+        self.assertEqual(sink.getvalue(), b"content")
+
+    def test_content_length_above_max_size_is_rejected(self):
+        FileHandler.body = b"x" * (MB + 1)
+
+        with self.assertRaises(FileTooLargeError):
+            stream_download_file(self.url)
+
+        self.assertEqual(FileHandler.received, ["GET"])
+
+    def test_max_size_is_enforced_without_content_length(self):
+        FileHandler.body = b"x" * (2 * MB)
+        FileHandler.send_length = False
+        sink = io.BytesIO()
+
+        with self.assertRaises(FileTooLargeError):
+            stream_download_file(self.url, sink=sink)
+
+        self.assertLessEqual(len(sink.getvalue()), MB)
+
+    def test_error_status_is_reported(self):
+        with self.assertRaises(ValueError) as context:
+            stream_download_file(f"http://127.0.0.1:{self.server.server_port}/missing")
+
+        self.assertIn("404", str(context.exception))
+
+
+if __name__ == "__main__":
+    unittest.main()
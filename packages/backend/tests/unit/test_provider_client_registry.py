@@ -0,0 +1,109 @@
+import unittest
+from unittest.mock import MagicMock, patch
+
+import httpx
+
+from app.utils.provider_client_registry import ProviderClientRegistry
+
+
+def create_fake_client(http_options):
+    return MagicMock()
+
+
+class KeepAliveTransport(httpx.MockTransport):
+    """
+    Answers without any socket, which an earlier test may have monkey patched with
+    eventlet. Reports a TCP connection on the first request only, through the trace
+    extension, as the connection pool of httpcore does for a kept-alive connection.
+    """
+
+    def __init__(self):
+        self.is_connected = False
+        super().__init__(self.handle)
+
+    def handle(self, request):
+        if not self.is_connected:
+            self.is_connected = True
+            trace = request.extensions.get("trace")
+            if trace is not None:
+                trace("connection.connect_tcp.complete", {})
+        return httpx.Response(200, text="OK")
+
+
+class TestProviderClientRegistry(unittest.TestCase):
+    def setUp(self):
+        self.registry = ProviderClientRegistry(
+            max_idle_time=60, max_clients=2, max_connections=4
+        )
+
+    def test_client_is_shared_per_provider_key_and_base_url(self):
+        client = self.registry.get_client("openai", "key", None, create_fake_client)
+
+        self.assertIs(
+            self.registry.get_client("openai", "key", None, create_fake_client), client
+        )
+        self.assertIsNot(
+            self.registry.get_client("openai", "other", None, create_fake_client),
+            client,
+        )
+        self.assertIsNot(
+            self.registry.get_client(
+                "openai", "key", "https://api.deepseek.com", create_fake_client
+            ),
+            client,
+        )
+        metrics = self.registry.get_metrics()
+        self.assertEqual(metrics["created_clients"], 3)
+        self.assertEqual(metrics["reused_clients"], 1)
+
+    def test_api_key_is_not_kept_in_the_registry_keys(self):
+        key = ProviderClientRegistry.get_client_key("openai", "secret-key", None)
+        self.assertNotIn("secret-key", key)
+
+    def test_idle_clients_are_evicted(self):
+        with patch("app.utils.provider_client_registry.time.monotonic") as monotonic:
+            monotonic.return_value = 0
+            client = self.registry.get_client("openai", "key", None, create_fake_client)
+            monotonic.return_value = 61
+            new_client = self.registry.get_client(
+                "openai", "key", None, create_fake_client
+            )
+
+        self.assertIsNot(new_client, client)
+        self.assertEqual(self.registry.get_metrics()["evicted_clients"], 1)
+
+    def test_least_recently_used_clients_are_evicted_above_the_limit(self):
+        first = self.registry.get_client("openai", "first", None, create_fake_client)
+        self.registry.get_client("openai", "second", None, create_fake_client)
+        self.registry.get_client("openai", "first", None, create_fake_client)
+        self.registry.get_client("openai", "third", None, create_fake_client)
+
+        self.assertEqual(self.registry.get_client_count(), 2)
+        self.assertIs(
+            self.registry.get_client("openai", "first", None, create_fake_client),
+            first,
+        )
+        self.assertEqual(self.registry.get_metrics()["evicted_clients"], 1)
+
+    def test_connection_reuse_is_measured(self):
+        client = self.registry.get_client(
+            "test",
+            "key",
+            None,
+            lambda http_options: httpx.Client(
+                transport=KeepAliveTransport(),
+                event_hooks=http_options["event_hooks"],
+            ),
+        )
+        self.addCleanup(client.close)
+        for _ in range(4):
+            client.get("http://provider.test/")
+
+        metrics = self.registry.get_metrics()
+        self.assertEqual(metrics["requests"], 4)
+        self.assertEqual(metrics["connections_opened"], 1)
+        self.assertEqual(metrics["connection_reuse_rate"], 0.75)
+
+
+if __name__ == "__main__":
+    unittest.main()
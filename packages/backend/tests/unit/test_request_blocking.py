@@ -0,0 +1,102 @@
+import unittest
+
+from app.utils.web_scrapping.request_blocking import (
+    RequestBlocker,
+    is_blocked_host,
+    wait_for_content,
+)
+
+
+class FakeRequest:
+    def __init__(self, resource_type, url):
+        self.resource_type = resource_type
+        self.url = url
+
+
+class FakeRoute:
+    def __init__(self, resource_type, url):
+        self.request = FakeRequest(resource_type, url)
+        self.outcome = None
+
+    async def abort(self):
+        self.outcome = "aborted"
+
+    async def continue_(self):
+        self.outcome = "continued"
+
+
+class FakePage:
+    def __init__(self):
+        self.waits = []
+
+    async def wait_for_selector(self, selector, **kwargs):
+        self.waits.append(("selector", selector))
+
+    async def wait_for_load_state(self, state, **kwargs):
+        self.waits.append(("load_state", state))
+
+
+class TestRequestBlocker(unittest.IsolatedAsyncioTestCase):
+    def test_no_blocker_without_fast_mode_nor_ad_blocker(self):
+        self.assertIsNone(RequestBlocker.create())
+
+    def test_blocked_hosts_include_their_subdomains(self):
+        blocked_hosts = {"doubleclick.net"}
+
+        self.assertTrue(is_blocked_host("doubleclick.net", blocked_hosts))
+        self.assertTrue(is_blocked_host("stats.g.doubleclick.net", blocked_hosts))
+        self.assertFalse(is_blocked_host("notdoubleclick.net", blocked_hosts))
+        self.assertFalse(is_blocked_host("net", blocked_hosts))
+
+    def test_ad_blocker_only_blocks_the_ad_hosts(self):
+        blocker = RequestBlocker.create(enable_ad_blocker=True)
+
+        self.assertTrue(
+            blocker.should_block("script", "https://www.googletagmanager.com/gtm.js")
+        )
+        self.assertFalse(blocker.should_block("image", "https://example.com/a.png"))
+
+    async def test_fast_mode_aborts_the_heavy_resources(self):
+        blocker = RequestBlocker.create(fast_mode=True)
+        routes = [
+            FakeRoute("document", "https://example.com/"),
+            FakeRoute("image", "https://example.com/a.png"),
+            FakeRoute("font", "https://example.com/a.woff2"),
+            FakeRoute("script", "https://example.com/app.js"),
+        ]
+
+        for route in routes:
+            await blocker.handle_route(route)
+
+        self.assertEqual(
+            [route.outcome for route in routes],
+            ["continued", "aborted", "aborted", "continued"],
+        )
+        self.assertEqual(blocker.blocked_requests, 2)
+
+
+class TestWaitForContent(unittest.IsolatedAsyncioTestCase):
+    async def test_selectors_are_waited_for_instead_of_the_network(self):
+        page = FakePage()
+
+        await wait_for_content(page, selectors=["article", ".content"])
+
+        self.assertEqual(page.waits, [("selector", "article, .content")])
+
+    async def test_fast_mode_waits_for_the_load_event(self):
+        page = FakePage()
+
+        await wait_for_content(page, fast_mode=True)
+
+        self.assertEqual(page.waits, [("load_state", "load")])
+
+    async def test_default_waits_for_the_network_idle(self):
+        page = FakePage()
+
+        await wait_for_content(page)
+
+        self.assertEqual(page.waits, [("load_state", "networkidle")])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,102 @@
+import time
+import unittest
+
+import eventlet
+
+from app.processors.cache.flow_run_store import FlowRunStore
+from app.processors.launcher.async_processor_launcher import AsyncProcessorLauncher
+from app.processors.launcher.run_registry import RunCancelledError, RunRegistry
+from app.root_injector import get_root_injector, refresh_root_injector
+from tests.utils.processor_context_mock import ProcessorContextMock
+from tests.utils.processor_factory_mock import ProcessorFactoryMock
+
+
+def create_node_config(name, parents=None, **kwargs):
+    config = {
+        "name": name,
+        "processorType": "llm-prompt",
+        "inputs": [{"inputNode": parent} for parent in (parents or [])],
+    }
+    config.update(kwargs)
+    return config
+
+
+class TestRunRegistry(unittest.TestCase):
+    def setUp(self):
+        self.registry = RunRegistry()
+
+    def create_launcher(self, session_id):
+        launcher = AsyncProcessorLauncher(
+            ProcessorFactoryMock(), None, run_registry=self.registry
+        )
+        launcher.set_context(ProcessorContextMock("", user_id=session_id))
+        return launcher
+
+    def start_slow_flow(self, launcher):
+        flow = [
+            create_node_config("slow-0", sleepDuration=5),
+            create_node_config("slow-1", sleepDuration=5),
+            create_node_config("child", ["slow-0", "slow-1"]),
+        ]
+        processors = launcher.load_processors(flow)
+        run = eventlet.spawn(launcher.launch_processors, processors)
+        eventlet.sleep(0.05)
+        return processors, run
+
+    def test_cancel_session_stops_its_running_flows(self):
+        launcher = self.create_launcher(session_id=1)
+        processors, run = self.start_slow_flow(launcher)
+        self.assertEqual(self.registry.get_running_count(1), 1)
+
+        start_time = time.time()
+        self.assertEqual(self.registry.cancel_session(1), 1)
+        with self.assertRaises(RunCancelledError):
+            run.wait()
+        eventlet.sleep(0)
+
+        self.assertLess(time.time() - start_time, 0.2)
+        processors["slow-0"].cancel.assert_called_once()
+        processors["slow-1"].cancel.assert_called_once()
+        self.assertEqual(self.registry.get_running_count(1), 0)
+        self.assertEqual(
+            self.registry.get_metrics(),
+            {
+                "cancelled_runs": 1,
+                "cancelled_running_nodes": 2,
+                "skipped_pending_nodes": 1,
+            },
+        )
+
+    def test_cancel_session_does_not_touch_other_sessions(self):
+        launcher = self.create_launcher(session_id=1)
+        _, run = self.start_slow_flow(launcher)
+
+        self.assertEqual(self.registry.cancel_session(2), 0)
+        self.assertEqual(self.registry.get_running_count(1), 1)
+
+        self.registry.cancel_session(1)
+        with self.assertRaises(RunCancelledError):
+            run.wait()
+
+    def test_finished_run_is_unregistered(self):
+        launcher = self.create_launcher(session_id=1)
+        processors = launcher.load_processors([create_node_config("node")])
+        launcher.launch_processors(processors)
+
+        self.assertEqual(self.registry.get_running_count(1), 0)
+        self.assertFalse(launcher.cancel())
+
+    def test_registry_and_run_store_are_kept_when_the_injector_is_refreshed(self):
+        registry = get_root_injector().get(RunRegistry)
+        store = get_root_injector().get(FlowRunStore)
+        launcher = get_root_injector().get(AsyncProcessorLauncher)
+
+        refresh_root_injector()
+
+        self.assertIs(get_root_injector().get(RunRegistry), registry)
+        self.assertIs(get_root_injector().get(FlowRunStore), store)
+        self.assertIs(launcher.run_registry, registry)
+
+
+if __name__ == "__main__":
+    unittest.main()
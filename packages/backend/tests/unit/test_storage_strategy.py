@@ -0,0 +1,132 @@
+import io
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import eventlet
+
+from app.processors.components.core.replicate_processor import ReplicateProcessor
+from app.storage.local_storage_strategy import LocalStorageStrategy
+from app.storage.s3_storage_strategy import S3StorageStrategy
+
+MB = 1024 * 1024
+
+
+class FakeS3Client:
+    def __init__(self, fail_on_part=None):
+        self.fail_on_part = fail_on_part
+        self.put_objects = []
+        self.parts = []
+        self.completed = None
+        self.aborted = False
+
+    def put_object(self, Bucket, Key, Body):
+        self.put_objects.append(Body)
+
+    def create_multipart_upload(self, Bucket, Key):
+        return {"UploadId": "upload-id"}
+
+    def upload_part(self, Bucket, Key, UploadId, PartNumber, Body):
+        if PartNumber == self.fail_on_part:
+            raise ConnectionError("Part upload failed")
+        self.parts.append(Body)
+        return {"ETag": f"etag-{PartNumber}"}
+
+    def complete_multipart_upload(self, Bucket, Key, UploadId, MultipartUpload):
+        self.completed = MultipartUpload["Parts"]
+
+    def abort_multipart_upload(self, Bucket, Key, UploadId):
+        self.aborted = True
+
+    def generate_presigned_url(self, ClientMethod, Params, ExpiresIn):
+        return f"https://{Params['Bucket']}/{Params['Key']}"
+
+
+def create_s3_storage(s3_client):
+    storage = S3StorageStrategy.__new__(S3StorageStrategy)
+    storage.BUCKET_NAME = "bucket"
+    storage.s3_client = s3_client
+    return storage
+
+
+def generate_chunks(size, chunk_size=MB):
+    for start in range(0, size, chunk_size):
+        yield b"x" * min(chunk_size, size - start)
+
+
+class TestS3StorageStrategySaveStream(unittest.TestCase):
+    def test_small_source_is_sent_with_put_object(self):
+        s3_client = FakeS3Client()
+
+        url = create_s3_storage(s3_client).save_stream(
+            "file.bin", io.BytesIO(b"content"), part_size=5 * MB
+        )
+
+        self.assertEqual(url, "https://bucket/file.bin")
+        self.assertEqual(s3_client.put_objects, [b"content"])
+        self.assertEqual(s3_client.parts, [])
+
+    def test_large_source_is_uploaded_in_bounded_parts(self):
+        s3_client = FakeS3Client()
+
+        create_s3_storage(s3_client).save_stream(
+            "video.mp4", generate_chunks(12 * MB, chunk_size=3 * MB), part_size=5 * MB
+        )
+
+        self.assertEqual(
+            [len(part) for part in s3_client.parts], [5 * MB, 5 * MB, 2 * MB]
+        )
+        self.assertEqual(
+            [part["PartNumber"] for part in s3_client.completed], [1, 2, 3]
+        )
+        self.assertEqual(s3_client.put_objects, [])
+
+    def test_failed_part_aborts_the_upload(self):
+        s3_client = FakeS3Client(fail_on_part=2)
+
+        with self.assertRaises(ConnectionError):
+            create_s3_storage(s3_client).save_stream(
+                "video.mp4", generate_chunks(12 * MB), part_size=5 * MB
+            )
+
+        self.assertTrue(s3_client.aborted)
+        self.assertIsNone(s3_client.completed)
+
+
+class TestLocalStorageStrategySaveStream(unittest.TestCase):
+    def test_chunks_are_written_to_the_file(self):
+        with tempfile.TemporaryDirectory() as local_dir:
+            storage = LocalStorageStrategy()
+            with patch.object(LocalStorageStrategy, "LOCAL_DIR", local_dir):
+                storage.save_stream("file.bin", iter([b"a", b"b", b"c"]))
+
+            with open(os.path.join(local_dir, "file.bin"), "rb") as f:
+                self.assertEqual(f.read(), b"abc")
+
+
+class TestReplicateOutputsUpload(unittest.TestCase):
+    def test_outputs_are_uploaded_concurrently_in_order(self):
+        processor = ReplicateProcessor.__new__(ReplicateProcessor)
+        running = []
+        max_running = []
+
+        def upload(uri):
+            running.append(uri)
+            max_running.append(len(running))
+            eventlet.sleep(0.01)
+            running.remove(uri)
+            return f"s3://{uri}"
+
+        uris = [f"output-{i}" for i in range(6)]
+        with patch.dict(os.environ, {"STORAGE_UPLOAD_CONCURRENCY": "3"}), patch.object(
+            processor, "upload_replicate_uri_to_storage", side_effect=upload
+        ):
+            urls = processor.upload_replicate_uris_to_storage(uris)
+
+        self.assertEqual(urls, [f"s3://{uri}" for uri in uris])
+        self.assertEqual(max(max_running), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,234 @@
+import time
+import unittest
+
+import eventlet
+
+from app.processors.components.extension.replace_text_processor import (
+    ReplaceTextProcessor,
+)
+from app.processors.launcher.async_processor_launcher import AsyncProcessorLauncher
+from app.processors.launcher.event_type import EventType
+from app.processors.launcher.processor_event import ProcessorEvent
+from app.processors.launcher.stream_channel import StreamChannel, StreamForwarder
+from tests.utils.processor_context_mock import ProcessorContextMock
+from tests.utils.processor_factory_mock import ProcessorFactoryMock
+
+
+def create_channel(deltas, error=None):
+    channel = StreamChannel()
+    for delta in deltas:
+        channel.put(delta)
+    channel.close(error)
+    return channel
+
+
+class TestStreamChannel(unittest.TestCase):
+    def test_channel_yields_deltas_until_closed(self):
+        self.assertEqual(list(create_channel(["Hello", " world"])), ["Hello", " world"])
+
+    def test_channel_raises_the_producer_error(self):
+        with self.assertRaises(ValueError):
+            create_channel(["Hello"], ValueError("Producer failed")).read_all()
+
+    def test_forwarder_sends_deltas_of_the_accumulated_text(self):
+        channel = StreamChannel()
+        forwarder = StreamForwarder()
+        forwarder.add_channel(channel)
+
+        forwarder.forward("Hel")
+        forwarder.forward("Hello")
+        forwarder.forward("Hello")
+        forwarder.finish(["Hello world"])
+
+        self.assertEqual(list(channel), ["Hel", "lo", " world"])
+
+
+class TestReplaceTextStream(unittest.TestCase):
+    def replace(self, deltas, search_text, replacement_text, stream=True, **kwargs):
+        config = {
+            "name": "replace",
+            "processorType": "replace-text",
+            "input_text": "" if stream else "".join(deltas),
+            "search_text": search_text,
+            "replacement_text": replacement_text,
+            "replace_all": kwargs.get("replace_all", True),
+            "use_regex": kwargs.get("use_regex", False),
+            "case_sensitivity": kwargs.get("case_sensitivity", True),
+        }
+        processor = ReplaceTextProcessor(config)
+        if stream:
+            processor.set_input_stream("input_text", create_channel(deltas))
+        return processor.process()[0]
+
+    def get_outcome(self, *args, **kwargs):
+        try:
+            return self.replace(*args, **kwargs)
+        except Exception as e:
+            return type(e)
+
+    def test_streamed_and_whole_text_replacements_are_the_same(self):
+        deltas = ["The Ca", "t sat on the c", "at"]
+        for replacement_text in ["dog", r"d\no\g", r"\1", ""]:
+            for kwargs in [
+                {},
+                {"case_sensitivity": False},
+                {"replace_all": False},
+                {"use_regex": True},
+            ]:
+                with self.subTest(replacement_text=replacement_text, **kwargs):
+                    search_text = "(cat)" if kwargs.get("use_regex") else "cat"
+                    self.assertEqual(
+                        self.get_outcome(
+                            deltas, search_text, replacement_text, **kwargs
+                        ),
+                        self.get_outcome(
+                            deltas,
+                            search_text,
+                            replacement_text,
+                            stream=False,
+                            **kwargs,
+                        ),
+                    )
+
+    def test_only_case_insensitive_replacement_expands_the_escapes(self):
+        for stream in [True, False]:
+            with self.subTest(stream=stream):
+                self.assertEqual(
+                    self.replace(["a cat"], "cat", r"c\tt", stream=stream),
+                    r"a c\tt",
+                )
+                self.assertEqual(
+                    self.replace(
+                        ["a CAT"],
+                        "cat",
+                        r"c\tt",
+                        stream=stream,
+                        case_sensitivity=False,
+                    ),
+                    "a c\tt",
+                )
+
+    def test_match_split_across_chunks_is_replaced(self):
+        self.assertEqual(
+            self.replace(["The ca", "t sat on the c", "at"], "cat", "dog"),
+            "The dog sat on the dog",
+        )
+
+    def test_replace_first_and_case_insensitive(self):
+        self.assertEqual(
+            self.replace(
+                ["CAT c", "at"], "cat", "dog", replace_all=False, case_sensitivity=False
+            ),
+            "dog cat",
+        )
+
+    def test_regex_reads_the_whole_stream(self):
+        self.assertEqual(
+            self.replace(["a1", "2b3"], r"\d+", "#", use_regex=True), "a#b#"
+        )
+
+
+class TestStreamingEdge(unittest.TestCase):
+    def setUp(self):
+        self.launcher = AsyncProcessorLauncher(ProcessorFactoryMock(), None)
+        self.launcher.set_context(ProcessorContextMock(""))
+        self.streaming_events = []
+        self.launcher.add_observer(self)
+
+    def notify(self, event, data):
+        if event == EventType.STREAMING.value:
+            self.streaming_events.append((data.instance_name, data.output, time.time()))
+
+    def create_flow(self, streaming):
+        return [
+            {"name": "llm", "processorType": "llm-prompt", "inputs": []},
+            {
+                "name": "display",
+                "processorType": "display",
+                "inputs": [{"inputNode": "llm", "streaming": streaming}],
+            },
+        ]
+
+    def run_flow(self, flow, tokens=("Lorem", " ipsum", " dolor"), delay=0.1):
+        processors = self.launcher.load_processors(flow)
+        producer = processors["llm"]
+
+        def stream_answer():
+            text = ""
+            for token in tokens:
+                eventlet.sleep(delay)
+                text += token
+                self.launcher.notify(
+                    EventType.STREAMING, ProcessorEvent(producer, text)
+                )
+            self.producer_end_time = time.time()
+            producer.set_output(text)
+            return text
+
+        producer.process_and_update = stream_answer
+        self.launcher.launch_processors(processors)
+        return processors
+
+    def test_streaming_child_reads_the_text_while_it_is_produced(self):
+        processors = self.run_flow(self.create_flow(streaming=True))
+
+        display_events = [
+            event for event in self.streaming_events if event[0] == "display"
+        ]
+        self.assertEqual(processors["display"].get_output(), ["Lorem ipsum dolor"])
+        self.assertEqual(display_events[0][1], "Lorem")
+        self.assertLess(display_events[0][2], self.producer_end_time)
+
+    def test_regular_edge_waits_for_the_full_output(self):
+        processors = self.run_flow(self.create_flow(streaming=False))
+
+        self.assertEqual(processors["display"].get_output(), ["Lorem ipsum dolor"])
+        self.assertNotIn("display", [event[0] for event in self.streaming_events])
+
+    def test_child_also_waiting_for_a_descendant_of_the_producer_is_not_streamed(self):
+        flow = [
+            {"name": "llm", "processorType": "llm-prompt", "inputs": []},
+            {
+                "name": "summary",
+                "processorType": "display",
+                "inputs": [{"inputNode": "llm"}],
+            },
+            {
+                "name": "display",
+                "processorType": "display",
+                "inputs": [
+                    {"inputNode": "llm", "streaming": True},
+                    {"inputNode": "summary"},
+                ],
+            },
+        ]
+        tokens = [f"t{i} " for i in range(StreamChannel.DEFAULT_MAX_SIZE + 44)]
+
+        with eventlet.Timeout(10):
+            processors = self.run_flow(flow, tokens=tokens, delay=0)
+
+        self.assertEqual(processors["display"].get_output(), ["".join(tokens)])
+        self.assertNotIn("display", [event[0] for event in self.streaming_events])
+
+    def test_producer_does_not_wait_for_a_child_not_running_yet(self):
+        channel = StreamChannel(max_size=2)
+        for delta in ["a", "b", "c", "d"]:
+            channel.put(delta)
+        channel.close()
+
+        self.assertEqual(channel.read_all(), "abcd")
+
+    def test_producer_does_not_wait_for_a_child_done_reading(self):
+        channel = StreamChannel(max_size=1)
+        channel.put("a")
+        next(iter(channel))
+        channel.abandon()
+
+        with eventlet.Timeout(1):
+            for delta in ["b", "c", "d"]:
+                channel.put(delta)
+            channel.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
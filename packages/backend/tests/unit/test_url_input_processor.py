@@ -0,0 +1,71 @@
+import unittest
+from unittest.mock import patch
+
+from app.processors.components.core.url_input_processor import URLInputProcessor
+from app.utils.fetch_coordinator import FetchCoordinator
+
+PROCESSOR_MODULE = "app.processors.components.core.url_input_processor"
+BROWSER_TASK = (
+    "app.tasks.single_thread_tasks.browser.async_browser_task.run_browser_task"
+)
+
+
+class TestURLInputProcessorLoadingMode(unittest.TestCase):
+    def setUp(self):
+        coordinator_patch = patch(
+            f"{PROCESSOR_MODULE}.get_fetch_coordinator",
+            return_value=FetchCoordinator(max_per_host=1, cache_ttl=0),
+        )
+        coordinator_patch.start()
+        self.addCleanup(coordinator_patch.stop)
+
+    def create_processor(self, loading_mode="browser"):
+        return URLInputProcessor(
+            {
+                "name": "url",
+                "processorType": "url_input",
+                "url": "example.com",
+                "loading_mode": loading_mode,
+            }
+        )
+
+    def run_processor(self, processor, async_browser=True):
+        with patch(f"{PROCESSOR_MODULE}.use_async_browser", return_value=async_browser):
+            with patch.object(
+                processor, "fetch_and_extract_content", return_value="From GET"
+            ) as fetch_simple:
+                return processor.process(), fetch_simple
+
+    def test_browser_mode_scraps_the_page_in_the_browser(self):
+        processor = self.create_processor()
+        with patch(BROWSER_TASK, return_value="From browser") as run_browser_task:
+            output, fetch_simple = self.run_processor(processor)
+
+        self.assertEqual(output, "From browser")
+        self.assertEqual(
+            run_browser_task.call_args.args[0]["url"], "https://example.com"
+        )
+        fetch_simple.assert_not_called()
+
+    def test_browser_failure_falls_back_to_a_simple_get(self):
+        processor = self.create_processor()
+        with patch(BROWSER_TASK, side_effect=RuntimeError("Page crashed")):
+            output, _ = self.run_processor(processor)
+
+        self.assertEqual(output, "From GET")
+        self.assertEqual(processor.effective_load_mode, "simple")
+
+    def test_browser_is_not_used_unless_enabled(self):
+        for processor, async_browser in [
+            (self.create_processor(), False),
+            (self.create_processor(loading_mode="simple"), True),
+        ]:
+            with patch(BROWSER_TASK) as run_browser_task:
+                output, _ = self.run_processor(processor, async_browser)
+
+            self.assertEqual(output, "From GET")
+            run_browser_task.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -9,6 +9,7 @@ from app.processors.factory.processor_factory_iter_modules import (
     ProcessorFactoryIterModules,
 )
 
+from app.processors.components.processor import Processor
 from app.processors.components.core.processor_type_name_utils import (
     ProcessorType,
 )
@@ -51,6 +52,10 @@ class ProcessorFactoryMock(ProcessorFactoryIterModules):
         mock_processor.name = config.get("name", "default_processor_name")
         mock_processor.processor_type = processor_type
         mock_processor.input_processors = []
+        mock_processor._output = None
+        mock_processor.deadline = None
+        mock_processor.is_cancelled = False
+        mock_processor.accepts_input_stream = False
         mock_processor._processor_context = ProcessorContextMock("")
 
         if config.get("inputs") is not None and config.get("inputs") != []:
@@ -114,6 +119,35 @@ class ProcessorFactoryMock(ProcessorFactoryIterModules):
         def fake_get_input_by_name(input_name, default_value=""):
             return default_value
 
+        def fake_is_cacheable():
+            return config.get("cacheable", False)
+
+        def fake_get_cache_key_data():
+            return {
+                "processorType": processor_type,
+                "config": {
+                    key: value
+                    for key, value in config.items()
+                    if key not in Processor.NON_CACHE_KEY_CONFIG_FIELDS
+                },
+                "inputs": [
+                    input_processor.get_output()
+                    for input_processor in mock_processor.input_processors
+                ],
+            }
+
+        def fake_get_timeout():
+            return config.get("timeout")
+
+        def fake_set_output(output):
+            mock_processor._output = output if isinstance(output, list) else [output]
+
+        def fake_get_output(input_key=None):
+            output = mock_processor._output
+            if output is None or input_key is None:
+                return output
+            return output[input_key] if 0 <= input_key < len(output) else None
+
         mock_processor.process_and_update = (
             fake_process
             if config.get("raiseError", False) == False
@@ -123,6 +157,11 @@ class ProcessorFactoryMock(ProcessorFactoryIterModules):
         mock_processor.get_input_processors = get_input_processors
         mock_processor.has_dynamic_behavior = fake_has_dynamic_behavior
         mock_processor.get_input_by_name = fake_get_input_by_name
+        mock_processor.is_cacheable = fake_is_cacheable
+        mock_processor.get_cache_key_data = fake_get_cache_key_data
+        mock_processor.get_timeout = fake_get_timeout
+        mock_processor.set_output = fake_set_output
+        mock_processor.get_output = fake_get_output
 
         self._mock_processors[processor_type] = mock_processor
 
@@ -130,9 +169,7 @@ class ProcessorFactoryMock(ProcessorFactoryIterModules):
 
     def create_processor(self, config, context=None, storage_strategy=None):
         processor_type = config["processorType"]
-        processor_class = self._processors.get(processor_type)
-        if not processor_class:
-            raise ValueError(f"Processor type '{processor_type}' not supported")
+        processor_class = self.get_processor_class(processor_type)
 
         if (
             processor_type in ProcessorFactoryMock.NON_MOCKED_PROCESSORS
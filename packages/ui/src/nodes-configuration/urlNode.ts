@@ -37,6 +37,13 @@ export const urlNodeConfig: NodeConfig = {
       placeholder: "div .article #id",
       defaultValue: ["meta", "link", "script"],
     },
+    {
+      name: "max_staleness",
+      type: "numericfield",
+      label: "max_staleness",
+      defaultValue: 0,
+      min: 0,
+    },
   ],
   outputType: "text",
   defaultHideOutput: true,